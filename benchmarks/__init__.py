@@ -0,0 +1,5 @@
+"""
+Benchmarks for the skills refresh pipeline of the taxonomy connector.
+
+See ``benchmarks/README.rst`` for usage.
+"""
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic catalogs of courses, programs and XBlocks for the benchmarks.
+
+Catalogs are served by the metadata providers used in the tests and are generated lazily from a seed, so large
+catalogs do not need to fit in memory and every run sees the same products in the same order.
+"""
+
+import random
+from types import SimpleNamespace
+from uuid import UUID
+
+from faker.providers.lorem.en_US import Provider as LoremProvider
+
+from test_utils.providers import (
+    DiscoveryCourseMetadataProvider,
+    DiscoveryProgramMetadataProvider,
+    DiscoveryXBlockMetadataProvider,
+)
+
+WORDS = LoremProvider.word_list
+
+
+def _sentence(rng, word_count):
+    """
+    Return a sentence of random words.
+    """
+    return ' '.join(rng.choices(WORDS, k=word_count)).capitalize() + '.'
+
+
+def _uuid(rng):
+    """
+    Return a random UUID drawn from the given random number generator.
+    """
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def generate_courses(size, seed=0):
+    """
+    Yield `size` synthetic courses.
+    """
+    rng = random.Random(f'courses-{seed}')
+    for index in range(size):
+        yield SimpleNamespace(
+            uuid=_uuid(rng),
+            key=f'course-v1:Benchmark+C{index}+{seed}',
+            title=f'Benchmark Course {index}',
+            short_description=_sentence(rng, 10),
+            full_description=_sentence(rng, 80),
+        )
+
+
+def generate_programs(size, seed=0):
+    """
+    Yield `size` synthetic programs.
+    """
+    rng = random.Random(f'programs-{seed}')
+    for index in range(size):
+        yield SimpleNamespace(
+            uuid=_uuid(rng),
+            title=f'Benchmark Program {index}',
+            subtitle=_sentence(rng, 8),
+            overview=_sentence(rng, 80),
+        )
+
+
+def generate_xblocks(size, seed=0):
+    """
+    Yield `size` synthetic XBlocks.
+    """
+    rng = random.Random(f'xblocks-{seed}')
+    for index in range(size):
+        yield SimpleNamespace(
+            key=f'block-v1:Benchmark+X+{seed}+type@vertical+block@{index}',
+            content_type=rng.choice(('Video', 'Unit')),
+            content=_sentence(rng, 120),
+        )
+
+
+def generate_large_descriptions(size, min_bytes=100 * 1024, seed=0):
+    """
+    Yield `size` synthetic html descriptions of at least `min_bytes` utf-8 bytes, made of nested sections.
+    """
+    rng = random.Random(f'large-descriptions-{seed}')
+    for __ in range(size):
+        sections = []
+        description_size = 0
+        while description_size < min_bytes:
+            items = ''.join(f'<li>{_sentence(rng, 8)}</li>' for __ in range(rng.randint(2, 6)))
+            paragraphs = ' '.join(_sentence(rng, rng.randint(10, 30)) for __ in range(rng.randint(3, 8)))
+            section = f'<div><h3>{_sentence(rng, 4)}</h3><p><strong>{_sentence(rng, 6)}</strong> {paragraphs}</p>' \
+                      f'<ul>{items}</ul></div>'
+            sections.append(section)
+            description_size += len(section.encode('utf-8'))
+        yield f'<div>{"".join(sections)}</div>'
+
+
+def get_course_catalog(size, seed=0):
+    """
+    Return an iterator over a synthetic catalog of `size` courses, as returned by the course metadata provider.
+    """
+    return DiscoveryCourseMetadataProvider(generate_courses(size, seed)).get_all_courses()
+
+
+def get_program_catalog(size, seed=0):
+    """
+    Return an iterator over a synthetic catalog of `size` programs, as returned by the program metadata provider.
+    """
+    return DiscoveryProgramMetadataProvider(generate_programs(size, seed)).get_all_programs()
+
+
+def get_xblock_catalog(size, seed=0):
+    """
+    Return an iterator over a synthetic catalog of `size` XBlocks, as returned by the XBlock metadata provider.
+    """
+    return DiscoveryXBlockMetadataProvider(generate_xblocks(size, seed)).get_all_xblocks_in_course('benchmark')
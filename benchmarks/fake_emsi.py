@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Local fake of the EMSI service used by the benchmarks.
+
+Responses are deterministic: the skills extracted for a text and the jobs returned for a set of skills only depend
+on the request, so repeated benchmark runs do the same amount of work.
+"""
+
+import hashlib
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+
+SKILL_ID_FORMAT = 'BENCHSKILL{:06d}'
+JOB_ID_FORMAT = 'BENCHJOB{:06d}'
+
+
+def get_skill_id(index):
+    """
+    Return the external id of the fake skill at the given index of the skill pool.
+    """
+    return SKILL_ID_FORMAT.format(index)
+
+
+class FakeEMSIServer:
+    """
+    Threaded HTTP server answering the EMSI endpoints used by the taxonomy connector.
+
+    Supported endpoints:
+        POST /connect/token: access token.
+        POST /skills/versions/<version>/extract: skills of the posted text.
+        POST /jpa/rankings/<facet>/rankings/<nested_facet>: jobs ranked for the skills in the posted filter.
+    """
+
+    def __init__(self, latency=0, skills_per_text=10, skill_pool_size=2000, jobs_per_request=20):
+        """
+        Initialize the server.
+
+        Arguments:
+            latency (float): Number of seconds every response is delayed by, to simulate the network.
+            skills_per_text (int): Number of skills extracted from every text.
+            skill_pool_size (int): Number of distinct skills texts are mapped to.
+            jobs_per_request (int): Number of jobs returned by every job rankings request.
+        """
+        self.latency = latency
+        self.skills_per_text = skills_per_text
+        self.skill_pool_size = skill_pool_size
+        self.jobs_per_request = jobs_per_request
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """
+        Return the base URL of the running server.
+        """
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """
+        Start serving requests on a free local port in a background thread.
+        """
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._get_handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """
+        Stop the server.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def extract_skills(self, text):
+        """
+        Return the EMSI skills extraction response for the given text.
+        """
+        rng = random.Random(hashlib.sha256(text.encode('utf-8')).hexdigest())
+        indexes = rng.sample(range(self.skill_pool_size), min(self.skills_per_text, self.skill_pool_size))
+        return {
+            'data': [
+                {
+                    'confidence': round(rng.random(), 4),
+                    'skill': {
+                        'id': get_skill_id(index),
+                        'name': f'Benchmark Skill {index}',
+                        'infoUrl': f'https://skills.emsidata.com/skills/{get_skill_id(index)}',
+                        'type': {'id': 'ST1', 'name': 'Specialized Skill'},
+                        'tags': [{'key': 'wikipediaExtract', 'value': f'Description of benchmark skill {index}.'}],
+                    },
+                } for index in indexes
+            ]
+        }
+
+    def rank_jobs(self, query_filter):
+        """
+        Return the EMSI job rankings response for the skills included in the given query filter.
+        """
+        skill_ids = query_filter.get('filter', {}).get('skills', {}).get('include', [])
+        rng = random.Random(hashlib.sha256(json.dumps(skill_ids).encode('utf-8')).hexdigest())
+        nested_limit = query_filter.get('nested_rank', {}).get('limit', 10)
+        buckets = []
+        for __ in range(self.jobs_per_request):
+            job_skills = rng.sample(skill_ids, min(nested_limit, len(skill_ids)))
+            buckets.append({
+                'name': JOB_ID_FORMAT.format(rng.randrange(10 ** 6)),
+                'unique_postings': rng.randrange(1, 10000),
+                'ranking': {
+                    'buckets': [
+                        {
+                            'name': skill_id,
+                            'significance': round(rng.uniform(0, 100), 2),
+                            'unique_postings': rng.randrange(1, 10000),
+                        } for skill_id in job_skills
+                    ]
+                },
+            })
+        return {'data': {'ranking': {'buckets': buckets}}}
+
+    def _get_handler_class(self):
+        """
+        Return the request handler class bound to this server.
+        """
+        fake_server = self
+
+        class FakeEMSIRequestHandler(BaseHTTPRequestHandler):
+            """
+            Request handler dispatching the EMSI endpoints to the fake server.
+            """
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                """
+                Do not log the requests.
+                """
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                """
+                Answer a POST request.
+                """
+                with fake_server._lock:  # pylint: disable=protected-access
+                    fake_server.request_count += 1
+                if fake_server.latency:
+                    sleep(fake_server.latency)
+
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                if self.path == '/connect/token':
+                    self._send_json({'access_token': 'benchmark-token', 'expires_in': 3600})
+                elif self.path.endswith('/extract'):
+                    self._send_json(fake_server.extract_skills(json.loads(body)['text'] or ''))
+                elif self.path.startswith('/jpa/rankings/'):
+                    self._send_json(fake_server.rank_jobs(json.loads(body)))
+                else:
+                    self.send_error(404)
+
+            def _send_json(self, data):
+                """
+                Send the given data as a JSON response.
+                """
+                content = json.dumps(data).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        return FakeEMSIRequestHandler
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Measurements collected by the benchmarks.
+"""
+
+import resource
+import sys
+import threading
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter
+
+from django.db import connection
+
+from taxonomy import metrics
+
+
+def percentile(values, pct):
+    """
+    Return the nearest-rank percentile of the given values, `None` if there are no values.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def get_peak_rss_mb():
+    """
+    Return the peak resident set size of the current process in megabytes.
+    """
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # `ru_maxrss` is reported in bytes on macOS and in kilobytes elsewhere.
+    return max_rss / (1024 * 1024) if sys.platform == 'darwin' else max_rss / 1024
+
+
+class StageTimer:
+    """
+    Collect the latency of every call to the functions of each stage of the pipeline.
+    """
+
+    def __init__(self):
+        self._durations = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def wrap(self, stage, func):
+        """
+        Return a wrapper of `func` that records the duration of every call under `stage`.
+        """
+        @wraps(func)
+        def timed(*args, **kwargs):
+            started_at = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = perf_counter() - started_at
+                with self._lock:
+                    self._durations[stage].append(duration)
+        return timed
+
+    def summary(self):
+        """
+        Return the call count along with the p50 and p95 latency in milliseconds of every stage.
+        """
+        return {
+            stage: {
+                'count': len(durations),
+                'p50_ms': round(percentile(durations, 50) * 1000, 3),
+                'p95_ms': round(percentile(durations, 95) * 1000, 3),
+            } for stage, durations in sorted(self._durations.items())
+        }
+
+
+def summarize_external_calls(sink):
+    """
+    Return the call count, p50 and p95 latency in milliseconds, bytes and retries of every external service.
+
+    Arguments:
+        sink (InMemoryMetricsSink): Sink the metrics of the external calls were reported to.
+    """
+    summary = {}
+    for service in sink.get_tag_values(metrics.REQUESTS, 'service'):
+        latencies = sink.get_values(metrics.LATENCY, service=service)
+        summary[service] = {
+            'count': sink.get_count(metrics.REQUESTS, service=service),
+            'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+            'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+            'request_bytes': sum(sink.get_values(metrics.REQUEST_BYTES, service=service)),
+            'response_bytes': sum(sink.get_values(metrics.RESPONSE_BYTES, service=service)),
+            'retries': sink.get_count(metrics.RETRIES, service=service),
+        }
+    return summary
+
+
+class QueryCounter:
+    """
+    Count the database queries executed on the default connection of the current thread.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._wrapper = None
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        self._wrapper = connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        self._wrapper.__exit__(*args)
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Run a benchmark of the skills refresh pipeline against a synthetic catalog and a local fake EMSI server.
+
+Example usage:
+    $ # Benchmark refreshing the skills of 10k courses and compare with the stored baseline.
+    $ python -m benchmarks.run courses --size 10000
+    $ # Store the results as the new baseline of the scenario.
+    $ python -m benchmarks.run courses --size 10000 --save-baseline
+    $ # Simulate 200ms of EMSI latency with 10 concurrent requests.
+    $ python -m benchmarks.run programs --size 1000 --latency 0.2 --workers 10
+    $ # Chunk and translate 100 descriptions of more than 100 KB each.
+    $ python -m benchmarks.run translate-large-text --size 100
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from mock import patch
+
+SCENARIOS = ('courses', 'programs', 'xblocks', 'process-skills-data', 'jobs', 'translate-large-text')
+DEFAULT_BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'baselines.json')
+# Metrics compared against the baseline, along with whether higher values are better.
+COMPARED_METRICS = (
+    ('products_per_sec', True),
+    ('queries_per_product', False),
+    ('peak_rss_mb', False),
+)
+
+
+class FakeTranslateClient:
+    """
+    Stand-in for the AWS Translate client that reports every text as already in English.
+    """
+
+    @staticmethod
+    def translate_text(Text, SourceLanguageCode, TargetLanguageCode):  # pylint: disable=invalid-name,unused-argument
+        """
+        Return the text untranslated.
+        """
+        return {'TranslatedText': Text, 'SourceLanguageCode': 'en', 'TargetLanguageCode': TargetLanguageCode}
+
+
+def setup_django(emsi_url, db_name):
+    """
+    Configure Django to use the fake EMSI server and a fresh database.
+    """
+    os.environ['DJANGO_SETTINGS_MODULE'] = 'benchmarks.settings'
+    os.environ['TAXONOMY_BENCHMARK_EMSI_URL'] = emsi_url
+    os.environ['TAXONOMY_BENCHMARK_DB_NAME'] = db_name
+
+    import django  # pylint: disable=import-outside-toplevel
+    from django.core.management import call_command  # pylint: disable=import-outside-toplevel
+
+    django.setup()
+    call_command('migrate', verbosity=0)
+
+
+def prepare_scenario(scenario, size, fake_server):
+    """
+    Create the data the given scenario needs before it is measured.
+    """
+    # pylint: disable=import-outside-toplevel
+    from test_utils.factories import SkillFactory
+
+    from benchmarks.fake_emsi import get_skill_id
+
+    if scenario == 'jobs':
+        for index in range(size):
+            SkillFactory(external_id=get_skill_id(index), category=None, subcategory=None)
+        fake_server.skill_pool_size = size
+
+
+def run_scenario(scenario, size, fake_server):
+    """
+    Run the given scenario and return the number of products it processed.
+    """
+    # pylint: disable=import-outside-toplevel
+    from taxonomy import utils
+    from taxonomy.choices import ProductTypes
+    from taxonomy.emsi.client import EMSISkillsApiClient
+    from taxonomy.management.commands.refresh_job_skills import Command as RefreshJobSkillsCommand
+
+    from benchmarks import catalogs
+
+    if scenario in ('courses', 'programs', 'xblocks'):
+        product_type, catalog = {
+            'courses': (ProductTypes.Course, catalogs.get_course_catalog),
+            'programs': (ProductTypes.Program, catalogs.get_program_catalog),
+            'xblocks': (ProductTypes.XBlock, catalogs.get_xblock_catalog),
+        }[scenario]
+        utils.refresh_product_skills(catalog(size), True, product_type)
+    elif scenario == 'process-skills-data':
+        for course in catalogs.get_course_catalog(size):
+            skills = EMSISkillsApiClient.traverse_skills_data(fake_server.extract_skills(course['full_description']))
+            utils.process_skills_data(course, skills, True, ProductTypes.Course)
+    elif scenario == 'jobs':
+        RefreshJobSkillsCommand().handle()
+    elif scenario == 'translate-large-text':
+        for index, description in enumerate(catalogs.generate_large_descriptions(size)):
+            utils.apply_batching_to_translate_large_text(f'large-text-{index}', description)
+    return size
+
+
+def run_benchmark(scenario, size, latency=0, workers=None):
+    """
+    Run a benchmark and return its report.
+    """
+    from benchmarks.fake_emsi import FakeEMSIServer  # pylint: disable=import-outside-toplevel
+
+    with FakeEMSIServer(latency=latency) as fake_server, tempfile.TemporaryDirectory() as temp_dir:
+        setup_django(fake_server.base_url, os.path.join(temp_dir, 'benchmark.db'))
+
+        # pylint: disable=import-outside-toplevel
+        from django.test import override_settings
+
+        from taxonomy import metrics, utils
+        from taxonomy.emsi.client import EMSIJobsApiClient
+        from taxonomy.management.commands.refresh_job_skills import Command as RefreshJobSkillsCommand
+
+        from benchmarks.metrics import QueryCounter, StageTimer, get_peak_rss_mb, summarize_external_calls
+
+        timer = StageTimer()
+        stage_patches = [
+            patch('taxonomy.utils.boto3.client', return_value=FakeTranslateClient()),
+            patch(
+                'taxonomy.utils.get_translated_skill_attribute_val',
+                timer.wrap('translate', utils.get_translated_skill_attribute_val),
+            ),
+            patch(
+                'taxonomy.utils.apply_batching_to_translate_large_text',
+                timer.wrap('translate_large_text', utils.apply_batching_to_translate_large_text),
+            ),
+            patch('taxonomy.utils._extract_product_skills', timer.wrap('extract', utils._extract_product_skills)),
+            patch('taxonomy.utils.process_skills_data', timer.wrap('persist', utils.process_skills_data)),
+            patch.object(EMSIJobsApiClient, 'get_jobs', timer.wrap('extract', EMSIJobsApiClient.get_jobs)),
+            patch.object(
+                RefreshJobSkillsCommand,
+                '_update_job_skills',
+                staticmethod(timer.wrap('persist', RefreshJobSkillsCommand._update_job_skills)),
+            ),
+        ]
+        worker_settings = {'EMSI_API_RATE_LIMIT_PER_SEC': 10 ** 6}
+        if workers:
+            worker_settings['EMSI_API_MAX_WORKERS'] = workers
+
+        prepare_scenario(scenario, size, fake_server)
+        fake_server.request_count = 0
+        metrics_sink = metrics.InMemoryMetricsSink()
+        metrics.add_sink(metrics_sink)
+        for stage_patch in stage_patches:
+            stage_patch.start()
+        try:
+            with override_settings(**worker_settings), QueryCounter() as query_counter:
+                started_at = perf_counter()
+                products = run_scenario(scenario, size, fake_server)
+                seconds = perf_counter() - started_at
+        finally:
+            for stage_patch in stage_patches:
+                stage_patch.stop()
+            metrics.remove_sink(metrics_sink)
+
+        return {
+            'scenario': scenario,
+            'size': size,
+            'latency': latency,
+            'workers': workers,
+            'seconds': round(seconds, 3),
+            'products_per_sec': round(products / seconds, 2),
+            'queries': query_counter.count,
+            'queries_per_product': round(query_counter.count / products, 2),
+            'emsi_requests': fake_server.request_count,
+            'peak_rss_mb': round(get_peak_rss_mb(), 1),
+            'stages': timer.summary(),
+            'external_calls': summarize_external_calls(metrics_sink),
+        }
+
+
+def compare_with_baseline(report, baseline, max_regression):
+    """
+    Print the change of every compared metric from the baseline and return the metrics that regressed.
+
+    Arguments:
+        report (dict): Report of the current run.
+        baseline (dict): Report of the baseline run.
+        max_regression (float): Percentage by which a metric may get worse before it counts as a regression.
+    """
+    regressions = []
+    for metric, higher_is_better in COMPARED_METRICS:
+        current, previous = report[metric], baseline[metric]
+        change = (current - previous) / previous * 100 if previous else 0
+        worse_by = -change if higher_is_better else change
+        flag = ' REGRESSION' if worse_by > max_regression else ''
+        print(f'{metric}: {previous} -> {current} ({change:+.1f}%){flag}')
+        if flag:
+            regressions.append(metric)
+    return regressions
+
+
+def main(argv=None):
+    """
+    Entry point of the benchmark runner.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the skills refresh pipeline.')
+    parser.add_argument('scenario', choices=SCENARIOS)
+    parser.add_argument('--size', type=int, default=1000, help='Number of products, or skills for jobs.')
+    parser.add_argument('--latency', type=float, default=0, help='Seconds of latency of every EMSI response.')
+    parser.add_argument('--workers', type=int, default=None, help='Override of EMSI_API_MAX_WORKERS.')
+    parser.add_argument('--baseline-file', default=DEFAULT_BASELINE_FILE, help='JSON file storing the baselines.')
+    parser.add_argument('--save-baseline', action='store_true', help='Store the results as the new baseline.')
+    parser.add_argument(
+        '--max-regression',
+        type=float,
+        default=10,
+        help='Percentage by which a metric may get worse than the baseline before the run fails.',
+    )
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.scenario, args.size, latency=args.latency, workers=args.workers)
+    print(json.dumps(report, indent=2))
+
+    baselines = {}
+    if os.path.exists(args.baseline_file):
+        with open(args.baseline_file, encoding='utf-8') as baseline_file:
+            baselines = json.load(baseline_file)
+    baseline_key = f'{args.scenario}:{args.size}:{args.latency}:{args.workers}'
+
+    if args.save_baseline:
+        baselines[baseline_key] = report
+        with open(args.baseline_file, 'w', encoding='utf-8') as baseline_file:
+            json.dump(baselines, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write('\n')
+        print(f'Saved baseline {baseline_key} to {args.baseline_file}.')
+        return 0
+
+    if baseline_key not in baselines:
+        print(f'No baseline {baseline_key} found in {args.baseline_file}.')
+        return 0
+    return 1 if compare_with_baseline(report, baselines[baseline_key], args.max_regression) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
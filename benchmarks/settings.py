@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+Settings used while running the benchmarks.
+
+The EMSI API URLs point to the local fake EMSI server started by the benchmark runner and the database is a
+throwaway sqlite database, so benchmarks never reach the real services.
+"""
+
+import os
+
+from test_settings import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('TAXONOMY_BENCHMARK_DB_NAME', 'benchmark.db'),
+    }
+}
+
+EMSI_API_ACCESS_TOKEN_URL = os.environ.get('TAXONOMY_BENCHMARK_EMSI_URL', 'http://localhost') + '/connect/token'
+EMSI_API_BASE_URL = os.environ.get('TAXONOMY_BENCHMARK_EMSI_URL', 'http://localhost')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {'null': {'class': 'logging.NullHandler'}},
+    'root': {'handlers': ['null'], 'level': 'WARNING'},
+}
@@ -93,6 +93,9 @@ setup(
     url='https://github.com/edx/taxonomy-connector',
     license='MIT',
     install_requires=REQUIREMENTS,
+    extras_require={
+        'orjson': ['orjson'],
+    },
     classifiers=[
         'Framework :: Django',
         'Framework :: Django :: 3.2',
@@ -11,7 +11,9 @@ from django.contrib import admin
 from taxonomy.models import (
     CourseSkills, Job, JobPostings, JobSkills, ProgramSkill, Skill, Translation, SkillCategory,
     SkillSubCategory, SkillsQuiz, RefreshProgramSkillsConfig, Industry, IndustryJobSkill,
-    XBlockSkills, XBlockSkillData
+    XBlockSkills, XBlockSkillData, ProductContentHash, SkillsExtractionCache,
+    ProductSkillsRefreshRun, ProductSkillsRefreshFailure, SkillTaxonomySnapshot,
+    ProductSkillsRetry, TranslationCache
 )
 
 
@@ -121,6 +123,17 @@ class TranslationAdmin(admin.ModelAdmin):
 
     list_display = ('id', 'source_model_name', 'source_record_identifier', 'source_model_field',)
     search_fields = ('source_record_identifier',)
+    raw_id_fields = ('translation_cache',)
+
+
+@admin.register(TranslationCache)
+class TranslationCacheAdmin(admin.ModelAdmin):
+    """
+    Administrative view for Translation Cache.
+    """
+
+    list_display = ('id', 'source_text_hash', 'source_language', 'translated_text_language', 'created')
+    search_fields = ('source_text_hash',)
 
 
 @admin.register(SkillsQuiz)
@@ -179,3 +192,71 @@ class XBlockSkillDataAdmin(admin.ModelAdmin):
 
     list_display = ('xblock', 'skill', 'verified_count', 'verified', 'created', 'modified', 'is_blacklisted')
     search_fields = ('skill__name',)
+
+
+@admin.register(ProductContentHash)
+class ProductContentHashAdmin(admin.ModelAdmin):
+    """
+    Admin view for ProductContentHash model.
+    """
+
+    list_display = ('product_identifier', 'product_type', 'hash_content', 'created', 'modified')
+    search_fields = ('product_identifier',)
+    list_filter = ('product_type', )
+
+
+@admin.register(SkillsExtractionCache)
+class SkillsExtractionCacheAdmin(admin.ModelAdmin):
+    """
+    Admin view for SkillsExtractionCache model.
+    """
+
+    list_display = ('text_hash', 'api_version', 'created', 'modified')
+    search_fields = ('text_hash',)
+    list_filter = ('api_version', )
+
+
+@admin.register(ProductSkillsRefreshRun)
+class ProductSkillsRefreshRunAdmin(admin.ModelAdmin):
+    """
+    Admin view for ProductSkillsRefreshRun model.
+    """
+
+    list_display = (
+        'id', 'product_type', 'cursor', 'success_count', 'skipped_count', 'failure_count', 'is_completed', 'created',
+        'modified',
+    )
+    list_filter = ('product_type', 'is_completed')
+
+
+@admin.register(ProductSkillsRefreshFailure)
+class ProductSkillsRefreshFailureAdmin(admin.ModelAdmin):
+    """
+    Admin view for ProductSkillsRefreshFailure model.
+    """
+
+    list_display = ('id', 'refresh_run', 'product_identifier', 'created')
+    search_fields = ('product_identifier',)
+    raw_id_fields = ('refresh_run',)
+
+
+@admin.register(ProductSkillsRetry)
+class ProductSkillsRetryAdmin(admin.ModelAdmin):
+    """
+    Admin view for ProductSkillsRetry model.
+    """
+
+    list_display = ('id', 'product_type', 'product_uuid', 'created')
+    search_fields = ('product_uuid',)
+    list_filter = ('product_type', )
+
+
+@admin.register(SkillTaxonomySnapshot)
+class SkillTaxonomySnapshotAdmin(admin.ModelAdmin):
+    """
+    Admin view for SkillTaxonomySnapshot model.
+    """
+
+    list_display = ('external_id', 'name', 'api_version', 'category_name', 'subcategory_name', 'modified')
+    search_fields = ('external_id', 'name')
+    list_filter = ('api_version', )
@@ -7,8 +7,12 @@ import logging
 
 from algoliasearch import algoliasearch
 
+from taxonomy import metrics
+
 LOGGER = logging.getLogger(__name__)
 
+ALGOLIA_SERVICE = 'algolia'
+
 
 class AlgoliaClient:
     """
@@ -39,7 +43,8 @@ class AlgoliaClient:
         Arguments:
             index_settings (dict): A dictionary of Algolia settings.
         """
-        self.algolia_index.set_settings(index_settings)
+        with metrics.measure(ALGOLIA_SERVICE, 'set_index_settings'):
+            self.algolia_index.set_settings(index_settings)
 
     def replace_all_objects(self, algolia_objects):
         """
@@ -54,7 +59,8 @@ class AlgoliaClient:
         request_options = algoliasearch.RequestOptions({
             'safe': True,  # wait for asynchronous indexing operations to complete
         })
-        self.algolia_index.replace_all_objects(algolia_objects, request_options)
+        with metrics.measure(ALGOLIA_SERVICE, 'replace_all_objects'):
+            self.algolia_index.replace_all_objects(algolia_objects, request_options)
         LOGGER.info(
             '[TAXONOMY] The %s Algolia index was successfully indexed with %s objects.',
             self.algolia_index.index_name,
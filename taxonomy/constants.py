@@ -103,7 +103,27 @@ def get_job_posting_query_filter(jobs=None):
 
 
 AMAZON_TRANSLATION_ALLOWED_SIZE = 5000
+TRANSLATE_MAX_WORKERS = 4
+TRANSLATE_PRODUCTS_MAX_WORKERS = 4
+TRANSLATE_PRODUCTS_QUEUE_SIZE = 20
+ENGLISH_DETECTION_THRESHOLD = 0.9
 EMSI_API_RATE_LIMIT_PER_SEC = 5
+EMSI_API_MAX_WORKERS = 5
+EMSI_API_POOL_SIZE = 10
+EMSI_API_CONNECT_TIMEOUT = 5
+EMSI_API_READ_TIMEOUT = 60
+EMSI_API_MAX_RETRIES = 3
+EMSI_API_BACKOFF_FACTOR = 0.5
+EMSI_API_ACCESS_TOKEN_REFRESH_MARGIN = 60
+EMSI_API_ACCESS_TOKEN_LOCK_TIMEOUT = 10
+EMSI_API_SKILL_DETAILS_BATCH_SIZE = 100
+EMSI_API_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+EMSI_API_CIRCUIT_BREAKER_RESET_TIMEOUT = 60
+SKILL_TAXONOMY_SNAPSHOT_BATCH_SIZE = 1000
+SKILLS_EXTRACTION_CACHE_TTL_SECONDS = 60 * 60 * 24 * 30
+SKILLS_EXTRACTION_CACHE_MAX_ENTRIES = 100000
+REFRESH_PRODUCT_SKILLS_CHUNK_SIZE = 100
+REFRESH_PRODUCT_SKILLS_MAX_FAILURES = 1000
 TRANSLATE_SERVICE = 'translate'
 ENGLISH = 'en'
 AUTO = 'auto'
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+Asyncio clients for communicating with the EMSI Service.
+
+The asyncio clients have the same API as the clients in `taxonomy.emsi.client` with coroutine methods. Requests are
+sent by a shared instance of the synchronous client from a pool of threads, so they go through the same connection
+pool, retries and access token as the synchronous clients and many of them can be in flight from one event loop.
+
+Example usage:
+    >>> async def extract_skills(texts):
+    ...     async with AsyncEMSISkillsApiClient() as client:
+    ...         return await asyncio.gather(*(client.get_product_skills(text) for text in texts))
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+
+from taxonomy.constants import EMSI_API_POOL_SIZE
+from taxonomy.emsi.client import EMSIJobsApiClient, EMSISkillsApiClient
+
+
+class AsyncJwtEMSIApiClient:
+    """
+    Base class of the asyncio EMSI clients, running the methods of a synchronous client in a pool of threads.
+    """
+
+    SYNC_CLIENT_CLASS = None
+
+    def __init__(self, max_concurrency=None):
+        """
+        Initialize the instance.
+
+        Arguments:
+            max_concurrency (int): Maximum number of requests in flight at a time, defaults to the number of
+                connections in the pool of the EMSI transport, `EMSI_API_POOL_SIZE`.
+        """
+        self.sync_client = self.SYNC_CLIENT_CLASS()  # pylint: disable=not-callable
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency or getattr(settings, 'EMSI_API_POOL_SIZE', EMSI_API_POOL_SIZE),
+        )
+
+    async def _run(self, method_name, *args, **kwargs):
+        """
+        Run a method of the synchronous client in the pool of threads and return its result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(getattr(self.sync_client, method_name), *args, **kwargs)
+        )
+
+    def close(self):
+        """
+        Shut down the pool of threads once the requests in flight are done.
+        """
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+
+class AsyncEMSISkillsApiClient(AsyncJwtEMSIApiClient):
+    """
+    Asyncio client to get the skills from course text data.
+    """
+
+    SYNC_CLIENT_CLASS = EMSISkillsApiClient
+    API_VERSION = EMSISkillsApiClient.API_VERSION
+    traverse_skills_data = staticmethod(EMSISkillsApiClient.traverse_skills_data)
+
+    async def get_skill_details(self, skill_id):
+        """
+        Query the EMSI API to get details for a particular skill, see `EMSISkillsApiClient.get_skill_details`.
+        """
+        return await self._run('get_skill_details', skill_id)
+
+    async def get_skills_details(self, skill_ids):
+        """
+        Query the EMSI API to get details for many skills, see `EMSISkillsApiClient.get_skills_details`.
+        """
+        return await self._run('get_skills_details', skill_ids)
+
+    async def get_all_skills(self, **kwargs):
+        """
+        Query the EMSI API to get the complete list of skills, see `EMSISkillsApiClient.get_all_skills`.
+        """
+        return await self._run('get_all_skills', **kwargs)
+
+    async def get_product_skills(self, text_data):
+        """
+        Query the EMSI API for the skills of the given product text data, see `EMSISkillsApiClient.get_product_skills`.
+        """
+        return await self._run('get_product_skills', text_data)
+
+
+class AsyncEMSIJobsApiClient(AsyncJwtEMSIApiClient):
+    """
+    Asyncio client to get the Jobs.
+    """
+
+    SYNC_CLIENT_CLASS = EMSIJobsApiClient
+    traverse_jobs_data = staticmethod(EMSIJobsApiClient.traverse_jobs_data)
+    traverse_job_postings_data = staticmethod(EMSIJobsApiClient.traverse_job_postings_data)
+
+    async def get_details(self, ranking_facet, query_filter):
+        """
+        Query the EMSI API for the lookup of the filter query, see `EMSIJobsApiClient.get_details`.
+        """
+        return await self._run('get_details', ranking_facet, query_filter)
+
+    async def get_jobs(self, ranking_facet, nested_ranking_facet, query_filter):
+        """
+        Query the EMSI API for the jobs of the filter query, see `EMSIJobsApiClient.get_jobs`.
+        """
+        return await self._run('get_jobs', ranking_facet, nested_ranking_facet, query_filter)
+
+    async def get_job_postings(self, ranking_facet, query_filter):
+        """
+        Query the EMSI API for the job postings data of the filter query, see `EMSIJobsApiClient.get_job_postings`.
+        """
+        return await self._run('get_job_postings', ranking_facet, query_filter)
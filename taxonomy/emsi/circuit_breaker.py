@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Circuit breaker for the calls made to the EMSI Service.
+"""
+
+import logging
+import threading
+from time import monotonic
+
+from requests.exceptions import HTTPError
+
+from taxonomy.exceptions import CircuitOpenError
+
+LOGGER = logging.getLogger(__name__)
+
+
+def is_service_failure(error):
+    """
+    Return True if the given `TaxonomyAPIError` shows that the EMSI service is failing.
+
+    Client errors, other than 429 Too Many Requests, are caused by the request itself and do not count as failures
+    of the service.
+    """
+    cause = error.__cause__
+    if isinstance(cause, HTTPError) and cause.response is not None:
+        status_code = cause.response.status_code
+        return not 400 <= status_code < 500 or status_code == 429
+    return True
+
+
+class CircuitBreaker:
+    """
+    Thread safe circuit breaker for the calls made to a single EMSI endpoint.
+
+    The circuit opens after `failure_threshold` consecutive failures, calls made while it is open fail immediately
+    with `CircuitOpenError` instead of reaching EMSI. Once `reset_timeout` seconds have passed a single trial call is
+    let through, the circuit closes if it succeeds and opens again if it fails.
+    """
+
+    def __init__(self, name, failure_threshold, reset_timeout):
+        """
+        Initialize the circuit breaker.
+
+        Arguments:
+            name (str): Name of the endpoint, used in log and error messages.
+            failure_threshold (int): Number of consecutive failures that open the circuit.
+            reset_timeout (float): Number of seconds the circuit stays open before a trial call is let through.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failure_count = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def _is_waiting(self):
+        """
+        Return True if the circuit is open and no call may be let through yet.
+        """
+        if self._opened_at is None:
+            return False
+        return self._trial_in_flight or monotonic() - self._opened_at < self.reset_timeout
+
+    @property
+    def is_open(self):
+        """
+        Return True if calls made now would be refused.
+        """
+        with self._lock:
+            return self._is_waiting()
+
+    def before_call(self):
+        """
+        Check that a call may be made, marking it as the trial call if the reset timeout has passed.
+
+        Raises:
+            (CircuitOpenError): If the circuit is open.
+        """
+        with self._lock:
+            if self._is_waiting():
+                raise CircuitOpenError(f'Circuit of EMSI endpoint {self.name} is open.')
+            if self._opened_at is not None:
+                self._trial_in_flight = True
+
+    def record_success(self):
+        """
+        Close the circuit after a call that reached the service.
+        """
+        with self._lock:
+            self._failure_count = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """
+        Count a failed call, opening the circuit once the threshold is reached or when the trial call fails.
+        """
+        with self._lock:
+            self._failure_count += 1
+            if self._trial_in_flight or self._failure_count >= self.failure_threshold:
+                if self._opened_at is None:
+                    LOGGER.warning(
+                        '[TAXONOMY] Circuit of EMSI endpoint %s opened after %s consecutive failures.',
+                        self.name,
+                        self._failure_count,
+                    )
+                self._opened_at = monotonic()
+                self._trial_in_flight = False
@@ -4,21 +4,36 @@ Clients for communicating with the EMSI Service.
 """
 
 import logging
+import sys
+import threading
 from functools import wraps
-from time import time
+from time import sleep, time
 from urllib.parse import urljoin
 
-import requests
+from edx_django_utils.cache import get_cache_key
 from edx_rest_api_client.auth import BearerAuth
 from requests.exceptions import ConnectionError, RequestException, Timeout  # pylint: disable=redefined-builtin
 
 from django.conf import settings
-
+from django.core.cache import cache
+
+from taxonomy import metrics, replay
+from taxonomy.constants import (
+    EMSI_API_ACCESS_TOKEN_LOCK_TIMEOUT,
+    EMSI_API_ACCESS_TOKEN_REFRESH_MARGIN,
+    EMSI_API_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    EMSI_API_CIRCUIT_BREAKER_RESET_TIMEOUT,
+)
+from taxonomy.emsi import transport
+from taxonomy.emsi.circuit_breaker import CircuitBreaker, is_service_failure
+from taxonomy.emsi.parsers.skill_parsers import parse_extracted_skills
 from taxonomy.exceptions import TaxonomyAPIError
 
 
 LOGGER = logging.getLogger(__name__)
 
+EMSI_SERVICE = 'emsi'
+
 
 class JwtEMSIApiClient:
     """
@@ -44,6 +59,9 @@ class JwtEMSIApiClient:
         self.scope = scope
         self.expires_at = 0
         self.client = None
+        self._connect_lock = threading.Lock()
+        self._circuit_breakers = {}
+        self._circuit_breakers_lock = threading.Lock()
 
     def oauth_access_token(self, grant_type='client_credentials'):
         """
@@ -59,28 +77,103 @@ class JwtEMSIApiClient:
             'scope': self.scope,
         }
 
-        response = requests.post(
-            self.ACCESS_TOKEN_URL,
-            data=data,
-            headers={'content-type': 'application/x-www-form-urlencoded'}
-        )
+        # Token requests are never recorded, so the client credentials they carry are not written to any archive.
+        with metrics.measure(EMSI_SERVICE, 'oauth_access_token'):
+            response = transport.create_session().post(
+                self.ACCESS_TOKEN_URL,
+                data=data,
+                headers={'content-type': 'application/x-www-form-urlencoded'}
+            )
 
         if response.ok:
             data = response.json()
             access_token = data['access_token']
             expires_in = data['expires_in']
-            self.expires_at = int(time()) + expires_in
+            # Refresh the token a safety margin before it expires, so it does not expire while a request is in flight.
+            refresh_margin = min(
+                getattr(settings, 'EMSI_API_ACCESS_TOKEN_REFRESH_MARGIN', EMSI_API_ACCESS_TOKEN_REFRESH_MARGIN),
+                expires_in // 2,
+            )
+            self.expires_at = int(time()) + expires_in - refresh_margin
+            metrics.increment(metrics.TOKEN_REFRESHES, service=EMSI_SERVICE, scope=self.scope)
             return access_token
 
         LOGGER.error('[EMSI Service] Error occurred while getting the access token for EMSI service')
         return None
 
+    def _get_access_token_cache_key(self):
+        """
+        Return the key of the access token of the client id and scope in the Django cache.
+        """
+        return get_cache_key(
+            domain='taxonomy', subdomain='emsi_access_token', client_id=self.client_id, scope=self.scope,
+        )
+
+    def _get_cached_access_token(self, cache_key):
+        """
+        Return the access token stored in the Django cache, `None` if there is no valid token in the cache.
+        """
+        cached_token = cache.get(cache_key)
+        if cached_token is None or int(time()) > cached_token['expires_at']:
+            return None
+        self.expires_at = cached_token['expires_at']
+        return cached_token['access_token']
+
+    def _fetch_and_cache_access_token(self, cache_key):
+        """
+        Fetch a new access token from EMSI API and store it in the Django cache until it needs to be refreshed.
+        """
+        access_token = self.oauth_access_token()
+        if access_token is not None:
+            cache.set(
+                cache_key,
+                {'access_token': access_token, 'expires_at': self.expires_at},
+                timeout=max(self.expires_at - int(time()), 1),
+            )
+        return access_token
+
+    def get_access_token(self):
+        """
+        Return an access token for the scope of the client, shared with other clients and processes through the cache.
+
+        A new token is fetched only when the cached token is about to expire. Fetching is guarded by a lock in the
+        cache, so concurrent workers wait for the token fetched by one of them instead of all requesting a new one.
+        """
+        cache_key = self._get_access_token_cache_key()
+        access_token = self._get_cached_access_token(cache_key)
+        if access_token is not None:
+            return access_token
+
+        lock_key = f'{cache_key}.lock'
+        lock_timeout = getattr(settings, 'EMSI_API_ACCESS_TOKEN_LOCK_TIMEOUT', EMSI_API_ACCESS_TOKEN_LOCK_TIMEOUT)
+        if cache.add(lock_key, True, timeout=lock_timeout):
+            try:
+                return self._get_cached_access_token(cache_key) or self._fetch_and_cache_access_token(cache_key)
+            finally:
+                cache.delete(lock_key)
+
+        # Another worker is fetching the token, wait for it and fetch one ourselves if it does not show up in time.
+        wait_until = time() + lock_timeout
+        while time() < wait_until:
+            sleep(0.1)
+            access_token = self._get_cached_access_token(cache_key)
+            if access_token is not None:
+                return access_token
+        return self._fetch_and_cache_access_token(cache_key)
+
     def connect(self):
         """
         Connect to the REST API, authenticating with a JWT for the current user.
+
+        While replaying recorded traffic, responses are served locally and no access token is fetched.
         """
-        self.client = requests.Session()
-        self.client.auth = BearerAuth(self.oauth_access_token())
+        # The session is only published once it is authenticated, threads sharing the client never see it half set up.
+        client = replay.get_http_session()
+        if replay.is_replaying():
+            self.expires_at = sys.maxsize
+        else:
+            client.auth = BearerAuth(self.get_access_token())
+        self.client = client
 
     def is_token_expired(self):
         """
@@ -92,6 +185,9 @@ class JwtEMSIApiClient:
     def refresh_token(func):
         """
         Use this method decorator to ensure the access token is refreshed when needed.
+
+        The client can be shared by several threads, only the first thread to find the token expired re-connects
+        while the others wait for it and use the new connection.
         """
         @wraps(func)
         def inner(self, *args, **kwargs):
@@ -99,10 +195,72 @@ class JwtEMSIApiClient:
             Before calling the wrapped function, we check if the access token is expired, and if so, re-connect.
             """
             if self.is_token_expired():
-                self.connect()
+                with self._connect_lock:  # pylint: disable=protected-access
+                    if self.is_token_expired():
+                        self.connect()
             return func(self, *args, **kwargs)
         return inner
 
+    def get_circuit_breaker(self, endpoint):
+        """
+        Return the circuit breaker of the given endpoint of this client.
+
+        Arguments:
+            endpoint (str): Name of the client method calling the endpoint, e.g. `get_product_skills`.
+        """
+        with self._circuit_breakers_lock:
+            if endpoint not in self._circuit_breakers:
+                failure_threshold = getattr(
+                    settings, 'EMSI_API_CIRCUIT_BREAKER_FAILURE_THRESHOLD', EMSI_API_CIRCUIT_BREAKER_FAILURE_THRESHOLD
+                )
+                reset_timeout = getattr(
+                    settings, 'EMSI_API_CIRCUIT_BREAKER_RESET_TIMEOUT', EMSI_API_CIRCUIT_BREAKER_RESET_TIMEOUT
+                )
+                self._circuit_breakers[endpoint] = CircuitBreaker(endpoint, failure_threshold, reset_timeout)
+            return self._circuit_breakers[endpoint]
+
+    @staticmethod
+    def circuit_breaker(func):
+        """
+        Use this method decorator to stop calling an endpoint of EMSI after consecutive failures.
+
+        While the circuit of the endpoint is open the wrapped method raises `CircuitOpenError` without calling EMSI.
+        """
+        @wraps(func)
+        def inner(self, *args, **kwargs):
+            """
+            Call the wrapped function if the circuit of its endpoint is closed, and record the outcome of the call.
+            """
+            circuit_breaker = self.get_circuit_breaker(func.__name__)
+            circuit_breaker.before_call()
+            try:
+                result = func(self, *args, **kwargs)
+            except TaxonomyAPIError as error:
+                if is_service_failure(error):
+                    circuit_breaker.record_failure()
+                else:
+                    circuit_breaker.record_success()
+                raise
+            circuit_breaker.record_success()
+            return result
+        return inner
+
+    @staticmethod
+    def measured(func):
+        """
+        Use this method decorator to report the metrics of the calls to an endpoint of EMSI.
+
+        See `taxonomy.metrics` for the reported metrics, the endpoint is named after the wrapped method.
+        """
+        @wraps(func)
+        def inner(self, *args, **kwargs):
+            """
+            Call the wrapped function while measuring it.
+            """
+            with metrics.measure(EMSI_SERVICE, func.__name__):
+                return func(self, *args, **kwargs)
+        return inner
+
     def get_api_url(self, path):
         """
         Construct the full API URL using the API_BASE_URL and path.
@@ -121,7 +279,8 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
     Object builds an API client to make calls to get the skills from course text data.
     """
 
-    API_BASE_URL = urljoin(JwtEMSIApiClient.API_BASE_URL, '/skills/versions/8.9')
+    API_VERSION = '8.9'
+    API_BASE_URL = urljoin(JwtEMSIApiClient.API_BASE_URL, f'/skills/versions/{API_VERSION}')
 
     def __init__(self):
         """
@@ -130,6 +289,7 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
         super(EMSISkillsApiClient, self).__init__(scope='emsi_open')
 
     @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.measured
     def get_skill_details(self, skill_id):
         """
         Query the EMSI API to get details for a particular skill.
@@ -146,7 +306,7 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
             api_url = self.get_api_url(f'skills/{skill_id}')
             response = self.client.get(api_url)
             response.raise_for_status()
-            return response.json()
+            return transport.decode_json(response)
         except (RequestException, ConnectionError, Timeout) as error:
             LOGGER.exception(
                 '[TAXONOMY] Exception raised while fetching skill details from EMSI. Skill ID: [%s]',
@@ -155,6 +315,60 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
             raise TaxonomyAPIError('Error while fetching skill details.') from error
 
     @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.measured
+    def get_skills_details(self, skill_ids):
+        """
+        Query the EMSI API to get details for many skills in a single request.
+
+        The ids are posted to the skills endpoint of the pinned skills API version, which returns the skills in
+        the same format as `get_skill_details`, one per known id.
+
+        Arguments:
+             skill_ids (list): Skill external ids, these are the ids that come from EMSI.
+
+        Returns:
+            (dict): A dictionary containing the details of the skills as a list under the `data` key. Ids unknown
+                to EMSI are left out of the list.
+        """
+        data = {
+            'ids': list(skill_ids)
+        }
+        try:
+            api_url = self.get_api_url('skills')
+            response = self.client.post(api_url, json=data)
+            response.raise_for_status()
+            return transport.decode_json(response)
+        except (RequestException, ConnectionError, Timeout) as error:
+            LOGGER.exception(
+                '[TAXONOMY] Exception raised while fetching skills details from EMSI. Skill IDs: [%s]',
+                data['ids']
+            )
+            raise TaxonomyAPIError('Error while fetching skills details.') from error
+
+    @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.measured
+    def get_all_skills(self, fields=('id', 'name', 'description', 'category', 'subcategory')):
+        """
+        Query the EMSI API to get the complete list of skills of the pinned skills API version.
+
+        Arguments:
+             fields (tuple): Fields returned for every skill.
+
+        Returns:
+            (dict): A dictionary containing all the skills as a list under the `data` key.
+        """
+        try:
+            api_url = self.get_api_url('skills')
+            response = self.client.get(api_url, params={'fields': ','.join(fields)})
+            response.raise_for_status()
+            return transport.decode_json(response)
+        except (RequestException, ConnectionError, Timeout) as error:
+            LOGGER.exception('[TAXONOMY] Exception raised while fetching all the skills from EMSI.')
+            raise TaxonomyAPIError('Error while fetching all the skills.') from error
+
+    @JwtEMSIApiClient.circuit_breaker
+    @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.measured
     def get_product_skills(self, text_data):
         """
         Query the EMSI API for the skills of the given product text data.
@@ -164,7 +378,7 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
             or overview in case of a program.
 
         Returns:
-            dict: A dictionary containing details of all the skills.
+            (ExtractedSkills): Compact records of the skills extracted from the text.
         """
         data = {
             'text': text_data
@@ -176,7 +390,7 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
                 json=data,
             )
             response.raise_for_status()
-            return self.traverse_skills_data(response.json())
+            return self.traverse_skills_data(transport.decode_json(response))
         except (RequestException, ConnectionError, Timeout) as error:
             LOGGER.exception(
                 '[TAXONOMY] Exception raised while fetching skills data from EMSI. PostData: [%s]',
@@ -187,18 +401,9 @@ class EMSISkillsApiClient(JwtEMSIApiClient):
     @staticmethod
     def traverse_skills_data(response):
         """
-        Transform data to a more useful format.
+        Parse the skills extraction response into compact records, see `parse_extracted_skills`.
         """
-        for skill_details in response['data']:
-            # append skill description in skill data extracted from "wikipediaExtract" tag
-            try:
-                desc = next(tag['value'] for tag in skill_details['skill']['tags'] if tag['key'] == 'wikipediaExtract')
-            except StopIteration:
-                LOGGER.warning('[TAXONOMY] "wikipediaExtract" key not found in skill: %s', skill_details['skill']['id'])
-                desc = ''
-            skill_details['skill']['description'] = desc
-
-        return response
+        return parse_extracted_skills(response)
 
 
 class EMSIJobsApiClient(JwtEMSIApiClient):
@@ -214,7 +419,9 @@ class EMSIJobsApiClient(JwtEMSIApiClient):
         """
         super(EMSIJobsApiClient, self).__init__(scope='postings:us')
 
+    @JwtEMSIApiClient.circuit_breaker
     @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.measured
     def get_details(self, ranking_facet, query_filter):
         """
         Query the EMSI API for the lookup of the pre-defined filter_query.
@@ -234,14 +441,16 @@ class EMSIJobsApiClient(JwtEMSIApiClient):
                 json=query_filter,
             )
             response.raise_for_status()
-            return response.json()
+            return transport.decode_json(response)
         except (RequestException, ConnectionError, Timeout) as error:
             LOGGER.exception('[TAXONOMY] Exception raised while fetching data from EMSI')
             raise TaxonomyAPIError(
                 'Error while fetching lookup for {ranking_facet}'.format(ranking_facet=ranking_facet.value)
             ) from error
 
+    @JwtEMSIApiClient.circuit_breaker
     @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.measured
     def get_jobs(self, ranking_facet, nested_ranking_facet, query_filter):
         """
         Query the EMSI API for the jobs of the pre-defined filter_query.
@@ -262,7 +471,7 @@ class EMSIJobsApiClient(JwtEMSIApiClient):
                 json=query_filter,
             )
             response.raise_for_status()
-            return self.traverse_jobs_data(response.json())
+            return self.traverse_jobs_data(transport.decode_json(response))
         except (RequestException, ConnectionError, Timeout) as error:
             LOGGER.exception('[TAXONOMY] Exception raised while fetching jobs data from EMSI')
             raise TaxonomyAPIError(
@@ -279,7 +488,9 @@ class EMSIJobsApiClient(JwtEMSIApiClient):
         """
         return jobs_data
 
+    @JwtEMSIApiClient.circuit_breaker
     @JwtEMSIApiClient.refresh_token
+    @JwtEMSIApiClient.measured
     def get_job_postings(self, ranking_facet, query_filter):
         """
         Query the EMSI API for the job postings data of the pre-defined filter_query.
@@ -298,7 +509,7 @@ class EMSIJobsApiClient(JwtEMSIApiClient):
                 json=query_filter,
             )
             response.raise_for_status()
-            return self.traverse_job_postings_data(response.json())
+            return self.traverse_job_postings_data(transport.decode_json(response))
         except (RequestException, ConnectionError, Timeout) as error:
             LOGGER.exception('[TAXONOMY] Exception raised while fetching job posting data from EMSI')
             raise TaxonomyAPIError(
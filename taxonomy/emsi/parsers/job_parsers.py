@@ -0,0 +1,100 @@
+"""
+Module that contains utility methods and classes for parsing the ranking responses of the EMSI jobs API.
+
+The parsers walk the ranking buckets lazily and yield compact records holding only the fields persisted by
+taxonomy, so the nested dictionaries of a bucket can be released as soon as it is persisted.
+"""
+from typing import NamedTuple, Optional, Tuple
+
+
+class JobSkillBucket(NamedTuple):
+    """
+    A skill ranked for a job by the EMSI jobs API.
+    """
+
+    external_id: str
+    significance: float
+    unique_postings: int
+
+
+class JobBucket(NamedTuple):
+    """
+    A job ranked by the EMSI jobs API, along with its ranked skills.
+    """
+
+    external_id: str
+    skills: Tuple[JobSkillBucket, ...]
+
+
+class JobPostingsBucket(NamedTuple):
+    """
+    Job postings statistics of a job ranked by the EMSI jobs API.
+    """
+
+    external_id: str
+    median_salary: Optional[str]
+    median_posting_duration: int
+    unique_postings: int
+    unique_companies: int
+
+    def get_job_postings_data(self):
+        """
+        Return the field values of the `JobPostings` model.
+        """
+        return {
+            'median_salary': self.median_salary,
+            'median_posting_duration': self.median_posting_duration,
+            'unique_postings': self.unique_postings,
+            'unique_companies': self.unique_companies,
+        }
+
+
+def _get_ranking_buckets(response):
+    """
+    Return the buckets of the top level ranking of the response.
+    """
+    return response['data']['ranking']['buckets']
+
+
+def iter_job_buckets(response):
+    """
+    Yield the jobs of a response of the jobs rankings API, ranked with their nested skills ranking.
+
+    Arguments:
+        response (dict): A dictionary containing the API response from the jobs rankings API.
+
+    Raises:
+        (KeyError): If a field persisted by taxonomy is missing from a bucket, before the bucket is yielded.
+    """
+    for job_bucket in _get_ranking_buckets(response):
+        yield JobBucket(
+            external_id=job_bucket['name'],
+            skills=tuple(
+                JobSkillBucket(
+                    external_id=skill_bucket['name'],
+                    significance=skill_bucket['significance'],
+                    unique_postings=skill_bucket['unique_postings'],
+                ) for skill_bucket in job_bucket['ranking']['buckets']
+            ),
+        )
+
+
+def iter_job_postings_buckets(response):
+    """
+    Yield the job postings statistics of the jobs of a response of the job postings rankings API.
+
+    Arguments:
+        response (dict): A dictionary containing the API response from the job postings rankings API.
+
+    Raises:
+        (KeyError): If a field persisted by taxonomy is missing from a bucket, before the bucket is yielded.
+    """
+    for bucket in _get_ranking_buckets(response):
+        median_salary = bucket['median_salary']
+        yield JobPostingsBucket(
+            external_id=bucket['name'],
+            median_salary=str(median_salary).strip('$') if median_salary else None,
+            median_posting_duration=bucket['median_posting_duration'],
+            unique_postings=bucket['unique_postings'],
+            unique_companies=bucket['unique_companies'],
+        )
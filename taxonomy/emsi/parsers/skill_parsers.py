@@ -1,9 +1,91 @@
 """
 Module that contains utility methods and classes for parsing EMSI responses.
 """
+import logging
+from typing import NamedTuple, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
 INVALID_NAMES = {'NULL', 'NONE', ''}
 
 
+class ExtractedSkill(NamedTuple):
+    """
+    A skill extracted from a text by the EMSI skills API, holding only the fields persisted by taxonomy.
+    """
+
+    external_id: str
+    name: str
+    info_url: str
+    type_id: str
+    type_name: str
+    description: str
+    confidence: float
+
+    @classmethod
+    def from_emsi_record(cls, record):
+        """
+        Parse a record of the response of the skills extraction API.
+
+        The description is read from the `wikipediaExtract` tag of the skill, like EMSI sends it, even if the skill
+        has a `description` key.
+
+        Arguments:
+            record (dict): A dictionary containing the `confidence` and the `skill` extracted from the text.
+
+        Raises:
+            (KeyError): If a required key is missing from the record.
+            (ValueError, TypeError): If a value of the record has an invalid type.
+        """
+        skill = record['skill']
+        fields = {
+            'external_id': skill['id'],
+            'name': skill['name'],
+            'info_url': skill['infoUrl'],
+            'type_id': skill['type']['id'],
+            'type_name': skill['type']['name'],
+            'confidence': float(record['confidence']),
+        }
+        try:
+            description = next(tag['value'] for tag in skill['tags'] if tag['key'] == 'wikipediaExtract')
+        except StopIteration:
+            LOGGER.warning('[TAXONOMY] "wikipediaExtract" key not found in skill: %s', skill['id'])
+            description = ''
+        return cls(description=description, **fields)
+
+
+class ExtractedSkills(NamedTuple):
+    """
+    Skills extracted from a text by the EMSI skills API, along with the errors of the records that could not be parsed.
+    """
+
+    skills: Tuple[ExtractedSkill, ...]
+    errors: Tuple[Exception, ...] = ()
+
+
+def parse_extracted_skills(response):
+    """
+    Parse the response of the skills extraction API into compact records, dropping every field taxonomy does not use.
+
+    Arguments:
+        response (dict|ExtractedSkills): A dictionary containing the API response from the skills extraction API,
+            or records that are already parsed, which are returned unchanged.
+
+    Returns:
+        (ExtractedSkills): The records of the response, the parsing errors of invalid records are collected instead
+            of being raised.
+    """
+    if isinstance(response, ExtractedSkills):
+        return response
+    skills, errors = [], []
+    for record in response['data']:
+        try:
+            skills.append(ExtractedSkill.from_emsi_record(record))
+        except (KeyError, ValueError, TypeError) as error:
+            errors.append(error)
+    return ExtractedSkills(skills=tuple(skills), errors=tuple(errors))
+
+
 class SkillDataParser:
     """
     Parser for processing/parsing EMSI responses returned by the skills API (https://api.emsidata.com/apis/skills).
@@ -18,6 +100,20 @@ class SkillDataParser:
         """
         self.data = response['data']
 
+    @classmethod
+    def from_batch_response(cls, response):
+        """
+        Return a parser for every skill of a response listing the details of many skills.
+
+        Arguments:
+            response (dict): A dictionary containing the API response from the skills retrieve API.
+                response dict should contain a list of skills under the `data` key.
+
+        Returns:
+            (dict): A dictionary mapping the external id of every skill to its parser.
+        """
+        return {skill_data['id']: cls(response={'data': skill_data}) for skill_data in response['data']}
+
     def get_skill_category_data(self):
         """
         Parse and return category and subcategory data from the response dict.
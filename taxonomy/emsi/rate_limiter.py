@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Rate limiter for throttling calls made to the EMSI Service.
+"""
+
+import threading
+from time import monotonic, sleep
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread safe token bucket rate limiter.
+
+    Tokens are added to the bucket at a constant `rate` per second up to `capacity`. Each call to `acquire` reserves
+    a token, callers that find the bucket empty sleep until their reserved token becomes available. The bucket starts
+    full, so a `capacity` larger than 1 allows bursts of up to `capacity` calls on top of `rate` calls per second.
+    The default capacity of 1 spaces calls evenly so that no second ever releases more than `rate` calls.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        Initialize the rate limiter.
+
+        Arguments:
+            rate (float): Number of tokens added to the bucket per second.
+            capacity (float): Maximum number of tokens the bucket can hold, defaults to 1.
+        """
+        if rate <= 0:
+            raise ValueError('Rate limiter `rate` must be a positive number.')
+
+        self.rate = float(rate)
+        self.capacity = float(capacity or 1)
+        self._tokens = self.capacity
+        self._updated_at = monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """
+        Reserve a token and return the number of seconds to wait before it can be used.
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0
+
+    def acquire(self):
+        """
+        Block until a token is available.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            sleep(wait)
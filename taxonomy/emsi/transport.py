@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP transport shared by the clients of the EMSI Service.
+"""
+
+import json
+import random
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import InvalidJSONError
+from urllib3.util.retry import Retry
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from taxonomy import metrics
+from taxonomy.constants import (
+    EMSI_API_BACKOFF_FACTOR,
+    EMSI_API_CONNECT_TIMEOUT,
+    EMSI_API_MAX_RETRIES,
+    EMSI_API_POOL_SIZE,
+    EMSI_API_READ_TIMEOUT,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class JitteredRetry(Retry):
+    """
+    Retry policy with full jitter applied to the exponential backoff.
+
+    Waiting a random time between zero and the exponential backoff spreads the retries of concurrent workers instead
+    of sending them all at the same moment. A `Retry-After` header sent with a 429 or 503 response takes precedence
+    over the backoff.
+    """
+
+    def get_backoff_time(self):
+        """
+        Return a random time between zero and the exponential backoff time.
+        """
+        backoff_time = super().get_backoff_time()
+        return random.uniform(0, backoff_time) if backoff_time else 0
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter that applies default connect and read timeouts to the requests sent without a timeout.
+    """
+
+    def __init__(self, *args, timeout=None, **kwargs):
+        """
+        Initialize the adapter.
+
+        Arguments:
+            timeout (tuple): Default `(connect, read)` timeouts in seconds.
+        """
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        """
+        Send the request with the default timeout unless a timeout was given.
+        """
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def get_retry_policy():
+    """
+    Return the retry policy for requests to the EMSI Service.
+
+    Requests answered with 429 or 5xx and requests that fail to connect are retried with jittered exponential
+    backoff. Once retries are exhausted the last response is returned, so callers handle it like any other error.
+    """
+    return JitteredRetry(
+        total=getattr(settings, 'EMSI_API_MAX_RETRIES', EMSI_API_MAX_RETRIES),
+        backoff_factor=getattr(settings, 'EMSI_API_BACKOFF_FACTOR', EMSI_API_BACKOFF_FACTOR),
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'POST']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_http_adapter():
+    """
+    Return the HTTP adapter, along with its connection pool, shared by all the EMSI clients.
+    """
+    pool_size = getattr(settings, 'EMSI_API_POOL_SIZE', EMSI_API_POOL_SIZE)
+    return TimeoutHTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=get_retry_policy(),
+        timeout=(
+            getattr(settings, 'EMSI_API_CONNECT_TIMEOUT', EMSI_API_CONNECT_TIMEOUT),
+            getattr(settings, 'EMSI_API_READ_TIMEOUT', EMSI_API_READ_TIMEOUT),
+        ),
+    )
+
+
+def configure_session(session):
+    """
+    Mount the shared HTTP adapter on the given session, measure its responses and return it.
+    """
+    adapter = get_http_adapter()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.hooks['response'].append(metrics.record_response)
+    return session
+
+
+def create_session():
+    """
+    Return a new requests session that sends its requests through the shared HTTP adapter.
+    """
+    return configure_session(requests.Session())
+
+
+def get_json_decoder():
+    """
+    Return the function decoding the JSON responses of the EMSI Service.
+
+    The dotted path of a function taking the response body as bytes can be set in `EMSI_API_JSON_DECODER`,
+    otherwise `orjson.loads` is used when orjson is installed and `json.loads` when it is not.
+    """
+    decoder_path = getattr(settings, 'EMSI_API_JSON_DECODER', None)
+    if decoder_path:
+        return import_string(decoder_path)
+    return orjson.loads if orjson is not None else json.loads
+
+
+def decode_json(response):
+    """
+    Decode the JSON body of a response of the EMSI Service.
+
+    Raises:
+        (InvalidJSONError): If the body is not valid JSON, like `response.json()` does.
+    """
+    try:
+        return get_json_decoder()(response.content)
+    except ValueError as error:
+        raise InvalidJSONError(f'Invalid JSON in the response of {response.url}: {error}', response=response) from error
@@ -26,3 +26,9 @@ class InvalidCommandOptionsError(Exception):
     """
     Exception to raise when incorrect command options are provided.
     """
+
+
+class CircuitOpenError(TaxonomyAPIError):
+    """
+    Exception to raise when a call to the EMSI service is refused because the circuit of its endpoint is open.
+    """
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Offline detection of English text, used to skip AWS Translate for texts that are already in English.
+
+Detection counts the stopwords of English and of the other languages common in the catalog. The stopwords are
+the most frequent words of a language, so they make up a large share of any prose regardless of its subject. A
+text is English with high confidence when English stopwords make up a large share of its words, few of its
+stopwords belong to the other languages and its letters are ASCII. Texts in languages without a stopword list,
+like Dutch, have few English stopwords, so they are not detected as English and are sent to AWS Translate.
+
+Example usage:
+    >>> get_english_confidence('<p>Learn the basics of Python and how to use it in data science.</p>')
+    1.0
+    >>> get_english_confidence('<p>Aprende los fundamentos de Python y cómo usarlo en la ciencia de datos.</p>')
+    0.0
+"""
+
+import re
+
+from bs4 import BeautifulSoup
+
+MIN_ENGLISH_STOPWORDS = 3
+# Share of the words of English prose that are English stopwords, from which a text is confidently English.
+ENGLISH_STOPWORDS_SHARE = 0.3
+
+_WORD_PATTERN = re.compile(r'[^\W\d_]+')
+
+_STOPWORDS = {
+    'en': {
+        'the', 'and', 'of', 'to', 'in', 'is', 'that', 'for', 'it', 'with', 'as', 'was', 'on', 'are', 'be', 'this',
+        'by', 'you', 'from', 'or', 'an', 'have', 'not', 'at', 'but', 'will', 'can', 'your', 'which', 'how', 'what',
+        'learn', 'about', 'their', 'they', 'we', 'has', 'these', 'into', 'more', 'also', 'use', 'using', 'our',
+        'who', 'would', 'been', 'other', 'when', 'such', 'through', 'its', 'than', 'then', 'should', 'each',
+    },
+    'es': {
+        'el', 'la', 'de', 'que', 'y', 'en', 'los', 'del', 'se', 'las', 'por', 'un', 'para', 'con', 'una', 'su',
+        'al', 'lo', 'como', 'más', 'pero', 'sus', 'le', 'ya', 'o', 'este', 'sí', 'porque', 'esta', 'entre',
+        'cuando', 'muy', 'sin', 'sobre', 'también', 'fue', 'hasta', 'hay', 'donde', 'quien', 'desde', 'todo',
+        'nos', 'durante', 'todos', 'uno', 'les', 'ni', 'contra', 'otros', 'ese', 'eso', 'ante', 'ellos', 'cómo',
+        'curso', 'aprende', 'aprenderás',
+    },
+    'fr': {
+        'le', 'la', 'les', 'de', 'des', 'du', 'et', 'en', 'un', 'une', 'est', 'que', 'qui', 'dans', 'pour', 'pas',
+        'sur', 'au', 'avec', 'ce', 'il', 'ne', 'se', 'par', 'plus', 'sont', 'ou', 'aux', 'cette', 'nous', 'vous',
+        'leur', 'mais', 'comme', 'être', 'ces', 'ses', 'été', 'sans', 'fait', 'entre', 'aussi', 'tout', 'dont',
+        'cours', 'apprendre', 'comment',
+    },
+    'de': {
+        'der', 'die', 'und', 'in', 'den', 'von', 'zu', 'das', 'mit', 'sich', 'des', 'auf', 'für', 'ist', 'im',
+        'dem', 'nicht', 'ein', 'eine', 'als', 'auch', 'es', 'an', 'werden', 'aus', 'er', 'hat', 'dass', 'sie',
+        'nach', 'wird', 'bei', 'einer', 'um', 'am', 'sind', 'noch', 'wie', 'einem', 'über', 'einen', 'so', 'zum',
+        'kurs', 'lernen',
+    },
+    'pt': {
+        'de', 'a', 'o', 'que', 'e', 'do', 'da', 'em', 'um', 'para', 'é', 'com', 'não', 'uma', 'os', 'no', 'se',
+        'na', 'por', 'mais', 'as', 'dos', 'como', 'mas', 'ao', 'ele', 'das', 'seu', 'sua', 'ou', 'quando', 'muito',
+        'nos', 'já', 'também', 'só', 'pelo', 'pela', 'até', 'isso', 'ela', 'entre', 'sem', 'curso', 'aprenda',
+    },
+    'it': {
+        'di', 'e', 'il', 'la', 'che', 'è', 'per', 'un', 'in', 'del', 'della', 'non', 'una', 'con', 'sono', 'da',
+        'si', 'le', 'dei', 'nel', 'alla', 'più', 'gli', 'anche', 'come', 'ma', 'delle', 'questo', 'al', 'lo',
+        'nella', 'sul', 'tra', 'degli', 'dal', 'corso', 'imparare',
+    },
+}
+
+# Only the words that belong to a single language are evidence of that language, e.g. `a` or `in` are not.
+_EXCLUSIVE_STOPWORDS = {
+    language: stopwords.difference(*(
+        other_stopwords for other_language, other_stopwords in _STOPWORDS.items() if other_language != language
+    ))
+    for language, stopwords in _STOPWORDS.items()
+}
+
+
+def get_english_confidence(text):
+    """
+    Return the confidence, between 0 and 1, that the text is written in English.
+
+    Arguments:
+        text (str): Plain or html text.
+
+    Returns:
+        (float): Share of the words of the text that are English stopwords, relative to `ENGLISH_STOPWORDS_SHARE`
+            and capped at 1, weighted by the share of the stopwords of the text that are English and by the share
+            of ASCII letters. It is 0 if the text has fewer than `MIN_ENGLISH_STOPWORDS` English stopwords.
+    """
+    words = _WORD_PATTERN.findall(BeautifulSoup(text, 'html.parser').get_text(' ').lower())
+    stopword_counts = dict.fromkeys(_EXCLUSIVE_STOPWORDS, 0)
+    letter_count = ascii_letter_count = 0
+    for word in words:
+        letter_count += len(word)
+        ascii_letter_count += sum(1 for character in word if character.isascii())
+        for language, stopwords in _EXCLUSIVE_STOPWORDS.items():
+            if word in stopwords:
+                stopword_counts[language] += 1
+
+    english_count = stopword_counts['en']
+    if english_count < MIN_ENGLISH_STOPWORDS:
+        return 0.0
+    # Only English stopwords are evidence of English, a text without stopwords of the other languages may be
+    # written in any language missing from `_STOPWORDS`.
+    english_share = min(english_count / len(words) / ENGLISH_STOPWORDS_SHARE, 1.0)
+    return english_share * english_count / sum(stopword_counts.values()) * ascii_letter_count / letter_count
+
+
+def is_english(text, threshold):
+    """
+    Return True if the text is confidently detected as English.
+
+    Arguments:
+        text (str): Plain or html text.
+        threshold (float): Minimum confidence for the text to be English, detection is disabled when it is None.
+    """
+    return threshold is not None and get_english_confidence(text) >= threshold
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Base classes shared by the taxonomy management commands.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+from django.utils.translation import gettext as _
+
+from taxonomy import replay, utils
+from taxonomy.exceptions import InvalidCommandOptionsError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RefreshProductSkillsCommand(BaseCommand):  # pylint: disable=abstract-method
+    """
+    Base command for refreshing the skills associated with the products of a type.
+
+    Subclasses set `product_type` and `config_model`, add the arguments selecting the products before calling
+    `add_arguments` of this class and select the products to refresh in `handle`. This class adds the arguments that
+    control how the products are refreshed, validates them and runs the refresh.
+    """
+    product_type = None
+    config_model = None
+
+    def add_arguments(self, parser):
+        """
+        Add the arguments that control how the products are refreshed to the command parser.
+        """
+        products = {'products': f'{self.product_type}s'}
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            default=False,
+            help=_('Refresh skills of the %(products)s whose text has not changed since the last refresh.') % products,
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            default=False,
+            help=_('Skip the %(products)s already processed by the last incomplete run of --all.') % products,
+        )
+        parser.add_argument(
+            '--shard-index',
+            type=int,
+            default=0,
+            help=_(
+                'Index of the shard of the %(products)s to refresh, %(products)s are assigned to shards by their uuid.'
+            ) % products,
+        )
+        parser.add_argument(
+            '--shard-count',
+            type=int,
+            default=1,
+            help=_('Number of shards the %(products)s are partitioned into.') % products,
+        )
+        parser.add_argument(
+            '--retry-queued',
+            action='store_true',
+            default=False,
+            help=_(
+                'Refresh the %(products)s queued for retry because EMSI was failing when their skills were refreshed.'
+            ) % products,
+        )
+        parser.add_argument(
+            '--record',
+            metavar=_('ARCHIVE'),
+            default=None,
+            help=_('Record the traffic to EMSI and AWS Translate into the given compressed archive.'),
+        )
+        parser.add_argument(
+            '--replay',
+            metavar=_('ARCHIVE'),
+            default=None,
+            help=_('Serve the traffic to EMSI and AWS Translate from the given archive instead of the services.'),
+        )
+        parser.add_argument(
+            '--replay-latency',
+            type=float,
+            default=0,
+            help=_('Number of seconds every replayed response is delayed by.'),
+        )
+
+    def get_args_from_database(self):
+        """
+        Return an options dictionary from the current configuration model of the command.
+        """
+        config = self.config_model.get_solo()
+        argv = config.arguments.split()
+        parser = self.create_parser('manage.py', self.__module__.rsplit('.', 1)[-1])
+        return parser.parse_args(argv).__dict__
+
+    @staticmethod
+    def validate_refresh_options(options):
+        """
+        Validate the arguments that control how the products are refreshed.
+
+        Raises:
+            (InvalidCommandOptionsError): If the arguments can not be used together.
+        """
+        if options['resume'] and not (options['all'] and options['commit']):
+            raise InvalidCommandOptionsError('The resume argument can only be used with all and commit arguments.')
+
+        if not 0 <= options['shard_index'] < options['shard_count']:
+            raise InvalidCommandOptionsError('The shard index must be at least 0 and less than the shard count.')
+
+        if options['retry_queued'] and not options['commit']:
+            raise InvalidCommandOptionsError('The retry queued argument can only be used with commit argument.')
+
+        if options['record'] and options['replay']:
+            raise InvalidCommandOptionsError('Only one of record and replay arguments can be provided.')
+
+    def get_refresh_run(self, options):
+        """
+        Return the run record checkpointing the refresh of all the products, None if the skills are not committed.
+        """
+        if not options['commit']:
+            return None
+        refresh_run = utils.get_product_skills_refresh_run(
+            self.product_type,
+            resume=options['resume'],
+            shard_index=options['shard_index'],
+            shard_count=options['shard_count'],
+        )
+        if refresh_run.cursor:
+            LOGGER.info(
+                '[TAXONOMY] Resuming refresh %s skills run from position %s.', self.product_type, refresh_run.cursor
+            )
+        return refresh_run
+
+    def refresh_product_skills(self, products, options, refresh_run=None):
+        """
+        Refresh the skills of the products, recording or replaying the traffic to the remote services if requested.
+        """
+        with replay.traffic_context(options['record'], options['replay'], options['replay_latency']):
+            utils.refresh_product_skills(
+                products,
+                options['commit'],
+                self.product_type,
+                force=options['force'],
+                refresh_run=refresh_run,
+                shard_index=options['shard_index'],
+                shard_count=options['shard_count'],
+                dequeue_retries=options['retry_queued'],
+            )
@@ -0,0 +1,42 @@
+"""
+Management command for downloading a snapshot of the complete EMSI skills taxonomy.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from taxonomy.emsi.client import EMSISkillsApiClient
+from taxonomy.exceptions import TaxonomyAPIError
+from taxonomy.utils import store_skill_taxonomy_snapshot
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command for downloading all the skills of the pinned EMSI skills API version into a local snapshot.
+
+    The snapshot lets `fetch_skill_details --from-snapshot` resolve skill categories, subcategories and descriptions
+    without sending any request to EMSI. Downloading again replaces the snapshot of the same API version.
+
+    Example usage:
+        $ ./manage.py download_skill_taxonomy_snapshot
+    """
+    help = 'Downloads all the skills of the pinned EMSI skills API version into a local snapshot.'
+
+    def handle(self, *args, **options):
+        """
+        Entry point for management command execution.
+        """
+        api_version = EMSISkillsApiClient.API_VERSION
+        LOGGER.info('[TAXONOMY] Downloading skill taxonomy snapshot for EMSI skills API version %s.', api_version)
+        try:
+            skills = EMSISkillsApiClient().get_all_skills()
+        except TaxonomyAPIError as error:
+            message = f'Taxonomy API Error for downloading the skill taxonomy snapshot. Error: {error}'
+            LOGGER.error(message)
+            raise CommandError(message) from error
+
+        skill_count = store_skill_taxonomy_snapshot(skills, api_version=api_version)
+        LOGGER.info('[TAXONOMY] Skill taxonomy snapshot downloaded. Skills: %s', skill_count)
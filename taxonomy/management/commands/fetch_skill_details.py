@@ -3,7 +3,6 @@ Management command for fetching and populating skill details, specifically skill
 """
 
 import logging
-import time
 
 from edx_django_utils.db import chunked_queryset
 
@@ -12,9 +11,15 @@ from django.core.management.base import BaseCommand, CommandError
 
 from taxonomy.emsi.client import EMSISkillsApiClient
 from taxonomy.emsi.parsers.skill_parsers import SkillDataParser
-from taxonomy.exceptions import TaxonomyAPIError
+from taxonomy.emsi.rate_limiter import TokenBucketRateLimiter
+from taxonomy.exceptions import InvalidCommandOptionsError, TaxonomyAPIError
 from taxonomy.models import Skill, SkillCategory, SkillSubCategory
-from taxonomy.constants import EMSI_API_RATE_LIMIT_PER_SEC
+from taxonomy.constants import EMSI_API_SKILL_DETAILS_BATCH_SIZE
+from taxonomy.utils import (
+    get_emsi_api_rate_limit,
+    has_skill_taxonomy_snapshot,
+    resolve_skill_details_from_snapshot,
+)
 
 
 LOGGER = logging.getLogger(__name__)
@@ -27,9 +32,34 @@ class Command(BaseCommand):
     Example usage:
         $ # Fetch skill category and subcategory for all the skills in the system.
         $ ./manage.py fetch_skill_details
+        $ # Fetch the details of 100 skills per request to EMSI.
+        $ ./manage.py fetch_skill_details --batch --batch-size 100
+        $ # Resolve skill details from the snapshot stored by `download_skill_taxonomy_snapshot`, without EMSI calls.
+        $ ./manage.py fetch_skill_details --from-snapshot
         """
     help = 'Fetch and populate skill category and subcategory.'
 
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command parser.
+        """
+        parser.add_argument(
+            '--batch',
+            action='store_true',
+            help='Fetch the details of many skills per request to EMSI.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=EMSI_API_SKILL_DETAILS_BATCH_SIZE,
+            help='Number of skills whose details are fetched per request in batch mode.',
+        )
+        parser.add_argument(
+            '--from-snapshot',
+            action='store_true',
+            help='Resolve skill details from the local skill taxonomy snapshot instead of EMSI.',
+        )
+
     def _update_skill_category_and_sub_category(self, skill, skill_data):
         """
         Persist the skill category and subcategory data in the database.
@@ -58,26 +88,58 @@ class Command(BaseCommand):
 
             skill.save()
 
-    def _fetch_skill_category_and_sub_category(self):
+    @staticmethod
+    def _fetch_skill_details_one_by_one(client, skills):
+        """
+        Yield every skill along with the parser of its details, fetching the details of one skill per request.
+        """
+        # EMSI only allows a limited number of requests per second, more requests get 429 errors.
+        rate_limiter = TokenBucketRateLimiter(get_emsi_api_rate_limit())
+        for chunked_skills in chunked_queryset(skills, chunk_size=100):
+            for skill in chunked_skills:
+                rate_limiter.acquire()
+                response = client.get_skill_details(skill_id=skill.external_id)
+                yield skill, SkillDataParser(response=response)
+
+    @staticmethod
+    def _fetch_skill_details_in_batches(client, skills, batch_size):
+        """
+        Yield every skill along with the parser of its details, fetching the details of `batch_size` skills per request.
+        """
+        rate_limiter = TokenBucketRateLimiter(get_emsi_api_rate_limit())
+        for chunked_skills in chunked_queryset(skills, chunk_size=batch_size):
+            chunked_skills = list(chunked_skills)
+            rate_limiter.acquire()
+            response = client.get_skills_details(skill_ids=[skill.external_id for skill in chunked_skills])
+            skill_data_parsers = SkillDataParser.from_batch_response(response=response)
+            for skill in chunked_skills:
+                skill_data_parser = skill_data_parsers.get(skill.external_id)
+                if skill_data_parser is None:
+                    LOGGER.warning('No details returned by EMSI for skill external id %s.', skill.external_id)
+                    continue
+                yield skill, skill_data_parser
+
+    def _fetch_skill_category_and_sub_category(self, batch=False, batch_size=EMSI_API_SKILL_DETAILS_BATCH_SIZE):
         """
         Fetch skill category and subcategory data from EMSI and update the database accordingly.
+
+        Arguments:
+            batch (bool): Fetch the details of `batch_size` skills per request instead of one skill per request.
+            batch_size (int): Number of skills whose details are fetched per request in batch mode.
         """
         client = EMSISkillsApiClient()
         try:
             skills = Skill.objects.filter(Q(category__isnull=True) | Q(subcategory__isnull=True))
-            for chunked_skills in chunked_queryset(skills, chunk_size=100):
-                for index, skill in enumerate(chunked_skills, start=1):
-                    # EMSI only allows 5 requests/sec
-                    # We need to add one sec delay after every 5 requests to prevent 429 errors
-                    if index % EMSI_API_RATE_LIMIT_PER_SEC == 0:
-                        time.sleep(1)  # sleep for 1 second
-
-                    response = client.get_skill_details(skill_id=skill.external_id)
-                    skill_data_parser = SkillDataParser(response=response)
-                    self._update_skill_category_and_sub_category(
-                        skill=skill,
-                        skill_data=skill_data_parser.get_skill_category_data()
-                    )
+            if batch:
+                skill_details = self._fetch_skill_details_in_batches(client, skills, batch_size)
+            else:
+                skill_details = self._fetch_skill_details_one_by_one(client, skills)
+
+            for skill, skill_data_parser in skill_details:
+                self._update_skill_category_and_sub_category(
+                    skill=skill,
+                    skill_data=skill_data_parser.get_skill_category_data()
+                )
         except TaxonomyAPIError as error:
             message = 'Taxonomy API Error for refreshing the skill category and subcategory data for skill. ' \
                       'Error: {}'.format(error)
@@ -88,10 +150,34 @@ class Command(BaseCommand):
             LOGGER.error(message)
             raise CommandError(message)
 
+    @staticmethod
+    def _resolve_categories_from_snapshot():
+        """
+        Resolve skill category and subcategory data from the local skill taxonomy snapshot.
+        """
+        api_version = EMSISkillsApiClient.API_VERSION
+        if not has_skill_taxonomy_snapshot(api_version):
+            message = f'No skill taxonomy snapshot found for EMSI skills API version {api_version}. ' \
+                      'Run download_skill_taxonomy_snapshot first.'
+            LOGGER.error(message)
+            raise CommandError(message)
+
+        updated_count = 0
+        skills = Skill.objects.filter(Q(category__isnull=True) | Q(subcategory__isnull=True))
+        for chunked_skills in chunked_queryset(skills, chunk_size=1000):
+            updated_count += resolve_skill_details_from_snapshot(chunked_skills, api_version)
+        LOGGER.info('Resolved category and subcategory data for %s skills from the snapshot.', updated_count)
+
     def handle(self, *args, **options):
         """
         Entry point for management command execution.
         """
+        if options['batch_size'] < 1:
+            raise InvalidCommandOptionsError('The batch size must be at least 1.')
+
         LOGGER.info('Fetching skill category and subcategory data.')
-        self._fetch_skill_category_and_sub_category()
+        if options['from_snapshot']:
+            self._resolve_categories_from_snapshot()
+        else:
+            self._fetch_skill_category_and_sub_category(batch=options['batch'], batch_size=options['batch_size'])
         LOGGER.info('skill category and subcategory data updated successfully.')
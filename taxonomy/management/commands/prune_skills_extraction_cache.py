@@ -0,0 +1,52 @@
+"""
+Management command for pruning the skills extraction cache.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from taxonomy.utils import prune_skills_extraction_cache
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command for deleting expired and excess entries from the skills extraction cache.
+
+    Entries older than the configured TTL are deleted first, after that the least recently refreshed entries are
+    evicted until the cache holds no more than the configured maximum number of entries.
+
+    Example usage:
+        $ # Prune the cache using the configured TTL and maximum number of entries.
+        $ ./manage.py prune_skills_extraction_cache
+        $ # Delete entries older than a day and keep at most 1000 entries.
+        $ ./manage.py prune_skills_extraction_cache --ttl 86400 --max-entries 1000
+    """
+    help = 'Deletes expired and excess entries from the skills extraction cache.'
+
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command parser.
+        """
+        parser.add_argument(
+            '--ttl',
+            type=int,
+            default=None,
+            help='Number of seconds after which a cache entry expires.',
+        )
+        parser.add_argument(
+            '--max-entries',
+            type=int,
+            default=None,
+            help='Maximum number of entries to keep in the cache.',
+        )
+
+    def handle(self, *args, **options):
+        """
+        Entry point for management command execution.
+        """
+        LOGGER.info('[TAXONOMY] Prune skills extraction cache process started.')
+        deleted_count = prune_skills_extraction_cache(ttl=options['ttl'], max_entries=options['max_entries'])
+        LOGGER.info('[TAXONOMY] Prune skills extraction cache process completed. Deleted entries: %s', deleted_count)
@@ -0,0 +1,31 @@
+"""
+Management command for pruning the translation cache.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from taxonomy.utils import prune_translation_cache
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command for deleting the entries of the translation cache that no product references any more.
+
+    An entry is no longer referenced once the text of every product it was translated for has changed.
+
+    Example usage:
+        $ ./manage.py prune_translation_cache
+    """
+    help = 'Deletes the entries of the translation cache that no product references any more.'
+
+    def handle(self, *args, **options):
+        """
+        Entry point for management command execution.
+        """
+        LOGGER.info('[TAXONOMY] Prune translation cache process started.')
+        deleted_count = prune_translation_cache()
+        LOGGER.info('[TAXONOMY] Prune translation cache process completed. Deleted entries: %s', deleted_count)
@@ -5,19 +5,19 @@ Management command for refreshing the skills associated with courses.
 
 import logging
 
-from django.core.management.base import BaseCommand
 from django.utils.translation import gettext as _
 
 from taxonomy import utils
 from taxonomy.choices import ProductTypes
 from taxonomy.exceptions import CourseMetadataNotFoundError, InvalidCommandOptionsError
+from taxonomy.management.base import RefreshProductSkillsCommand
 from taxonomy.models import RefreshCourseSkillsConfig
 from taxonomy.providers.utils import get_course_metadata_provider
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Command(BaseCommand):
+class Command(RefreshProductSkillsCommand):
     """
     Command to refresh skills associated with the courses.
 
@@ -27,9 +27,24 @@ class Command(BaseCommand):
         $ ./manage.py refresh_course_skills --args-from-database
         $ # To update all the courses
         $ ./manage.py refresh_course_skills --all --commit
+        $ # To update all the courses including the ones whose text has not changed
+        $ ./manage.py refresh_course_skills --all --commit --force
+        $ # To resume the last courses update that did not complete
+        $ ./manage.py refresh_course_skills --all --commit --resume
+        $ # To split the courses between 4 workers, run each of the following on a different worker
+        $ ./manage.py refresh_course_skills --all --commit --shard-index 0 --shard-count 4
+        $ ./manage.py refresh_course_skills --all --commit --shard-index 1 --shard-count 4
+        $ ./manage.py refresh_course_skills --all --commit --shard-index 2 --shard-count 4
+        $ ./manage.py refresh_course_skills --all --commit --shard-index 3 --shard-count 4
+        $ # To refresh the courses queued for retry while EMSI was failing
+        $ ./manage.py refresh_course_skills --retry-queued --commit
+        $ # To record the traffic to EMSI and AWS Translate and replay it offline with 200ms latency per request
+        $ ./manage.py refresh_course_skills --all --record /tmp/courses-traffic.jsonl.gz
+        $ ./manage.py refresh_course_skills --all --replay /tmp/courses-traffic.jsonl.gz --replay-latency 0.2
     """
     help = 'Refreshes the skills associated with courses.'
     product_type = ProductTypes.Course
+    config_model = RefreshCourseSkillsConfig
 
     def add_arguments(self, parser):
         """
@@ -58,38 +73,40 @@ class Command(BaseCommand):
             default=False,
             help=u'Commits the skills to storage. '
         )
-
-    def get_args_from_database(self):
-        """
-        Return an options dictionary from the current RefreshCourseSkillsConfig model.
-        """
-        config = RefreshCourseSkillsConfig.get_solo()
-        argv = config.arguments.split()
-        parser = self.create_parser('manage.py', 'refresh_course_skills')
-        return parser.parse_args(argv).__dict__
+        super().add_arguments(parser)
 
     def handle(self, *args, **options):
         """
         Entry point for management command execution.
         """
-        if not (options['args_from_database'] or options['all'] or options['course']):
+        if not (options['args_from_database'] or options['all'] or options['course'] or options['retry_queued']):
             raise InvalidCommandOptionsError('Either course, args_from_database or all argument must be provided.')
 
         if options['args_from_database']:
             options = self.get_args_from_database()
 
+        self.validate_refresh_options(options)
+
         LOGGER.info('[TAXONOMY] Refresh Course Skills. Options: [%s]', options)
 
+        refresh_run = None
         if options['all']:
             courses = get_course_metadata_provider().get_all_courses()
+            refresh_run = self.get_refresh_run(options)
         elif options['course']:
             courses = get_course_metadata_provider().get_courses(course_ids=options['course'])
             if not courses:
                 raise CourseMetadataNotFoundError(
                     'No course metadata was found for following courses. {}'.format(options['course'])
                 )
+        elif options['retry_queued']:
+            course_uuids = utils.get_product_skills_retries(self.product_type)
+            if not course_uuids:
+                LOGGER.info('[TAXONOMY] No courses queued for retry.')
+                return
+            courses = get_course_metadata_provider().get_courses(course_ids=course_uuids)
         else:
             raise InvalidCommandOptionsError('Either course or all argument must be provided.')
 
         LOGGER.info('[TAXONOMY] Refresh course skills process started.')
-        utils.refresh_product_skills(courses, options['commit'], self.product_type)
+        self.refresh_product_skills(courses, options, refresh_run=refresh_run)
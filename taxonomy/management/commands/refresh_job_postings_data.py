@@ -10,6 +10,7 @@ from django.core.management.base import BaseCommand, CommandError
 
 from taxonomy.constants import get_job_posting_query_filter
 from taxonomy.emsi.client import EMSIJobsApiClient
+from taxonomy.emsi.parsers.job_parsers import iter_job_postings_buckets
 from taxonomy.enums import RankingFacet
 from taxonomy.exceptions import TaxonomyAPIError
 from taxonomy.models import Job, JobPostings
@@ -58,22 +59,13 @@ class Command(BaseCommand):
                     ranking_facet=ranking_facet,
                     query_filter=get_job_posting_query_filter(job_external_ids)
                 )
-                buckets = job_postings_data['data']['ranking']['buckets']
-                for bucket in buckets:
-                    try:
-                        job_external_id = bucket['name']
-                        median_salary = bucket['median_salary']
-                        job_posting_bucket_data = {
-                            'median_salary': str(median_salary).strip('$') if median_salary else None,
-                            'median_posting_duration': bucket['median_posting_duration'],
-                            'unique_postings': bucket['unique_postings'],
-                            'unique_companies': bucket['unique_companies'],
-                        }
-                        self._update_job_postings_data(job_external_id, job_posting_bucket_data)
-                    except KeyError as error:
-                        message = f'Missing keys in job postings data. Error: {error}'
-                        LOGGER.error(message)
-                        raise CommandError(message)
+                try:
+                    for bucket in iter_job_postings_buckets(job_postings_data):
+                        self._update_job_postings_data(bucket.external_id, bucket.get_job_postings_data())
+                except KeyError as error:
+                    message = f'Missing keys in job postings data. Error: {error}'
+                    LOGGER.error(message)
+                    raise CommandError(message)
 
         except TaxonomyAPIError:
             message = 'Taxonomy API Error for refreshing the job postings data for ' \
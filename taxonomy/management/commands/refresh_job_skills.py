@@ -10,8 +10,9 @@ from django.core.management.base import BaseCommand, CommandError
 
 from taxonomy.constants import get_job_query_filter
 from taxonomy.emsi.client import EMSIJobsApiClient
+from taxonomy.emsi.parsers.job_parsers import iter_job_buckets
 from taxonomy.enums import RankingFacet
-from taxonomy.exceptions import TaxonomyAPIError
+from taxonomy.exceptions import CircuitOpenError, TaxonomyAPIError
 from taxonomy.models import Job, JobSkills, Skill, IndustryJobSkill, Industry
 
 LOGGER = logging.getLogger(__name__)
@@ -31,12 +32,14 @@ class Command(BaseCommand):
     def _update_job_skills(job_bucket, industry=None):
         """
         Persist the jobs data in the database.
+
+        Arguments:
+            job_bucket (JobBucket): The job and its ranked skills parsed from the jobs rankings API response.
+            industry (Industry): Industry the jobs were ranked for, `None` if they were ranked for all industries.
         """
-        job_id = job_bucket['name']
-        job, _ = Job.objects.get_or_create(external_id=job_id)
-        skill_buckets = job_bucket['ranking']['buckets']
-        for skill_bucket in skill_buckets:
-            skill_id = skill_bucket['name']
+        job, _ = Job.objects.get_or_create(external_id=job_bucket.external_id)
+        for skill_bucket in job_bucket.skills:
+            skill_id = skill_bucket.external_id
             try:
                 skill = Skill.objects.get(external_id=skill_id)
             except Skill.DoesNotExist:
@@ -48,8 +51,8 @@ class Command(BaseCommand):
                 'job': job,
                 'skill': skill,
                 'defaults': {
-                    'significance': skill_bucket['significance'],
-                    'unique_postings': skill_bucket['unique_postings'],
+                    'significance': skill_bucket.significance,
+                    'unique_postings': skill_bucket.unique_postings,
                 },
             }
             if industry:
@@ -61,45 +64,49 @@ class Command(BaseCommand):
         """
         Refreshes the jobs associated with the skills.
 
+        A chunk of skills whose jobs could not be fetched is skipped and the refresh continues with the next chunk,
+        until the circuit of the EMSI jobs endpoint opens after consecutive failures and the refresh ends early.
+
         Arguments:
             ranking_facet (RankingFacet): Data will be ranked by this facet.
             nested_ranking_facet (RankingFacet): This is the nested facet to be applied after ranking data by the
                 `ranking_facet`.
         """
         client = EMSIJobsApiClient()
+        api_errors = []
         try:
             skills = Skill.objects.all()
+            industries = list(Industry.objects.all())
             for chunked_skills in chunked_queryset(skills, chunk_size=50):
                 skill_external_ids = list(chunked_skills.values_list('external_id', flat=True))
-                jobs = client.get_jobs(
-                    ranking_facet=ranking_facet,
-                    nested_ranking_facet=nested_ranking_facet,
-                    query_filter=get_job_query_filter(skill_external_ids)
-                )
-                job_buckets = jobs['data']['ranking']['buckets']
-                for bucket in job_buckets:
-                    self._update_job_skills(bucket)
-
-                for industry in Industry.objects.all():
-                    jobs = client.get_jobs(
-                        ranking_facet=ranking_facet,
-                        nested_ranking_facet=nested_ranking_facet,
-                        query_filter=get_job_query_filter(skill_external_ids, industry)
-                    )
-                    job_buckets = jobs['data']['ranking']['buckets']
-                    for bucket in job_buckets:
-                        self._update_job_skills(bucket, industry)
-
-        except TaxonomyAPIError as error:
-            message = 'Taxonomy API Error for refreshing the jobs for Ranking Facet {} and Nested Ranking Facet {}, ' \
-                      'Error: {}'.format(ranking_facet, nested_ranking_facet, error)
-            LOGGER.error(message)
-            raise CommandError(message)
+                try:
+                    for industry in [None] + industries:
+                        jobs = client.get_jobs(
+                            ranking_facet=ranking_facet,
+                            nested_ranking_facet=nested_ranking_facet,
+                            query_filter=get_job_query_filter(skill_external_ids, industry)
+                        )
+                        for job_bucket in iter_job_buckets(jobs):
+                            self._update_job_skills(job_bucket, industry)
+                except CircuitOpenError as error:
+                    api_errors.append(error)
+                    break
+                except TaxonomyAPIError as error:
+                    api_errors.append(error)
+
         except KeyError as error:
             message = f'Missing keys in update job skills data. Error: {error}'
             LOGGER.error(message)
             raise CommandError(message)
 
+        if api_errors:
+            message = 'Taxonomy API Error for refreshing the jobs for Ranking Facet {} and Nested Ranking Facet {}, ' \
+                      'Error: {}'.format(ranking_facet, nested_ranking_facet, api_errors[-1])
+            if len(api_errors) > 1:
+                message += f' Failed requests: {len(api_errors)}'
+            LOGGER.error(message)
+            raise CommandError(message)
+
     def handle(self, *args, **options):
         """
         Entry point for management command execution.
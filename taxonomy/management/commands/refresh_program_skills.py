@@ -4,19 +4,19 @@ Management command for refreshing the skills associated with programs.
 """
 import logging
 
-from django.core.management.base import BaseCommand
 from django.utils.translation import gettext as _
 
 from taxonomy import utils
 from taxonomy.choices import ProductTypes
-from taxonomy.exceptions import ProgramMetadataNotFoundError, InvalidCommandOptionsError
+from taxonomy.exceptions import InvalidCommandOptionsError, ProgramMetadataNotFoundError
+from taxonomy.management.base import RefreshProductSkillsCommand
 from taxonomy.models import RefreshProgramSkillsConfig
 from taxonomy.providers.utils import get_program_metadata_provider
 
 LOGGER = logging.getLogger(__name__)
 
 
-class Command(BaseCommand):
+class Command(RefreshProductSkillsCommand):
     """
         Command to refresh skills associated with the programs.
 
@@ -26,9 +26,24 @@ class Command(BaseCommand):
             $ ./manage.py refresh_program_skills --args-from-database
             $ # To update all the programs
             $ ./manage.py refresh_program_skills --all --commit
+            $ # To update all the programs including the ones whose text has not changed
+            $ ./manage.py refresh_program_skills --all --commit --force
+            $ # To resume the last programs update that did not complete
+            $ ./manage.py refresh_program_skills --all --commit --resume
+            $ # To split the programs between 4 workers, run each of the following on a different worker
+            $ ./manage.py refresh_program_skills --all --commit --shard-index 0 --shard-count 4
+            $ ./manage.py refresh_program_skills --all --commit --shard-index 1 --shard-count 4
+            $ ./manage.py refresh_program_skills --all --commit --shard-index 2 --shard-count 4
+            $ ./manage.py refresh_program_skills --all --commit --shard-index 3 --shard-count 4
+            $ # To refresh the programs queued for retry while EMSI was failing
+            $ ./manage.py refresh_program_skills --retry-queued --commit
+            $ # To record the traffic to EMSI and AWS Translate and replay it offline with 200ms latency per request
+            $ ./manage.py refresh_program_skills --all --record /tmp/programs-traffic.jsonl.gz
+            $ ./manage.py refresh_program_skills --all --replay /tmp/programs-traffic.jsonl.gz --replay-latency 0.2
         """
     help = 'Refreshes the skills associated with programs.'
     product_type = ProductTypes.Program
+    config_model = RefreshProgramSkillsConfig
 
     def add_arguments(self, parser):
         """
@@ -57,38 +72,40 @@ class Command(BaseCommand):
             default=False,
             help=u'Commits the skills to storage. '
         )
-
-    def get_args_from_database(self):
-        """
-        Return an options dictionary from the current RefreshProgramSkillsConfig model.
-        """
-        config = RefreshProgramSkillsConfig.get_solo()
-        argv = config.arguments.split()
-        parser = self.create_parser('manage.py', 'refresh_program_skills')
-        return parser.parse_args(argv).__dict__
+        super().add_arguments(parser)
 
     def handle(self, *args, **options):
         """
         Entry point for management command execution
         """
-        if not (options['args_from_database'] or options['all'] or options['program']):
+        if not (options['args_from_database'] or options['all'] or options['program'] or options['retry_queued']):
             raise InvalidCommandOptionsError('Either program, args_from_database or all argument must be provided.')
 
         if options['args_from_database']:
             options = self.get_args_from_database()
 
+        self.validate_refresh_options(options)
+
         LOGGER.info('[TAXONOMY] Refresh Program Skills. Options: [%s]', options)
 
+        refresh_run = None
         if options['all']:
             programs = get_program_metadata_provider().get_all_programs()
+            refresh_run = self.get_refresh_run(options)
         elif options['program']:
             programs = get_program_metadata_provider().get_programs(program_ids=options['program'])
             if not programs:
                 raise ProgramMetadataNotFoundError(
                     'No program metadata was found for following programs. {}'.format(options['program'])
                 )
+        elif options['retry_queued']:
+            program_uuids = utils.get_product_skills_retries(self.product_type)
+            if not program_uuids:
+                LOGGER.info('[TAXONOMY] No programs queued for retry.')
+                return
+            programs = get_program_metadata_provider().get_programs(program_ids=program_uuids)
         else:
             raise InvalidCommandOptionsError('Either program or all argument must be provided.')
 
         LOGGER.info('[TAXONOMY] Refresh program skills process started.')
-        utils.refresh_product_skills(programs, options['commit'], self.product_type)
+        self.refresh_product_skills(programs, options, refresh_run=refresh_run)
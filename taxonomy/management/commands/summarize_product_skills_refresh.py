@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Management command for summarizing a sharded refresh of the skills associated with courses or programs.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+from django.utils.translation import gettext as _
+
+from taxonomy import utils
+from taxonomy.choices import ProductTypes
+from taxonomy.exceptions import InvalidCommandOptionsError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to aggregate the counts of the latest run of every shard of `refresh_course_skills --all` or
+    `refresh_program_skills --all` into a single summary.
+
+    Example usage:
+        $ # Summarize the courses refresh split between 4 workers
+        $ ./manage.py summarize_product_skills_refresh --product-type course --shard-count 4
+    """
+    help = 'Summarizes the latest runs of a sharded refresh of the skills associated with courses or programs.'
+
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command parser.
+        """
+        parser.add_argument(
+            '--product-type',
+            choices=[ProductTypes.Course, ProductTypes.Program],
+            default=ProductTypes.Course,
+            help=_('Type of the products whose skills refresh is summarized.'),
+        )
+        parser.add_argument(
+            '--shard-count',
+            type=int,
+            default=1,
+            help=_('Number of shards the products were partitioned into.'),
+        )
+
+    def handle(self, *args, **options):
+        """
+        Entry point for management command execution.
+        """
+        if options['shard_count'] < 1:
+            raise InvalidCommandOptionsError('The shard count must be at least 1.')
+
+        summary = utils.get_product_skills_refresh_summary(options['product_type'], options['shard_count'])
+        LOGGER.info(
+            '[TAXONOMY] Refresh %s skills summary of %s shards. \n'
+            'Total %s Updated Successfully: %s \n'
+            'Total %s Skipped: %s \n'
+            'Total Failures: %s \n'
+            'Pending Shards: %s \n',
+            options['product_type'],
+            options['shard_count'],
+            options['product_type'],
+            summary['success_count'],
+            options['product_type'],
+            summary['skipped_count'],
+            summary['failure_count'],
+            summary['pending_shards'],
+        )
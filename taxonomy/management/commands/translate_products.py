@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Management command for translating the texts of courses or programs ahead of the refresh of their skills.
+"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+from django.utils.translation import gettext as _
+
+from taxonomy import utils
+from taxonomy.choices import ProductTypes
+from taxonomy.exceptions import InvalidCommandOptionsError
+from taxonomy.providers.utils import get_course_metadata_provider, get_program_metadata_provider
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to translate and store the texts of courses or programs, so the refresh of their skills only waits
+    for EMSI.
+
+    Texts whose stored translation is up to date are not translated again.
+
+    Example usage:
+        $ # Translate the texts of all the courses before refreshing their skills
+        $ ./manage.py translate_products --product-type course --all
+        $ ./manage.py refresh_course_skills --all --commit
+        $ # Translate the overviews of some programs with 8 concurrent translations
+        $ ./manage.py translate_products --product-type program --product 'program1_uuid' --max-workers 8
+    """
+    help = 'Translates and stores the texts of courses or programs ahead of the refresh of their skills.'
+
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command parser.
+        """
+        parser.add_argument(
+            '--product-type',
+            choices=[ProductTypes.Course, ProductTypes.Program],
+            default=ProductTypes.Course,
+            help=_('Type of the products whose texts are translated.'),
+        )
+        parser.add_argument(
+            '--product',
+            metavar=_('UUID'),
+            action='append',
+            help=_('Course or program whose text is translated.'),
+            default=[],
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help=_('Translate the texts of all the courses or programs.'),
+        )
+        parser.add_argument(
+            '--max-workers',
+            type=int,
+            default=None,
+            help=_('Maximum number of texts translated concurrently.'),
+        )
+
+    def handle(self, *args, **options):
+        """
+        Entry point for management command execution.
+        """
+        if not (options['all'] or options['product']):
+            raise InvalidCommandOptionsError('Either product or all argument must be provided.')
+
+        if options['max_workers'] is not None and options['max_workers'] < 1:
+            raise InvalidCommandOptionsError('The max workers argument must be at least 1.')
+
+        LOGGER.info('[TAXONOMY] Translate products. Options: [%s]', options)
+
+        if options['product_type'] == ProductTypes.Course:
+            provider = get_course_metadata_provider()
+            if options['all']:
+                products = provider.get_all_courses()
+            else:
+                products = provider.get_courses(course_ids=options['product'])
+        else:
+            provider = get_program_metadata_provider()
+            if options['all']:
+                products = provider.get_all_programs()
+            else:
+                products = provider.get_programs(program_ids=options['product'])
+
+        LOGGER.info('[TAXONOMY] Translate products process started.')
+        translated_count = utils.precompute_product_translations(
+            products, options['product_type'], max_workers=options['max_workers']
+        )
+        LOGGER.info(
+            '[TAXONOMY] Translate products process completed. Translated %s: %s',
+            options['product_type'],
+            translated_count,
+        )
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+Latency and throughput metrics of the calls to the external services used by taxonomy.
+
+Every call to EMSI, AWS Translate and Algolia is measured and reported to the metrics sinks. Sinks are configured
+with the `TAXONOMY_METRICS_SINKS` setting, a list of dotted paths to sink classes, or registered in-process with
+`add_sink`. No metric is computed while there is no sink.
+
+The following metrics are reported, all tagged with the `service` and the `endpoint` called:
+    * `taxonomy.external.requests`: Count of calls, also tagged with the `status` code of the response.
+    * `taxonomy.external.latency_seconds`: Latency of every call, including retries.
+    * `taxonomy.external.request_bytes`: Size of the request body of every call.
+    * `taxonomy.external.response_bytes`: Size of the response body of every call.
+    * `taxonomy.external.retries`: Count of retries of the calls.
+    * `taxonomy.external.token_refreshes`: Count of access tokens fetched, tagged with the `service` and `scope`.
+
+Texts detected offline as English skip AWS Translate, the detections are reported as:
+    * `taxonomy.translation.language_detections`: Count of texts checked, tagged with the `result` of the check,
+      `english` or `undetermined`.
+
+Example usage:
+    >>> sink = InMemoryMetricsSink()
+    >>> add_sink(sink)
+    >>> refresh_product_skills(courses, False, ProductTypes.Course)
+    >>> sink.get_count('taxonomy.external.requests', service='emsi')
+    42
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from time import perf_counter
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+LOGGER = logging.getLogger(__name__)
+
+REQUESTS = 'taxonomy.external.requests'
+LATENCY = 'taxonomy.external.latency_seconds'
+REQUEST_BYTES = 'taxonomy.external.request_bytes'
+RESPONSE_BYTES = 'taxonomy.external.response_bytes'
+RETRIES = 'taxonomy.external.retries'
+TOKEN_REFRESHES = 'taxonomy.external.token_refreshes'
+LANGUAGE_DETECTIONS = 'taxonomy.translation.language_detections'
+
+_registered_sinks = []
+_current_call = ContextVar('taxonomy_current_call', default=None)
+
+
+class MetricsSink:
+    """
+    Base class of the destinations of the metrics, every metric is dropped unless a subclass handles it.
+    """
+
+    def increment(self, name, value=1, tags=None):
+        """
+        Add the value to the counter of the given name.
+
+        Arguments:
+            name (str): Name of the metric.
+            value (int): Value added to the counter.
+            tags (dict): Tags of the metric, e.g. `{'service': 'emsi'}`.
+        """
+
+    def observe(self, name, value, tags=None):
+        """
+        Add the value to the histogram of the given name.
+
+        Arguments:
+            name (str): Name of the metric.
+            value (float): Observed value.
+            tags (dict): Tags of the metric, e.g. `{'service': 'emsi'}`.
+        """
+
+
+class LoggingMetricsSink(MetricsSink):
+    """
+    Sink logging every metric.
+    """
+
+    def increment(self, name, value=1, tags=None):
+        """
+        Log the increment of the counter.
+        """
+        LOGGER.info('[TAXONOMY] Metric %s incremented by %s. Tags: %s', name, value, tags)
+
+    def observe(self, name, value, tags=None):
+        """
+        Log the observed value.
+        """
+        LOGGER.info('[TAXONOMY] Metric %s observed %s. Tags: %s', name, value, tags)
+
+
+class CallbackMetricsSink(MetricsSink):
+    """
+    Sink forwarding the metrics to statsd-style callbacks.
+
+    Example usage:
+        >>> add_sink(CallbackMetricsSink(on_increment=statsd.increment, on_observe=statsd.histogram))
+    """
+
+    def __init__(self, on_increment=None, on_observe=None):
+        """
+        Initialize the sink.
+
+        Arguments:
+            on_increment (callable): Called with the name, the value and the tags of every counter increment.
+            on_observe (callable): Called with the name, the value and the tags of every observed value.
+        """
+        self._on_increment = on_increment
+        self._on_observe = on_observe
+
+    def increment(self, name, value=1, tags=None):
+        """
+        Forward the increment of the counter to the increment callback.
+        """
+        if self._on_increment is not None:
+            self._on_increment(name, value, tags)
+
+    def observe(self, name, value, tags=None):
+        """
+        Forward the observed value to the observe callback.
+        """
+        if self._on_observe is not None:
+            self._on_observe(name, value, tags)
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    Sink keeping the metrics in memory, so they can be read by the process that collects them.
+    """
+
+    def __init__(self):
+        """
+        Initialize the sink with no metrics.
+        """
+        self.counters = defaultdict(int)
+        self.histograms = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(name, tags):
+        """
+        Return the key of the metric with the given name and tags.
+        """
+        return name, tuple(sorted((tags or {}).items()))
+
+    @staticmethod
+    def _matches(key, name, tags):
+        """
+        Return True if the metric of the given key has the given name and all the given tags.
+        """
+        return key[0] == name and set(tags.items()) <= set(key[1])
+
+    def increment(self, name, value=1, tags=None):
+        """
+        Add the value to the counter.
+        """
+        with self._lock:
+            self.counters[self._get_key(name, tags)] += value
+
+    def observe(self, name, value, tags=None):
+        """
+        Append the value to the histogram.
+        """
+        with self._lock:
+            self.histograms[self._get_key(name, tags)].append(value)
+
+    def get_count(self, name, **tags):
+        """
+        Return the sum of the counters of the given name having all the given tags.
+        """
+        with self._lock:
+            return sum(value for key, value in self.counters.items() if self._matches(key, name, tags))
+
+    def get_values(self, name, **tags):
+        """
+        Return the values observed in the histograms of the given name having all the given tags.
+        """
+        with self._lock:
+            return [
+                value for key, values in self.histograms.items() if self._matches(key, name, tags) for value in values
+            ]
+
+    def get_tag_values(self, name, tag):
+        """
+        Return the sorted values of the given tag in the metrics of the given name.
+        """
+        with self._lock:
+            keys = list(self.counters) + list(self.histograms)
+        return sorted({dict(key[1])[tag] for key in keys if key[0] == name and tag in dict(key[1])})
+
+    def clear(self):
+        """
+        Drop all the collected metrics.
+        """
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+class CallMeasurement:
+    """
+    Measurement of a call to an external service, filled while the call is in flight.
+    """
+
+    def __init__(self, service, endpoint):
+        """
+        Initialize the measurement of a call to the given endpoint of the given service.
+        """
+        self.service = service
+        self.endpoint = endpoint
+        self.status = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+
+
+@lru_cache(maxsize=None)
+def _load_sinks(sink_paths):
+    """
+    Return instances of the sink classes at the given dotted paths.
+    """
+    return tuple(import_string(sink_path)() for sink_path in sink_paths)
+
+
+def get_sinks():
+    """
+    Return the sinks configured in the settings followed by the sinks registered with `add_sink`.
+    """
+    return _load_sinks(tuple(getattr(settings, 'TAXONOMY_METRICS_SINKS', ()))) + tuple(_registered_sinks)
+
+
+def add_sink(sink):
+    """
+    Register a sink receiving all the metrics reported by this process.
+    """
+    _registered_sinks.append(sink)
+
+
+def remove_sink(sink):
+    """
+    Stop reporting metrics to a sink registered with `add_sink`.
+    """
+    _registered_sinks.remove(sink)
+
+
+def _report(method, name, value, tags):
+    """
+    Report the metric to every sink, a failing sink does not fail the measured call.
+    """
+    for sink in get_sinks():
+        try:
+            getattr(sink, method)(name, value, tags)
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception('[TAXONOMY] Metrics sink %s failed to report metric %s.', sink, name)
+
+
+def increment(name, value=1, **tags):
+    """
+    Add the value to the counter of the given name in every sink.
+    """
+    _report('increment', name, value, tags)
+
+
+def observe(name, value, **tags):
+    """
+    Add the value to the histogram of the given name in every sink.
+    """
+    _report('observe', name, value, tags)
+
+
+@contextmanager
+def measure(service, endpoint):
+    """
+    Measure a call to an external service and report its metrics once the call is done.
+
+    The measurement is yielded, so the caller can fill in the status and sizes of the call. Responses received by
+    the requests sessions of `taxonomy.emsi.transport` while the call is in flight are measured automatically.
+
+    Arguments:
+        service (str): Name of the external service, e.g. `emsi`.
+        endpoint (str): Name of the endpoint called, e.g. `get_product_skills`.
+    """
+    call = CallMeasurement(service, endpoint)
+    token = _current_call.set(call)
+    started_at = perf_counter()
+    try:
+        yield call
+    except Exception:
+        call.status = call.status or 'error'
+        raise
+    finally:
+        latency = perf_counter() - started_at
+        _current_call.reset(token)
+        if get_sinks():
+            tags = {'service': service, 'endpoint': endpoint}
+            increment(REQUESTS, status=str(call.status or 'ok'), **tags)
+            observe(LATENCY, latency, **tags)
+            observe(REQUEST_BYTES, call.request_bytes, **tags)
+            observe(RESPONSE_BYTES, call.response_bytes, **tags)
+            if call.retries:
+                increment(RETRIES, call.retries, **tags)
+
+
+def record_response(response, *args, **kwargs):  # pylint: disable=unused-argument
+    """
+    Add the status, sizes and retries of a response to the measurement of the call in flight.
+
+    It is installed as a response hook of requests sessions and does nothing outside of `measure`.
+    """
+    call = _current_call.get()
+    if call is None:
+        return
+    body = response.request.body if response.request is not None else None
+    call.status = response.status_code
+    call.request_bytes += len(body.encode('utf-8') if isinstance(body, str) else body or b'')
+    call.response_bytes += len(response.content or b'')
+    retries = getattr(response.raw, 'retries', None)
+    call.retries += len(retries.history) if retries is not None else 0
@@ -0,0 +1,32 @@
+# Generated by Django 4.1.13 on 2026-10-17 23:16
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0028_xblock_skills'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductContentHash',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('product_type', models.CharField(choices=[('course', 'Course'), ('program', 'Program'), ('xblock', 'XBlock'), ('xblock_data', 'XBlockData')], help_text='The type of the product whose text was used for skills extraction.', max_length=255)),
+                ('product_identifier', models.CharField(help_text='The key of the course or uuid of the program whose text was used for skills extraction.', max_length=255)),
+                ('hash_content', models.CharField(help_text='Hashed text content useful for checking if content has changed', max_length=255)),
+            ],
+            options={
+                'verbose_name': 'Product Content Hash',
+                'verbose_name_plural': 'Product Content Hashes',
+                'ordering': ('created',),
+                'unique_together': {('product_type', 'product_identifier')},
+            },
+        ),
+    ]
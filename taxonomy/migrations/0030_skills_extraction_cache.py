@@ -0,0 +1,32 @@
+# Generated by Django 4.1.13 on 2026-10-17 23:18
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0029_product_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkillsExtractionCache',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('text_hash', models.CharField(help_text='SHA-256 hash of the normalized text whose skills were extracted.', max_length=64)),
+                ('api_version', models.CharField(help_text='Version of the EMSI skills API used for the extraction.', max_length=32)),
+                ('skills_data', models.JSONField(help_text='Compact skills data returned by the EMSI skills API for the text.')),
+            ],
+            options={
+                'verbose_name': 'Skills Extraction Cache',
+                'verbose_name_plural': 'Skills Extraction Cache',
+                'ordering': ('created',),
+                'unique_together': {('text_hash', 'api_version')},
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.1.13 on 2026-10-17 23:22
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0030_skills_extraction_cache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSkillsRefreshRun',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('product_type', models.CharField(choices=[('course', 'Course'), ('program', 'Program'), ('xblock', 'XBlock'), ('xblock_data', 'XBlockData')], help_text='The type of the products whose skills are refreshed.', max_length=255)),
+                ('cursor', models.PositiveIntegerField(default=0, help_text='Number of products from the start of the catalog whose processing has finished.')),
+                ('success_count', models.PositiveIntegerField(default=0, help_text='Number of products whose skills were refreshed successfully.')),
+                ('skipped_count', models.PositiveIntegerField(default=0, help_text='Number of products that were skipped.')),
+                ('failure_count', models.PositiveIntegerField(default=0, help_text='Number of products whose skills could not be refreshed.')),
+                ('is_completed', models.BooleanField(default=False, help_text='Whether all the products of the run have been processed.')),
+            ],
+            options={
+                'verbose_name': 'Product Skills Refresh Run',
+                'verbose_name_plural': 'Product Skills Refresh Runs',
+                'ordering': ('created',),
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.1.13 on 2026-10-17 23:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0031_product_skills_refresh_run'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productskillsrefreshrun',
+            name='shard_count',
+            field=models.PositiveIntegerField(default=1, help_text='Number of shards the products are partitioned into.'),
+        ),
+        migrations.AddField(
+            model_name='productskillsrefreshrun',
+            name='shard_index',
+            field=models.PositiveIntegerField(default=0, help_text='Index of the shard of the products processed by the run.'),
+        ),
+    ]
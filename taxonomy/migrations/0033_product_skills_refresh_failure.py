@@ -0,0 +1,32 @@
+# Generated by Django 4.1.13 on 2026-10-17 23:26
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0032_product_skills_refresh_run_shard'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSkillsRefreshFailure',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('product_identifier', models.CharField(help_text='The key of the course or uuid of the program whose skills could not be refreshed.', max_length=255)),
+                ('message', models.TextField(help_text='Description of the failure.')),
+                ('refresh_run', models.ForeignKey(help_text='The run that failed to refresh the skills of the product.', on_delete=django.db.models.deletion.CASCADE, related_name='failures', to='taxonomy.productskillsrefreshrun')),
+            ],
+            options={
+                'verbose_name': 'Product Skills Refresh Failure',
+                'verbose_name_plural': 'Product Skills Refresh Failures',
+                'ordering': ('created',),
+            },
+        ),
+    ]
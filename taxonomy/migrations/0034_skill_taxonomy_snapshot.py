@@ -0,0 +1,37 @@
+# Generated by Django 4.1.13 on 2026-10-17 23:49
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0033_product_skills_refresh_failure'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkillTaxonomySnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('api_version', models.CharField(help_text='Version of the EMSI skills API the snapshot was downloaded from.', max_length=32)),
+                ('external_id', models.CharField(help_text='The external identifier for the skill received from API.', max_length=255)),
+                ('name', models.CharField(help_text='Name of the skill.', max_length=255)),
+                ('description', models.TextField(blank=True, default='', help_text='A short description for the skill received from API.')),
+                ('category_id', models.IntegerField(blank=True, help_text='Id of the category of the skill, empty if EMSI does not assign a valid category.', null=True)),
+                ('category_name', models.CharField(blank=True, default='', help_text='Name of the category of the skill.', max_length=255)),
+                ('subcategory_id', models.IntegerField(blank=True, help_text='Id of the subcategory of the skill, empty if EMSI does not assign a valid subcategory.', null=True)),
+                ('subcategory_name', models.CharField(blank=True, default='', help_text='Name of the subcategory of the skill.', max_length=255)),
+            ],
+            options={
+                'verbose_name': 'Skill Taxonomy Snapshot',
+                'verbose_name_plural': 'Skill Taxonomy Snapshot',
+                'ordering': ('created',),
+                'unique_together': {('api_version', 'external_id')},
+            },
+        ),
+    ]
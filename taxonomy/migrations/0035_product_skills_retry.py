@@ -0,0 +1,31 @@
+# Generated by Django 4.1.13 on 2026-10-17 23:52
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0034_skill_taxonomy_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductSkillsRetry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('product_type', models.CharField(choices=[('course', 'Course'), ('program', 'Program'), ('xblock', 'XBlock'), ('xblock_data', 'XBlockData')], help_text='The type of the product whose skills refresh was skipped.', max_length=255)),
+                ('product_uuid', models.CharField(help_text='The uuid of the product whose skills refresh was skipped.', max_length=255)),
+            ],
+            options={
+                'verbose_name': 'Product Skills Retry',
+                'verbose_name_plural': 'Product Skills Retries',
+                'ordering': ('created',),
+                'unique_together': {('product_type', 'product_uuid')},
+            },
+        ),
+    ]
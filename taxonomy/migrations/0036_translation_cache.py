@@ -0,0 +1,39 @@
+# Generated by Django 4.1.13 on 2026-10-18 00:18
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0035_product_skills_retry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationCache',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('source_text_hash', models.CharField(help_text='SHA-256 hash of the translated source text.', max_length=64)),
+                ('translated_text_language', models.CharField(help_text='The language of the source text to which it is translated e:g English.', max_length=8)),
+                ('source_language', models.CharField(blank=True, help_text='The original language of the source text before translation e:g Spanish.', max_length=8, null=True)),
+                ('translated_text', models.TextField(help_text='The translated source text.')),
+            ],
+            options={
+                'verbose_name': 'Translation Cache',
+                'verbose_name_plural': 'Translation Cache',
+                'ordering': ('created',),
+                'unique_together': {('source_text_hash', 'translated_text_language')},
+            },
+        ),
+        migrations.AddField(
+            model_name='translation',
+            name='translation_cache',
+            field=models.ForeignKey(blank=True, help_text='The shared translation of the source text.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='translations', to='taxonomy.translationcache'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.1.13 on 2026-10-18 00:21
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def add_translation_source_text_hashes(apps, schema_editor):
+    """
+    Store the hash of the source text of the existing translations.
+    """
+    Translation = apps.get_model('taxonomy', 'Translation')
+    translations = []
+    for translation in Translation.objects.exclude(source_text=None).only('id', 'source_text').iterator():
+        translation.source_text_hash = hashlib.sha256(translation.source_text.encode('utf-8')).hexdigest()
+        translations.append(translation)
+        if len(translations) == 1000:
+            Translation.objects.bulk_update(translations, ['source_text_hash'])
+            translations = []
+    Translation.objects.bulk_update(translations, ['source_text_hash'])
+
+
+def do_nothing(apps, schema_editor):
+    """
+    Do nothing.
+    """
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taxonomy', '0036_translation_cache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translation',
+            name='source_text_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='SHA-256 hash of the source text, computed on save.', max_length=64, null=True),
+        ),
+        migrations.RunPython(add_translation_source_text_hashes, do_nothing),
+    ]
@@ -4,6 +4,7 @@ ORM Models for the taxonomy application.
 """
 from __future__ import unicode_literals
 
+import hashlib
 import uuid
 
 from solo.models import SingletonModel
@@ -12,7 +13,7 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from model_utils.models import TimeStampedModel
-from taxonomy.choices import UserGoal
+from taxonomy.choices import ProductTypes, UserGoal
 
 
 class Skill(TimeStampedModel):
@@ -333,6 +334,322 @@ class ProgramSkill(TimeStampedModel):
         return '<ProgramSkill id="{0}" skill="{1!r}">'.format(self.id, self.skill)
 
 
+class ProductContentHash(TimeStampedModel):
+    """
+    Hash of the text content of a course or program that was last used for skills extraction.
+
+    .. no_pii:
+    """
+
+    product_type = models.CharField(
+        max_length=255,
+        choices=ProductTypes.choices,
+        help_text=_('The type of the product whose text was used for skills extraction.')
+    )
+    product_identifier = models.CharField(
+        max_length=255,
+        help_text=_('The key of the course or uuid of the program whose text was used for skills extraction.')
+    )
+    hash_content = models.CharField(
+        max_length=255,
+        help_text=_('Hashed text content useful for checking if content has changed')
+    )
+
+    class Meta:
+        """
+        Meta configuration for ProductContentHash model.
+        """
+
+        verbose_name = 'Product Content Hash'
+        verbose_name_plural = 'Product Content Hashes'
+        ordering = ('created', )
+        app_label = 'taxonomy'
+        unique_together = ('product_type', 'product_identifier')
+
+    def __str__(self):
+        """
+        Create a human-readable string representation of the object.
+        """
+        return '<ProductContentHash product_type="{}" product_identifier="{}">'.format(
+            self.product_type, self.product_identifier
+        )
+
+    def __repr__(self):
+        """
+        Create a unique string representation of the object.
+        """
+        return '<ProductContentHash id="{}" hash_content="{}">'.format(self.id, self.hash_content)
+
+
+class SkillsExtractionCache(TimeStampedModel):
+    """
+    Skills extracted by the EMSI API for a piece of text, keyed by the hash of the normalized text.
+
+    .. no_pii:
+    """
+
+    text_hash = models.CharField(
+        max_length=64,
+        help_text=_('SHA-256 hash of the normalized text whose skills were extracted.')
+    )
+    api_version = models.CharField(
+        max_length=32,
+        help_text=_('Version of the EMSI skills API used for the extraction.')
+    )
+    skills_data = models.JSONField(
+        help_text=_('Compact skills data returned by the EMSI skills API for the text.')
+    )
+
+    class Meta:
+        """
+        Meta configuration for SkillsExtractionCache model.
+        """
+
+        verbose_name = 'Skills Extraction Cache'
+        verbose_name_plural = 'Skills Extraction Cache'
+        ordering = ('created', )
+        app_label = 'taxonomy'
+        unique_together = ('text_hash', 'api_version')
+
+    def __str__(self):
+        """
+        Create a human-readable string representation of the object.
+        """
+        return '<SkillsExtractionCache text_hash="{}" api_version="{}">'.format(self.text_hash, self.api_version)
+
+    def __repr__(self):
+        """
+        Create a unique string representation of the object.
+        """
+        return '<SkillsExtractionCache id="{}" text_hash="{}">'.format(self.id, self.text_hash)
+
+
+class ProductSkillsRefreshRun(TimeStampedModel):
+    """
+    Progress of a `refresh_course_skills` or `refresh_program_skills` run over all the products.
+
+    .. no_pii:
+    """
+
+    product_type = models.CharField(
+        max_length=255,
+        choices=ProductTypes.choices,
+        help_text=_('The type of the products whose skills are refreshed.')
+    )
+    cursor = models.PositiveIntegerField(
+        default=0,
+        help_text=_('Number of products from the start of the catalog whose processing has finished.')
+    )
+    success_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_('Number of products whose skills were refreshed successfully.')
+    )
+    skipped_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_('Number of products that were skipped.')
+    )
+    failure_count = models.PositiveIntegerField(
+        default=0,
+        help_text=_('Number of products whose skills could not be refreshed.')
+    )
+    shard_index = models.PositiveIntegerField(
+        default=0,
+        help_text=_('Index of the shard of the products processed by the run.')
+    )
+    shard_count = models.PositiveIntegerField(
+        default=1,
+        help_text=_('Number of shards the products are partitioned into.')
+    )
+    is_completed = models.BooleanField(
+        default=False,
+        help_text=_('Whether all the products of the run have been processed.')
+    )
+
+    class Meta:
+        """
+        Meta configuration for ProductSkillsRefreshRun model.
+        """
+
+        verbose_name = 'Product Skills Refresh Run'
+        verbose_name_plural = 'Product Skills Refresh Runs'
+        ordering = ('created', )
+        app_label = 'taxonomy'
+
+    def __str__(self):
+        """
+        Create a human-readable string representation of the object.
+        """
+        return '<ProductSkillsRefreshRun product_type="{}" shard="{}/{}" cursor="{}" is_completed="{}">'.format(
+            self.product_type, self.shard_index, self.shard_count, self.cursor, self.is_completed
+        )
+
+    def __repr__(self):
+        """
+        Create a unique string representation of the object.
+        """
+        return '<ProductSkillsRefreshRun id="{}" product_type="{}">'.format(self.id, self.product_type)
+
+
+class ProductSkillsRefreshFailure(TimeStampedModel):
+    """
+    A product whose skills could not be refreshed by a product skills refresh run.
+
+    .. no_pii:
+    """
+
+    refresh_run = models.ForeignKey(
+        ProductSkillsRefreshRun,
+        on_delete=models.CASCADE,
+        related_name='failures',
+        help_text=_('The run that failed to refresh the skills of the product.')
+    )
+    product_identifier = models.CharField(
+        max_length=255,
+        help_text=_('The key of the course or uuid of the program whose skills could not be refreshed.')
+    )
+    message = models.TextField(
+        help_text=_('Description of the failure.')
+    )
+
+    class Meta:
+        """
+        Meta configuration for ProductSkillsRefreshFailure model.
+        """
+
+        verbose_name = 'Product Skills Refresh Failure'
+        verbose_name_plural = 'Product Skills Refresh Failures'
+        ordering = ('created', )
+        app_label = 'taxonomy'
+
+    def __str__(self):
+        """
+        Create a human-readable string representation of the object.
+        """
+        return '<ProductSkillsRefreshFailure refresh_run="{}" product_identifier="{}">'.format(
+            self.refresh_run_id, self.product_identifier
+        )
+
+    def __repr__(self):
+        """
+        Create a unique string representation of the object.
+        """
+        return '<ProductSkillsRefreshFailure id="{}" product_identifier="{}">'.format(
+            self.id, self.product_identifier
+        )
+
+
+class ProductSkillsRetry(TimeStampedModel):
+    """
+    Product whose skills refresh was skipped while EMSI was failing, queued to be refreshed later.
+
+    .. no_pii:
+    """
+
+    product_type = models.CharField(
+        max_length=255,
+        choices=ProductTypes.choices,
+        help_text=_('The type of the product whose skills refresh was skipped.')
+    )
+    product_uuid = models.CharField(
+        max_length=255,
+        help_text=_('The uuid of the product whose skills refresh was skipped.')
+    )
+
+    class Meta:
+        """
+        Meta configuration for ProductSkillsRetry model.
+        """
+
+        verbose_name = 'Product Skills Retry'
+        verbose_name_plural = 'Product Skills Retries'
+        ordering = ('created', )
+        app_label = 'taxonomy'
+        unique_together = ('product_type', 'product_uuid')
+
+    def __str__(self):
+        """
+        Create a human-readable string representation of the object.
+        """
+        return '<ProductSkillsRetry product_type="{}" product_uuid="{}">'.format(self.product_type, self.product_uuid)
+
+    def __repr__(self):
+        """
+        Create a unique string representation of the object.
+        """
+        return '<ProductSkillsRetry id="{}" product_uuid="{}">'.format(self.id, self.product_uuid)
+
+
+class SkillTaxonomySnapshot(TimeStampedModel):
+    """
+    Details of a skill in a local snapshot of the complete EMSI skills taxonomy for a version of the skills API.
+
+    .. no_pii:
+    """
+
+    api_version = models.CharField(
+        max_length=32,
+        help_text=_('Version of the EMSI skills API the snapshot was downloaded from.')
+    )
+    external_id = models.CharField(
+        max_length=255,
+        help_text=_('The external identifier for the skill received from API.')
+    )
+    name = models.CharField(
+        max_length=255,
+        help_text=_('Name of the skill.')
+    )
+    description = models.TextField(
+        default='',
+        blank=True,
+        help_text=_('A short description for the skill received from API.')
+    )
+    category_id = models.IntegerField(
+        null=True,
+        blank=True,
+        help_text=_('Id of the category of the skill, empty if EMSI does not assign a valid category.')
+    )
+    category_name = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        help_text=_('Name of the category of the skill.')
+    )
+    subcategory_id = models.IntegerField(
+        null=True,
+        blank=True,
+        help_text=_('Id of the subcategory of the skill, empty if EMSI does not assign a valid subcategory.')
+    )
+    subcategory_name = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        help_text=_('Name of the subcategory of the skill.')
+    )
+
+    class Meta:
+        """
+        Meta configuration for SkillTaxonomySnapshot model.
+        """
+
+        verbose_name = 'Skill Taxonomy Snapshot'
+        verbose_name_plural = 'Skill Taxonomy Snapshot'
+        ordering = ('created', )
+        app_label = 'taxonomy'
+        unique_together = ('api_version', 'external_id')
+
+    def __str__(self):
+        """
+        Create a human-readable string representation of the object.
+        """
+        return '<SkillTaxonomySnapshot api_version="{}" external_id="{}">'.format(self.api_version, self.external_id)
+
+    def __repr__(self):
+        """
+        Create a unique string representation of the object.
+        """
+        return '<SkillTaxonomySnapshot id="{}" external_id="{}">'.format(self.id, self.external_id)
+
+
 class RefreshCourseSkillsConfig(SingletonModel):
     """
     Configuration for the refresh_course_skills management command.
@@ -650,6 +967,59 @@ class JobPostings(TimeStampedModel):
                 self.unique_companies)
 
 
+class TranslationCache(TimeStampedModel):
+    """
+    Translation of a piece of text, keyed by the hash of the text and the language it is translated to.
+
+    Translations of identical texts are shared by all the products through their `Translation` records.
+
+    .. no_pii:
+    """
+
+    source_text_hash = models.CharField(
+        max_length=64,
+        help_text=_('SHA-256 hash of the translated source text.')
+    )
+    translated_text_language = models.CharField(
+        max_length=8,
+        help_text=_('The language of the source text to which it is translated e:g English.')
+    )
+    source_language = models.CharField(
+        blank=True,
+        null=True,
+        max_length=8,
+        help_text=_('The original language of the source text before translation e:g Spanish.')
+    )
+    translated_text = models.TextField(
+        help_text=_('The translated source text.')
+    )
+
+    class Meta:
+        """
+        Meta configuration for TranslationCache model.
+        """
+
+        verbose_name = 'Translation Cache'
+        verbose_name_plural = 'Translation Cache'
+        ordering = ('created', )
+        app_label = 'taxonomy'
+        unique_together = ('source_text_hash', 'translated_text_language')
+
+    def __str__(self):
+        """
+        Create a human-readable string representation of the object.
+        """
+        return '<TranslationCache source_text_hash="{}" translated_text_language="{}">'.format(
+            self.source_text_hash, self.translated_text_language
+        )
+
+    def __repr__(self):
+        """
+        Create a unique string representation of the object.
+        """
+        return '<TranslationCache id="{}" source_text_hash="{}">'.format(self.id, self.source_text_hash)
+
+
 class Translation(TimeStampedModel):
     """
     Model to save translated descriptions.
@@ -710,6 +1080,23 @@ class Translation(TimeStampedModel):
         )
     )
 
+    translation_cache = models.ForeignKey(
+        TranslationCache,
+        blank=True,
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name='translations',
+        help_text=_('The shared translation of the source text.')
+    )
+
+    source_text_hash = models.CharField(
+        blank=True,
+        null=True,
+        max_length=64,
+        db_index=True,
+        help_text=_('SHA-256 hash of the source text, computed on save.')
+    )
+
     class Meta:
         """
         Metadata for the Translation model.
@@ -729,6 +1116,24 @@ class Translation(TimeStampedModel):
             self.translated_text_language
         )
 
+    @staticmethod
+    def get_source_text_hash(source_text):
+        """
+        Return the SHA-256 hash of the source text, None if there is no source text.
+        """
+        return hashlib.sha256(source_text.encode('utf-8')).hexdigest() if source_text is not None else None
+
+    def save(self, *args, **kwargs):
+        """
+        Save the translation along with the hash of its source text.
+        """
+        if 'source_text' not in self.get_deferred_fields():
+            self.source_text_hash = self.get_source_text_hash(self.source_text)
+        update_fields = kwargs.get('update_fields')
+        if update_fields and 'source_text' in update_fields:
+            kwargs['update_fields'] = set(update_fields).union({'source_text_hash'})
+        super().save(*args, **kwargs)
+
     def __repr__(self):
         """
         Create a unique string representation of the object.
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+Record and replay the traffic to the EMSI service and AWS Translate.
+
+Recording writes every request and response pair sent by `JwtEMSIApiClient` and `translate_text` to a gzip
+compressed archive. Replaying serves the recorded responses from a local stand-in instead of the remote services,
+so throughput experiments on `refresh_product_skills` are deterministic, run offline and do not use any quota.
+
+Example usage:
+    >>> with record_traffic('/tmp/emsi-traffic.jsonl.gz'):
+    ...     refresh_product_skills(courses, False, ProductTypes.Course)
+    >>> with replay_traffic('/tmp/emsi-traffic.jsonl.gz', latency=0.2):
+    ...     refresh_product_skills(courses, False, ProductTypes.Course)
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from contextlib import contextmanager, nullcontext
+from time import sleep
+from types import SimpleNamespace
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+from taxonomy.emsi import transport
+
+LOGGER = logging.getLogger(__name__)
+
+EMSI_SERVICE = 'emsi'
+TRANSLATE_SERVICE = 'translate'
+TRANSLATE_RESPONSE_FIELDS = ('TranslatedText', 'SourceLanguageCode', 'TargetLanguageCode')
+
+# Holds the archive being recorded or replayed, `None` while the traffic is sent to the remote services.
+_traffic = SimpleNamespace(archive=None)
+
+
+class TrafficArchive:
+    """
+    Request and response pairs of the remote services, stored in a gzip compressed JSON lines file.
+
+    Requests are matched by the hash of their canonical JSON form, the last response recorded for a request wins.
+    """
+
+    def __init__(self, path, replay=False, latency=0):
+        """
+        Initialize the archive.
+
+        Arguments:
+            path (str): Path of the archive file.
+            replay (bool): Serve responses from the archive instead of recording them.
+            latency (float): Number of seconds every replayed response is delayed by.
+        """
+        self.path = path
+        self.replay = replay
+        self.latency = latency
+        self._entries = {}
+        self._lock = threading.Lock()
+        if replay:
+            self._load()
+
+    @staticmethod
+    def _get_request_key(service, request):
+        """
+        Return the key identifying a request of the given service.
+        """
+        canonical_request = json.dumps({'service': service, 'request': request}, sort_keys=True)
+        return hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()
+
+    def _load(self):
+        """
+        Load the recorded request and response pairs from the archive file.
+        """
+        with gzip.open(self.path, 'rt', encoding='utf-8') as archive_file:
+            for line in archive_file:
+                entry = json.loads(line)
+                self._entries[self._get_request_key(entry['service'], entry['request'])] = entry
+
+    def save(self):
+        """
+        Write the recorded request and response pairs to the archive file.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+        with gzip.open(self.path, 'wt', encoding='utf-8') as archive_file:
+            for entry in entries:
+                archive_file.write(json.dumps(entry, sort_keys=True) + '\n')
+        LOGGER.info('[TAXONOMY] Recorded %s requests to %s.', len(entries), self.path)
+
+    def record(self, service, request, response):
+        """
+        Record the response of a request of the given service.
+        """
+        entry = {'service': service, 'request': request, 'response': response}
+        with self._lock:
+            self._entries[self._get_request_key(service, request)] = entry
+
+    def lookup(self, service, request):
+        """
+        Return the recorded response of a request of the given service after the injected latency.
+
+        Returns:
+            (dict): The recorded response, `None` if the request was not recorded.
+        """
+        if self.latency:
+            sleep(self.latency)
+        entry = self._entries.get(self._get_request_key(service, request))
+        if entry is None:
+            LOGGER.warning('[TAXONOMY] No recorded %s response found for request: %s', service, request)
+            return None
+        return entry['response']
+
+
+def _get_http_request(method, url, params=None, json_data=None):
+    """
+    Return the recorded form of an HTTP request, URLs are recorded without the host to match any EMSI base URL.
+
+    The query parameters of the URL and the `params` of the request are recorded together as sorted pairs, so
+    requests sending the same parameters match however the parameters are passed.
+    """
+    split_url = urlsplit(url)
+    query = parse_qsl(split_url.query, keep_blank_values=True)
+    for name, values in (params.items() if isinstance(params, dict) else params or ()):
+        # Like requests, a list of values sends the parameter once per value and `None` values are not sent.
+        values = values if isinstance(values, (list, tuple)) else [values]
+        query += [(str(name), str(value)) for value in values if value is not None]
+    return {'method': method.upper(), 'path': split_url.path, 'params': sorted(query), 'json': json_data}
+
+
+class RecordingSession(requests.Session):
+    """
+    Requests session that records the JSON responses it receives into a traffic archive.
+    """
+
+    def __init__(self, archive):
+        """
+        Initialize the session with the archive the traffic is recorded into.
+        """
+        super().__init__()
+        self.archive = archive
+
+    def request(self, method, url, *args, **kwargs):  # pylint: disable=arguments-differ
+        """
+        Send the request and record its response.
+        """
+        response = super().request(method, url, *args, **kwargs)
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        self.archive.record(
+            EMSI_SERVICE,
+            _get_http_request(method, url, kwargs.get('params'), kwargs.get('json')),
+            {'status': response.status_code, 'json': body},
+        )
+        return response
+
+
+class ReplaySession(requests.Session):
+    """
+    Requests session that serves the responses recorded in a traffic archive without sending any request.
+    """
+
+    def __init__(self, archive):
+        """
+        Initialize the session with the archive the traffic is replayed from.
+        """
+        super().__init__()
+        self.archive = archive
+
+    def request(self, method, url, *args, **kwargs):  # pylint: disable=arguments-differ
+        """
+        Return the recorded response of the request, a 404 response if it was not recorded.
+        """
+        recorded_response = self.archive.lookup(
+            EMSI_SERVICE, _get_http_request(method, url, kwargs.get('params'), kwargs.get('json'))
+        )
+        response = requests.Response()
+        response.url = url
+        response.request = requests.Request(method, url).prepare()
+        # pylint: disable=protected-access
+        if recorded_response is None:
+            response.status_code = 404
+            response._content = b''
+        else:
+            response.status_code = recorded_response['status']
+            response._content = json.dumps(recorded_response['json']).encode('utf-8')
+            response.headers['Content-Type'] = 'application/json'
+        return response
+
+
+class RecordingTranslateClient:
+    """
+    Wrapper around an AWS Translate client that records its translations into a traffic archive.
+    """
+
+    def __init__(self, client, archive):
+        """
+        Initialize the wrapper with the wrapped client and the archive the traffic is recorded into.
+        """
+        self.client = client
+        self.archive = archive
+
+    def translate_text(self, **kwargs):
+        """
+        Translate the text and record the translation.
+        """
+        result = self.client.translate_text(**kwargs)
+        self.archive.record(
+            TRANSLATE_SERVICE, kwargs, {field: result[field] for field in TRANSLATE_RESPONSE_FIELDS if field in result}
+        )
+        return result
+
+
+class ReplayTranslateClient:
+    """
+    Stand-in for an AWS Translate client that serves the translations recorded in a traffic archive.
+    """
+
+    def __init__(self, archive):
+        """
+        Initialize the stand-in with the archive the traffic is replayed from.
+        """
+        self.archive = archive
+
+    def translate_text(self, **kwargs):
+        """
+        Return the recorded translation of the text.
+
+        Raises:
+            (KeyError): If the translation of the text was not recorded.
+        """
+        result = self.archive.lookup(TRANSLATE_SERVICE, kwargs)
+        if result is None:
+            raise KeyError('No recorded translation found for the text.')
+        return result
+
+
+def get_traffic_archive():
+    """
+    Return the traffic archive being recorded or replayed, `None` if the traffic is sent to the remote services.
+    """
+    return _traffic.archive
+
+
+def is_replaying():
+    """
+    Return True if the traffic is replayed from an archive instead of being sent to the remote services.
+    """
+    return _traffic.archive is not None and _traffic.archive.replay
+
+
+def get_http_session():
+    """
+    Return the requests session for sending requests to the EMSI service.
+    """
+    archive = _traffic.archive
+    if archive is None:
+        return transport.create_session()
+    if archive.replay:
+        return ReplaySession(archive)
+    return transport.configure_session(RecordingSession(archive))
+
+
+def get_translate_client(create_client):
+    """
+    Return the AWS Translate client, wrapped for recording or replaced with a stand-in for replaying.
+
+    Arguments:
+        create_client (callable): Creates the AWS Translate client, it is not called while replaying.
+    """
+    archive = _traffic.archive
+    if archive is None:
+        return create_client()
+    if archive.replay:
+        return ReplayTranslateClient(archive)
+    return RecordingTranslateClient(create_client(), archive)
+
+
+@contextmanager
+def record_traffic(path):
+    """
+    Record the traffic to the EMSI service and AWS Translate into the archive at the given path.
+    """
+    archive = TrafficArchive(path)
+    _traffic.archive = archive
+    try:
+        yield archive
+    finally:
+        _traffic.archive = None
+        archive.save()
+
+
+@contextmanager
+def replay_traffic(path, latency=0):
+    """
+    Serve the traffic to the EMSI service and AWS Translate from the archive at the given path.
+
+    Arguments:
+        path (str): Path of an archive written by `record_traffic`.
+        latency (float): Number of seconds every replayed response is delayed by.
+    """
+    archive = TrafficArchive(path, replay=True, latency=latency)
+    _traffic.archive = archive
+    try:
+        yield archive
+    finally:
+        _traffic.archive = None
+
+
+def traffic_context(record_path=None, replay_path=None, latency=0):
+    """
+    Return the context manager recording or replaying the traffic as requested, a no-op context manager otherwise.
+
+    Arguments:
+        record_path (str): Path of the archive the traffic is recorded into.
+        replay_path (str): Path of the archive the traffic is replayed from.
+        latency (float): Number of seconds every replayed response is delayed by.
+    """
+    if replay_path:
+        return replay_traffic(replay_path, latency=latency)
+    if record_path:
+        return record_traffic(record_path)
+    return nullcontext()
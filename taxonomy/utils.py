@@ -2,32 +2,82 @@
 Utils for taxonomy.
 """
 import logging
-import time
+import re
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from datetime import timedelta
+from functools import lru_cache, partial
+from itertools import islice
 from typing import Union
+
 import boto3
+from botocore.config import Config as BotoConfig
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from edx_django_utils.cache import get_cache_key, TieredCache
 from edx_django_utils.cache.utils import hashlib
 
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from taxonomy import metrics, replay
 from taxonomy.choices import ProductTypes
 from taxonomy.constants import (
     AMAZON_TRANSLATION_ALLOWED_SIZE,
     AUTO,
+    EMSI_API_MAX_WORKERS,
+    EMSI_API_RATE_LIMIT_PER_SEC,
     ENGLISH,
+    ENGLISH_DETECTION_THRESHOLD,
+    REFRESH_PRODUCT_SKILLS_CHUNK_SIZE,
+    REFRESH_PRODUCT_SKILLS_MAX_FAILURES,
     REGION,
+    SKILL_TAXONOMY_SNAPSHOT_BATCH_SIZE,
+    SKILLS_EXTRACTION_CACHE_MAX_ENTRIES,
+    SKILLS_EXTRACTION_CACHE_TTL_SECONDS,
+    TRANSLATE_MAX_WORKERS,
+    TRANSLATE_PRODUCTS_MAX_WORKERS,
+    TRANSLATE_PRODUCTS_QUEUE_SIZE,
     TRANSLATE_SERVICE,
-    EMSI_API_RATE_LIMIT_PER_SEC
 )
 from taxonomy.emsi.client import EMSISkillsApiClient
-from taxonomy.exceptions import TaxonomyAPIError
-from taxonomy.models import CourseSkills, ProgramSkill, JobSkills, Skill, Translation, XBlockSkillData, XBlockSkills
+from taxonomy.emsi.parsers.skill_parsers import ExtractedSkill, ExtractedSkills, SkillDataParser, parse_extracted_skills
+from taxonomy.emsi.rate_limiter import TokenBucketRateLimiter
+from taxonomy.exceptions import CircuitOpenError, TaxonomyAPIError
+from taxonomy.language_detection import is_english
+from taxonomy.models import (
+    CourseSkills,
+    JobSkills,
+    ProductContentHash,
+    ProductSkillsRefreshFailure,
+    ProductSkillsRefreshRun,
+    ProductSkillsRetry,
+    ProgramSkill,
+    Skill,
+    SkillCategory,
+    SkillsExtractionCache,
+    SkillSubCategory,
+    SkillTaxonomySnapshot,
+    Translation,
+    TranslationCache,
+    XBlockSkillData,
+    XBlockSkills,
+)
 from taxonomy.serializers import SkillSerializer
 
 LOGGER = logging.getLogger(__name__)
+
+# A sentence along with the whitespace following it, or the text after the last sentence.
+SENTENCE_PATTERN = re.compile(r'[^.!?]*[.!?]+\s*|[^.!?]+')
+
 CACHE_TIMEOUT_COURSE_SKILLS_SECONDS = 60 * 60
 
 COURSE_METADATA_FIELDS_COMBINED = 'title:short_description:full_description'
+SKILL_DATA_FIELDS = ('name', 'info_url', 'type_id', 'type_name', 'description')
 
 
 def get_whitelisted_serialized_skills(key_or_uuid, product_type=ProductTypes.Course):
@@ -142,43 +192,135 @@ def update_skills_data(key_or_uuid, skill_external_id, confidence, skill_data, p
     LOGGER.info(f'{skill_model} {action} for key {key_or_uuid}')
 
 
-def process_skills_data(product, skills, should_commit_to_db, product_type, **kwargs):
+def _bulk_upsert_skills(extracted_skills):
+    """
+    Create or update `Skill` records in bulk.
+
+    Args:
+        extracted_skills (dict): A dictionary mapping skill external id to the `ExtractedSkill` received from the
+            external api.
+
+    Returns:
+        (dict): A dictionary mapping skill external id to the persisted `Skill` object.
+    """
+    external_ids = list(extracted_skills)
+    skills = Skill.objects.in_bulk(external_ids, field_name='external_id')
+    now = timezone.now()
+
+    skills_to_update = []
+    for external_id, skill in skills.items():
+        extracted_skill = extracted_skills[external_id]
+        if any(getattr(skill, field) != getattr(extracted_skill, field) for field in SKILL_DATA_FIELDS):
+            for field in SKILL_DATA_FIELDS:
+                setattr(skill, field, getattr(extracted_skill, field))
+            skill.modified = now
+            skills_to_update.append(skill)
+    if skills_to_update:
+        # Rows are locked in primary key order, so concurrent refreshes updating the same skills do not deadlock.
+        skills_to_update.sort(key=lambda skill: skill.pk)
+        Skill.objects.bulk_update(skills_to_update, fields=SKILL_DATA_FIELDS + ('modified', ))
+
+    new_external_ids = [external_id for external_id in external_ids if external_id not in skills]
+    if new_external_ids:
+        # `ignore_conflicts` guards against a concurrent worker creating the same skill in the meantime,
+        # it also means primary keys are not populated, so newly created skills are read back.
+        Skill.objects.bulk_create(
+            [
+                Skill(
+                    external_id=external_id,
+                    **{field: getattr(extracted_skills[external_id], field) for field in SKILL_DATA_FIELDS},
+                ) for external_id in new_external_ids
+            ],
+            ignore_conflicts=True,
+        )
+        skills.update(Skill.objects.in_bulk(new_external_ids, field_name='external_id'))
+    return skills
+
+
+def bulk_update_skills_data(key_or_uuid, extracted_skills, product_type, snapshot=None, **kwargs):
+    """
+    Persist all the skills data of a single Program, Course or XBlock in bulk.
+
+    `Skill` and product skill records are written with a fixed number of queries inside a single transaction,
+    regardless of the number of skills extracted for the product.
+
+    Args:
+        key_or_uuid (str): key or uuid of the object whose skills are to be updated.
+        extracted_skills (list): A list of `ExtractedSkill` records received from external api.
+        product_type (ProductTypes): type of product
+        snapshot (dict): Product skills snapshot returned by `get_product_skills_snapshot` containing this product,
+            it is loaded for the product if not provided. Ignored for XBlocks.
+        **kwargs: It should contain `hash_content` in case the product_type is XBlockSkills
+    """
+    if not extracted_skills:
+        return
+
+    extracted_skills = {extracted_skill.external_id: extracted_skill for extracted_skill in extracted_skills}
+    with transaction.atomic():
+        skills = _bulk_upsert_skills(extracted_skills)
+        if product_type == ProductTypes.XBlock:
+            xblock = _create_xblockskill_with_hash(key_or_uuid, kwargs.get('hash_content'))
+            key_or_uuid = xblock.id
+            product_type = ProductTypes.XBlockData
+            snapshot = None
+
+        skill_model, identifier = get_product_skill_model_and_identifier(product_type)
+        if snapshot is None or str(key_or_uuid) not in snapshot:
+            snapshot = get_product_skills_snapshot([key_or_uuid], product_type)
+        product_skills = snapshot[str(key_or_uuid)]
+        now = timezone.now()
+        product_skills_to_create, product_skills_to_update = [], []
+        for skill_external_id, skill in skills.items():
+            confidence = extracted_skills[skill_external_id].confidence
+            product_skill = product_skills.get(skill.id)
+            if product_skill is None:
+                product_skills_to_create.append(
+                    skill_model(**{identifier: key_or_uuid, 'skill': skill, 'confidence': confidence})
+                )
+            elif not product_skill.is_blacklisted and product_skill.confidence != confidence:
+                product_skill.confidence = confidence
+                product_skill.modified = now
+                product_skills_to_update.append(product_skill)
+
+        if product_skills_to_create:
+            skill_model.objects.bulk_create(product_skills_to_create, ignore_conflicts=True)
+        if product_skills_to_update:
+            skill_model.objects.bulk_update(product_skills_to_update, fields=('confidence', 'modified'))
+
+    LOGGER.info(
+        f'{skill_model} created: {len(product_skills_to_create)}, updated: {len(product_skills_to_update)} '
+        f'for key {key_or_uuid}'
+    )
+
+
+def process_skills_data(product, skills, should_commit_to_db, product_type, snapshot=None, **kwargs):
     """
     Process skills data returned by the EMSI service and update databased.
 
     Arguments:
         product (dict): Dictionary containing course or program data whose skills are being processed.
-        skills (dict): Course or Program skills data returned by the EMSI API.
+        skills (ExtractedSkills|dict): Course or Program skills returned by `EMSISkillsApiClient.get_product_skills`,
+            or the raw response of the EMSI API.
         should_commit_to_db (bool): Boolean indicating whether data should be committed to database.
         product_type (str): String indicating about the product type.
+        snapshot (dict): Optional product skills snapshot, see `get_product_skills_snapshot`.
         **kwargs: It should contain `hash_content` in case the product_type is XBlockSkills
     """
     failures = []
     key_or_uuid = get_product_identifier(product_type)
-    for record in skills['data']:
-        try:
-            confidence = float(record['confidence'])
-            skill = record['skill']
-            skill_external_id = skill['id']
-            skill_data = {
-                'name': skill['name'],
-                'info_url': skill['infoUrl'],
-                'type_id': skill['type']['id'],
-                'type_name': skill['type']['name'],
-                'description': skill['description']
-            }
-            if should_commit_to_db:
-                update_skills_data(
-                    product[key_or_uuid], skill_external_id, confidence, skill_data, product_type, **kwargs
-                )
-        except KeyError:
+    skills = parse_extracted_skills(skills)
+    for error in skills.errors:
+        if isinstance(error, KeyError):
             message = f'[TAXONOMY] Missing keys in skills data for key: {product[key_or_uuid]}'
             LOGGER.error(message)
             failures.append((product['uuid'], message))
-        except (ValueError, TypeError):
+        else:
             message = f'[TAXONOMY] Invalid type for `confidence` in skills for key: {product[key_or_uuid]}'
             LOGGER.error(message)
             failures.append((product[key_or_uuid], message))
+
+    if should_commit_to_db:
+        bulk_update_skills_data(product[key_or_uuid], skills.skills, product_type, snapshot=snapshot, **kwargs)
     return failures
 
 
@@ -214,34 +356,256 @@ def get_hash(text_data: str):
     return hashlib.md5(processed_text.encode()).hexdigest()
 
 
-def process_skill_attr_text(text_data: str, product_type: ProductTypes) -> dict:
+def process_skill_attr_text(text_data: str) -> dict:
     """
     Return metadata for text_data.
     """
     extra_data = {}
-    if product_type == ProductTypes.XBlock:
-        hash_content = get_hash(text_data)
-        if hash_content:
-            extra_data['hash_content'] = hash_content
+    hash_content = get_hash(text_data)
+    if hash_content:
+        extra_data['hash_content'] = hash_content
     return extra_data
 
 
+def get_normalized_text_hash(text_data: str) -> str:
+    """
+    Return SHA-256 hash of the given text with consecutive whitespace collapsed.
+    """
+    normalized_text = ' '.join(text_data.split())
+    return hashlib.sha256(normalized_text.encode('utf-8')).hexdigest()
+
+
+def get_skills_extraction_cache_ttl():
+    """
+    Return the number of seconds for which extracted skills are served from the skills extraction cache.
+    """
+    return getattr(settings, 'TAXONOMY_SKILLS_EXTRACTION_CACHE_TTL', SKILLS_EXTRACTION_CACHE_TTL_SECONDS)
+
+
+def get_skills_extraction_cache_max_entries():
+    """
+    Return the maximum number of entries kept in the skills extraction cache.
+    """
+    return getattr(settings, 'TAXONOMY_SKILLS_EXTRACTION_CACHE_MAX_ENTRIES', SKILLS_EXTRACTION_CACHE_MAX_ENTRIES)
+
+
+def _compact_skills_data(skills):
+    """
+    Serialize skills returned by the EMSI API as the fields of `ExtractedSkill`, which `process_skills_data` uses.
+    """
+    return [extracted_skill._asdict() for extracted_skill in parse_extracted_skills(skills).skills]
+
+
+def get_cached_product_skills(text_data):
+    """
+    Return the skills extracted earlier for the given text from the skills extraction cache.
+
+    Arguments:
+        text_data (str): Text whose skills need to be returned.
+
+    Returns:
+        (ExtractedSkills): Skills in the format returned by `EMSISkillsApiClient.get_product_skills`,
+            `None` if the text has no unexpired entry in the cache.
+    """
+    if not text_data:
+        return None
+    skills_data = SkillsExtractionCache.objects.filter(
+        text_hash=get_normalized_text_hash(text_data),
+        api_version=EMSISkillsApiClient.API_VERSION,
+        modified__gte=timezone.now() - timedelta(seconds=get_skills_extraction_cache_ttl()),
+    ).values_list('skills_data', flat=True).first()
+    if skills_data is None:
+        return None
+    return ExtractedSkills(skills=tuple(ExtractedSkill(**skill_data) for skill_data in skills_data))
+
+
+def cache_product_skills(text_data, skills):
+    """
+    Store the skills extracted for the given text in the skills extraction cache.
+
+    Arguments:
+        text_data (str): Text whose skills were extracted.
+        skills (ExtractedSkills): Skills returned by `EMSISkillsApiClient.get_product_skills` for the text.
+    """
+    if not text_data:
+        return
+    SkillsExtractionCache.objects.update_or_create(
+        text_hash=get_normalized_text_hash(text_data),
+        api_version=EMSISkillsApiClient.API_VERSION,
+        defaults={'skills_data': _compact_skills_data(skills)},
+    )
+
+
+def prune_skills_extraction_cache(ttl=None, max_entries=None):
+    """
+    Delete expired entries from the skills extraction cache and evict the least recently refreshed entries over size.
+
+    Arguments:
+        ttl (int): Number of seconds after which an entry expires, defaults to the configured value.
+        max_entries (int): Maximum number of entries to keep, defaults to the configured value.
+
+    Returns:
+        (int): Number of deleted entries.
+    """
+    ttl = get_skills_extraction_cache_ttl() if ttl is None else ttl
+    max_entries = get_skills_extraction_cache_max_entries() if max_entries is None else max_entries
+
+    deleted_count, _ = SkillsExtractionCache.objects.filter(
+        modified__lt=timezone.now() - timedelta(seconds=ttl)
+    ).delete()
+    cutoff = SkillsExtractionCache.objects.order_by('-modified', '-id').values_list(
+        'modified', 'id'
+    )[max_entries:max_entries + 1].first()
+    if cutoff:
+        cutoff_modified, cutoff_id = cutoff
+        evicted_count, _ = SkillsExtractionCache.objects.filter(
+            Q(modified__lt=cutoff_modified) | Q(modified=cutoff_modified, id__lte=cutoff_id)
+        ).delete()
+        deleted_count += evicted_count
+    return deleted_count
+
+
+def store_skill_taxonomy_snapshot(skills, api_version=EMSISkillsApiClient.API_VERSION):
+    """
+    Replace the local snapshot of the EMSI skills taxonomy for the given skills API version.
+
+    Category and subcategory data is parsed by `SkillDataParser`, so invalid categories are stored as empty.
+
+    Arguments:
+        skills (dict): All the skills as returned by `EMSISkillsApiClient.get_all_skills`.
+        api_version (str): Version of the EMSI skills API the skills were downloaded from.
+
+    Returns:
+        (int): The number of skills in the snapshot.
+    """
+    snapshot = []
+    for skill_data in skills['data']:
+        category_data = SkillDataParser(response={'data': skill_data}).get_skill_category_data()
+        category = category_data['category'] or {}
+        subcategory = category_data['subcategory'] or {}
+        snapshot.append(SkillTaxonomySnapshot(
+            api_version=api_version,
+            external_id=skill_data['id'],
+            name=skill_data['name'],
+            description=skill_data.get('description') or '',
+            category_id=category.get('id'),
+            category_name=category.get('name') or '',
+            subcategory_id=subcategory.get('id'),
+            subcategory_name=subcategory.get('name') or '',
+        ))
+
+    with transaction.atomic():
+        SkillTaxonomySnapshot.objects.filter(api_version=api_version).delete()
+        SkillTaxonomySnapshot.objects.bulk_create(snapshot, batch_size=SKILL_TAXONOMY_SNAPSHOT_BATCH_SIZE)
+    return len(snapshot)
+
+
+def has_skill_taxonomy_snapshot(api_version=EMSISkillsApiClient.API_VERSION):
+    """
+    Return True if a snapshot of the EMSI skills taxonomy is stored for the given skills API version.
+    """
+    return SkillTaxonomySnapshot.objects.filter(api_version=api_version).exists()
+
+
+def _get_or_create_in_bulk(model, objects_data):
+    """
+    Return the objects of the given model with the given ids, creating the missing ones in bulk.
+
+    Arguments:
+        model (Model): `SkillCategory` or `SkillSubCategory`.
+        objects_data (dict): A dictionary mapping object id to the fields the object is created with.
+
+    Returns:
+        (dict): A dictionary mapping object id to the object.
+    """
+    objects = model.objects.in_bulk(list(objects_data))
+    missing_ids = [object_id for object_id in objects_data if object_id not in objects]
+    if missing_ids:
+        model.objects.bulk_create(
+            [model(id=object_id, **objects_data[object_id]) for object_id in missing_ids],
+            ignore_conflicts=True,
+        )
+        objects.update(model.objects.in_bulk(missing_ids))
+    return objects
+
+
+def resolve_skill_details_from_snapshot(skills, api_version=EMSISkillsApiClient.API_VERSION):
+    """
+    Set the category, subcategory and missing description of the given skills from the skills taxonomy snapshot.
+
+    No request is sent to EMSI, skills missing from the snapshot, like skills added to EMSI after the snapshot was
+    downloaded, are left unchanged.
+
+    Arguments:
+        skills (iterable): `Skill` objects to resolve.
+        api_version (str): Version of the EMSI skills API of the snapshot.
+
+    Returns:
+        (int): The number of updated skills.
+    """
+    skills = list(skills)
+    snapshot = {
+        entry.external_id: entry for entry in SkillTaxonomySnapshot.objects.filter(
+            api_version=api_version, external_id__in=[skill.external_id for skill in skills],
+        )
+    }
+    categories = _get_or_create_in_bulk(SkillCategory, {
+        entry.category_id: {'name': entry.category_name}
+        for entry in snapshot.values() if entry.category_id is not None
+    })
+    subcategories = _get_or_create_in_bulk(SkillSubCategory, {
+        entry.subcategory_id: {'name': entry.subcategory_name, 'category_id': entry.category_id}
+        for entry in snapshot.values() if entry.category_id is not None and entry.subcategory_id is not None
+    })
+
+    now = timezone.now()
+    skills_to_update = []
+    for skill in skills:
+        entry = snapshot.get(skill.external_id)
+        if entry is None:
+            continue
+        category = categories.get(entry.category_id)
+        subcategory = subcategories.get(entry.subcategory_id) if category else None
+        # Like `fetch_skill_details`, only valid categories and subcategories overwrite the current ones.
+        details = (
+            category.id if category else skill.category_id,
+            subcategory.id if subcategory else skill.subcategory_id,
+            skill.description or entry.description,
+        )
+        if (skill.category_id, skill.subcategory_id, skill.description) != details:
+            skill.category_id, skill.subcategory_id, skill.description = details
+            skill.modified = now
+            skills_to_update.append(skill)
+
+    if skills_to_update:
+        Skill.objects.bulk_update(skills_to_update, fields=('category', 'subcategory', 'description', 'modified'))
+    return len(skills_to_update)
+
+
 def skip_product_processing(extra_data: dict, key_or_uuid: str, product_type: ProductTypes) -> bool:
     """
     Check whether to skip processing.
-    """
-    # currently only xblock text is checked
-    if product_type != ProductTypes.XBlock:
-        return False
 
+    Processing is skipped if the product has no text or if its text has not changed since the last time its skills
+    were extracted.
+    """
     if not extra_data:
         return True
-    model, identifier = get_product_skill_model_and_identifier(product_type)
-    skill_filter = {
-        identifier: key_or_uuid,
-        'auto_processed': True,
-        **extra_data,
-    }
+
+    if product_type == ProductTypes.XBlock:
+        model, identifier = get_product_skill_model_and_identifier(product_type)
+        skill_filter = {
+            identifier: key_or_uuid,
+            'auto_processed': True,
+            **extra_data,
+        }
+    else:
+        model = ProductContentHash
+        skill_filter = {
+            'product_type': product_type,
+            'product_identifier': str(key_or_uuid),
+            **extra_data,
+        }
     no_change = model.objects.filter(**skill_filter).exists()
     if no_change:
         # text with same hash exists, so skip further processing
@@ -249,6 +613,33 @@ def skip_product_processing(extra_data: dict, key_or_uuid: str, product_type: Pr
     return False
 
 
+def _update_product_content_hash(key_or_uuid, product_type, extra_data):
+    """
+    Store the hash of the course or program text whose skills were extracted.
+
+    XBlocks store the hash of their text in `XBlockSkills` instead.
+    """
+    ProductContentHash.objects.update_or_create(
+        product_type=product_type,
+        product_identifier=str(key_or_uuid),
+        defaults=extra_data,
+    )
+
+
+def get_product_skill_attr_val(product, product_type):
+    """
+    Return the text of the product whose skills are extracted.
+
+    Arguments:
+        product (dict): Metadata of the course, program or XBlock.
+        product_type (str): Type of the product.
+    """
+    skill_extraction_attr = get_translation_attr(product_type)
+    if product_type == ProductTypes.Course:
+        return get_course_metadata_fields_text(skill_extraction_attr, product)
+    return product[skill_extraction_attr]
+
+
 def _convert_product_to_dict(product: Union[dict, tuple]):
     """
     Convert product data to dict.
@@ -261,73 +652,540 @@ def _convert_product_to_dict(product: Union[dict, tuple]):
     return product_dict
 
 
-def refresh_product_skills(products, should_commit_to_db, product_type):
+def get_emsi_api_rate_limit():
     """
-    Refresh the skills associated with the provided products.
+    Return the sustained number of requests per second allowed to the EMSI skills API.
     """
-    all_failures = []
-    success_count = 0
-    skipped_count = 0
-    skill_extraction_attr, key_or_uuid = get_translation_attr(product_type), get_product_identifier(product_type)
+    return getattr(settings, 'EMSI_API_RATE_LIMIT_PER_SEC', EMSI_API_RATE_LIMIT_PER_SEC)
+
+
+def get_emsi_api_max_workers():
+    """
+    Return the maximum number of concurrent in-flight requests to the EMSI skills API.
+    """
+    return getattr(settings, 'EMSI_API_MAX_WORKERS', EMSI_API_MAX_WORKERS)
+
+
+def _extract_product_skills(client, rate_limiter, text_data):
+    """
+    Fetch skills for the given text from EMSI once the rate limiter allows it.
+    """
+    rate_limiter.acquire()
+    return client.get_product_skills(text_data)
+
+
+def _get_extracted_skills(product, extraction, product_type):
+    """
+    Wait for the skills extraction of a product to finish.
+
+    Arguments:
+        product (dict): Dictionary containing course or program data whose skills are being extracted.
+        extraction (Future): Future of the EMSI skills extraction call for the product.
+        product_type (str): String indicating about the product type.
+
+    Returns:
+        (tuple): The extracted skills along with a list of failures, the skills are None if the extraction failed.
+
+    Raises:
+        (CircuitOpenError): If the extraction was refused because the circuit of the EMSI endpoint is open.
+    """
+    key_or_uuid = get_product_identifier(product_type)
+    try:
+        return extraction.result(), []
+    except CircuitOpenError:
+        raise
+    except TaxonomyAPIError:
+        message = f'[TAXONOMY] API Error for key: {product[key_or_uuid]}'
+        LOGGER.error(message)
+        return None, [(product['uuid'], message)]
+
+
+def _process_extracted_skills(
+        product, skills, should_commit_to_db, product_type, extra_data, snapshot=None, text_to_cache=None
+):
+    """
+    Persist the skills extracted for a product.
+
+    The database writes of the product are made in a savepoint, so a failure only rolls back the writes of
+    the product when called inside a transaction.
+
+    Arguments:
+        product (dict): Dictionary containing course or program data whose skills are being processed.
+        skills (ExtractedSkills): Skills extracted for the product, see `_get_extracted_skills`.
+        should_commit_to_db (bool): Boolean indicating whether data should be committed to database.
+        product_type (str): String indicating about the product type.
+        extra_data (dict): Metadata of the product text returned by `process_skill_attr_text`.
+        snapshot (dict): Optional product skills snapshot, see `get_product_skills_snapshot`.
+        text_to_cache (str): Text sent to EMSI for the extraction, the extracted skills are stored in the skills
+            extraction cache for it on success.
+
+    Returns:
+        (list): A list of failures, empty if the skills of the product were processed successfully.
+    """
+    key_or_uuid = get_product_identifier(product_type)
+    try:
+        with transaction.atomic():
+            failures = process_skills_data(
+                product,
+                skills,
+                should_commit_to_db,
+                product_type,
+                snapshot=snapshot,
+                **extra_data
+            )
+            if failures:
+                LOGGER.info('[TAXONOMY] Skills data received from EMSI. Skills: [%s]', skills)
+            elif should_commit_to_db:
+                if product_type != ProductTypes.XBlock:
+                    _update_product_content_hash(product[key_or_uuid], product_type, extra_data)
+                if text_to_cache:
+                    cache_product_skills(text_to_cache, skills)
+        return failures
+    except Exception as ex:  # pylint: disable=broad-except
+        LOGGER.info('[TAXONOMY] Skills data received from EMSI. Skills: [%s]', skills)
+        message = f'[TAXONOMY] Exception for key: {product[key_or_uuid]} Error: {ex}'
+        LOGGER.error(message)
+        return [(product[key_or_uuid], message)]
+
+
+def get_product_shard_index(product_uuid, shard_count):
+    """
+    Return the index of the shard a product belongs to, based on a stable hash of its uuid.
+
+    Arguments:
+        product_uuid (str): UUID of the course or program.
+        shard_count (int): Number of shards the products are partitioned into.
+
+    Returns:
+        (int): Shard index in the range [0, shard_count).
+    """
+    digest = hashlib.md5(str(product_uuid).encode('utf-8')).hexdigest()
+    return int(digest, 16) % shard_count
+
+
+def get_product_skills_refresh_run(product_type, resume=False, shard_index=0, shard_count=1):
+    """
+    Return the run record for refreshing the skills of all the products of the given type.
+
+    Arguments:
+        product_type (str): String indicating about the product type.
+        resume (bool): Return the last incomplete run of the product type instead of starting a new run.
+        shard_index (int): Index of the shard of the products processed by the run.
+        shard_count (int): Number of shards the products are partitioned into.
+
+    Returns:
+        (ProductSkillsRefreshRun): The last incomplete run if `resume` is set and there is one, a new run otherwise.
+    """
+    if resume:
+        refresh_run = ProductSkillsRefreshRun.objects.filter(
+            product_type=product_type, shard_index=shard_index, shard_count=shard_count, is_completed=False
+        ).order_by('-created', '-id').first()
+        if refresh_run is not None:
+            return refresh_run
+    return ProductSkillsRefreshRun.objects.create(
+        product_type=product_type, shard_index=shard_index, shard_count=shard_count
+    )
+
+
+def prune_product_skills_refresh_runs(refresh_run):
+    """
+    Delete the runs of the same product type and shard started before the given completed run, with their failures.
+
+    The latest completed run of a shard supersedes the runs started before it, whether they completed or not, so only
+    the runs from the latest completed one onwards are kept.
+
+    Arguments:
+        refresh_run (ProductSkillsRefreshRun): The run that has just completed.
+    """
+    ProductSkillsRefreshRun.objects.filter(
+        product_type=refresh_run.product_type,
+        shard_index=refresh_run.shard_index,
+        shard_count=refresh_run.shard_count,
+        id__lt=refresh_run.id,
+    ).delete()
+
+
+def get_product_skills_refresh_summary(product_type, shard_count=1):
+    """
+    Aggregate the counts of the latest run of every shard of a sharded product skills refresh.
+
+    Arguments:
+        product_type (str): String indicating about the product type.
+        shard_count (int): Number of shards the products were partitioned into.
+
+    Returns:
+        (dict): Aggregated success, skipped and failure counts along with the shards whose latest run has not
+            completed, shards without any run are reported as pending.
+    """
+    latest_runs = {}
+    refresh_runs = ProductSkillsRefreshRun.objects.filter(
+        product_type=product_type, shard_count=shard_count
+    ).order_by('-created', '-id')
+    for refresh_run in refresh_runs:
+        latest_runs.setdefault(refresh_run.shard_index, refresh_run)
+
+    return {
+        'success_count': sum(refresh_run.success_count for refresh_run in latest_runs.values()),
+        'skipped_count': sum(refresh_run.skipped_count for refresh_run in latest_runs.values()),
+        'failure_count': sum(refresh_run.failure_count for refresh_run in latest_runs.values()),
+        'pending_shards': [
+            shard_index for shard_index in range(shard_count)
+            if shard_index not in latest_runs or not latest_runs[shard_index].is_completed
+        ],
+    }
+
+
+def get_refresh_product_skills_chunk_size():
+    """
+    Return the number of products refreshed and committed together by `refresh_product_skills`.
+    """
+    return getattr(settings, 'TAXONOMY_REFRESH_PRODUCT_SKILLS_CHUNK_SIZE', REFRESH_PRODUCT_SKILLS_CHUNK_SIZE)
+
+
+def get_refresh_product_skills_max_failures():
+    """
+    Return the maximum number of failures kept in memory and recorded per run by `refresh_product_skills`.
+    """
+    return getattr(settings, 'TAXONOMY_REFRESH_PRODUCT_SKILLS_MAX_FAILURES', REFRESH_PRODUCT_SKILLS_MAX_FAILURES)
+
+
+def _chunked(iterable, chunk_size):
+    """
+    Yield lists of up to `chunk_size` consecutive items of the iterable.
+    """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def record_product_skills_refresh_failures(refresh_run, failures):
+    """
+    Store the failures of a product skills refresh run, up to the configured maximum number of failures per run.
+
+    Arguments:
+        refresh_run (ProductSkillsRefreshRun): The run whose failures are recorded.
+        failures (list): A list of `(product_identifier, message)` tuples.
+    """
+    remaining = get_refresh_product_skills_max_failures() - refresh_run.failures.count()
+    if remaining > 0 and failures:
+        ProductSkillsRefreshFailure.objects.bulk_create([
+            ProductSkillsRefreshFailure(
+                refresh_run=refresh_run, product_identifier=str(product_identifier), message=message
+            )
+            for product_identifier, message in failures[:remaining]
+        ])
+
+
+def queue_product_skills_retries(product_type, product_uuids):
+    """
+    Queue the given products to have their skills refreshed later, products already in the queue are kept once.
+    """
+    ProductSkillsRetry.objects.bulk_create(
+        [ProductSkillsRetry(product_type=product_type, product_uuid=str(uuid)) for uuid in product_uuids],
+        ignore_conflicts=True,
+    )
+
+
+def get_product_skills_retries(product_type):
+    """
+    Return the uuids of the products of the given type queued for retry.
+
+    Products stay in the queue until they are refreshed, see the `dequeue_retries` argument of
+    `refresh_product_skills`, so queued products are not lost if the retry is interrupted.
+    """
+    retries = ProductSkillsRetry.objects.filter(product_type=product_type).order_by('id')
+    return list(retries.values_list('product_uuid', flat=True))
+
+
+def dequeue_product_skills_retries(product_type, product_uuids):
+    """
+    Remove the given products from the retry queue.
+    """
+    ProductSkillsRetry.objects.filter(
+        product_type=product_type, product_uuid__in=[str(uuid) for uuid in product_uuids]
+    ).delete()
 
-    client = EMSISkillsApiClient()
 
-    for index, product in enumerate(products, start=1):
+def _get_refresh_candidates(chunk, product_type, force, shard_index, shard_count):
+    """
+    Sort the products of a chunk into the products whose skills need to be extracted and the products skipped.
+
+    Arguments:
+        chunk (list): Pairs of the position and the metadata of every product of the chunk.
+        product_type (str): String indicating about the product type.
+        force (bool): Extract the skills of the products even if their text has not changed.
+        shard_index (int): Index of the shard of the products to refresh.
+        shard_count (int): Number of shards the products are partitioned into.
+
+    Returns:
+        (tuple): The candidates, as tuples of a product, the value of its skill attribute and its metadata, the
+            skipped products whose skills are up to date and the number of skipped products.
+    """
+    key_or_uuid = get_product_identifier(product_type)
+    candidates = []
+    up_to_date_products = []
+    skipped_count = 0
+    # Content of products submitted in this chunk, results of the chunk are not persisted yet
+    # so `skip_product_processing` can not detect an unchanged product that is repeated within the chunk.
+    submitted_content = set()
+    for __, product in chunk:
         product = _convert_product_to_dict(product)
         if product is None:
             skipped_count += 1
             continue
-        if product_type == ProductTypes.Course:
-            skill_attr_val = get_course_metadata_fields_text(skill_extraction_attr, product)
-        else:
-            skill_attr_val = product[skill_extraction_attr]
-        if skill_attr_val:
-            # get metadata of skill_attr_val
-            extra_data = process_skill_attr_text(skill_attr_val, product_type)
-            if skip_product_processing(extra_data, product[key_or_uuid], product_type):
-                skipped_count += 1
-                continue
-            # TODO: Skip translation for xblock text till we find better way to
-            # handle huge amounts of text
-            if product_type == ProductTypes.XBlock:
-                # TODO: make sure that skill_attr_val is in english
-                translated_skill_attr = skill_attr_val
+        if shard_count > 1 and get_product_shard_index(product['uuid'], shard_count) != shard_index:
+            continue
+        skill_attr_val = get_product_skill_attr_val(product, product_type)
+        if not skill_attr_val:
+            skipped_count += 1
+            up_to_date_products.append(product)
+            continue
+
+        # get metadata of skill_attr_val
+        extra_data = process_skill_attr_text(skill_attr_val)
+        content_key = (product[key_or_uuid], tuple(sorted(extra_data.items())))
+        if not extra_data or content_key in submitted_content or \
+                (not force and skip_product_processing(extra_data, product[key_or_uuid], product_type)):
+            skipped_count += 1
+            if content_key not in submitted_content:
+                up_to_date_products.append(product)
+            continue
+        submitted_content.add(content_key)
+        candidates.append((product, skill_attr_val, extra_data))
+    return candidates, up_to_date_products, skipped_count
+
+
+def _translate_candidates(candidates, product_type):
+    """
+    Return an iterator over the translations of the candidates of a chunk, in the same order as the candidates.
+    """
+    key_or_uuid = get_product_identifier(product_type)
+    products_texts = [(product[key_or_uuid], skill_attr_val) for product, skill_attr_val, __ in candidates]
+    # TODO: Skip translation for xblock text till we find better way to
+    # handle huge amounts of text
+    if product_type == ProductTypes.XBlock:
+        # TODO: make sure that skill_attr_val is in english
+        return ((identifier, text, text) for identifier, text in products_texts)
+    # Texts are translated ahead by the translation stage while the extractions are submitted.
+    return translate_products(products_texts, product_type)
+
+
+def _submit_extractions(executor, client, rate_limiter, candidates, product_type, force):
+    """
+    Translate the texts of the candidates of a chunk and submit their skills extractions to the executor.
+
+    Texts found in the skills extraction cache are not sent to EMSI. Once the circuit breaker of the EMSI skills
+    extraction endpoint is open, the remaining candidates are neither translated nor submitted.
+
+    Returns:
+        (tuple): The extractions, as tuples of a product, the future of its extraction, its metadata and the text
+            to cache on success, and the products to retry later.
+    """
+    extraction_circuit_breaker = client.get_circuit_breaker('get_product_skills')
+    extractions = []
+    retry_products = []
+    # The translation of a candidate is only requested once it is known to be submitted, so candidates queued for
+    # retry are not translated.
+    with closing(_translate_candidates(candidates, product_type)) as translations:
+        for position, (product, __, extra_data) in enumerate(candidates):
+            if extraction_circuit_breaker.is_open:
+                retry_products += [product for product, __, __ in candidates[position:]]
+                break
+
+            __, __, translated_skill_attr = next(translations)
+            cached_skills = None if force else get_cached_product_skills(translated_skill_attr)
+            if cached_skills is None:
+                extraction = executor.submit(_extract_product_skills, client, rate_limiter, translated_skill_attr)
+                extractions.append((product, extraction, extra_data, translated_skill_attr))
             else:
-                translated_skill_attr = get_translated_skill_attribute_val(
-                    product[key_or_uuid], skill_attr_val, product_type
-                )
-            try:
-                # EMSI only allows 5 requests/sec
-                # We need to add one sec delay after every 5 requests to prevent 429 errors
-                if index % EMSI_API_RATE_LIMIT_PER_SEC == 0:
-                    time.sleep(1)  # sleep for 1 second
-                skills = client.get_product_skills(translated_skill_attr)
-            except TaxonomyAPIError:
-                message = f'[TAXONOMY] API Error for key: {product[key_or_uuid]}'
-                LOGGER.error(message)
-                all_failures.append((product['uuid'], message))
-                continue
-
-            try:
-                failures = process_skills_data(
+                extraction = Future()
+                extraction.set_result(cached_skills)
+                extractions.append((product, extraction, extra_data, None))
+    return extractions, retry_products
+
+
+def _await_extractions(extractions, product_type):
+    """
+    Wait for the skills extractions of a chunk.
+
+    Returns:
+        (tuple): The extracted skills, as tuples of a product, its skills or None if the extraction failed, the
+            failures, its metadata and the text to cache, and the products refused because the circuit is open.
+    """
+    extracted = []
+    retry_products = []
+    for product, extraction, extra_data, text_to_cache in extractions:
+        try:
+            skills, failures = _get_extracted_skills(product, extraction, product_type)
+        except CircuitOpenError:
+            retry_products.append(product)
+            continue
+        extracted.append((product, skills, failures, extra_data, text_to_cache))
+    return extracted, retry_products
+
+
+def _commit_extracted_skills(extracted, up_to_date_products, should_commit_to_db, product_type, dequeue_retries):
+    """
+    Write the extracted skills of a chunk in a single transaction.
+
+    The product skills of the chunk are loaded in one query before the transaction is opened. If `dequeue_retries`
+    is set, the refreshed products and the up to date products are removed from the retry queue in the transaction.
+
+    Returns:
+        (tuple): The number of products refreshed successfully and the list of failures.
+    """
+    key_or_uuid = get_product_identifier(product_type)
+    snapshot = None
+    extracted_keys = [product[key_or_uuid] for product, skills, __, __, __ in extracted if skills is not None]
+    if should_commit_to_db and extracted_keys and product_type != ProductTypes.XBlock:
+        snapshot = get_product_skills_snapshot(extracted_keys, product_type)
+
+    chunk_failures = []
+    # Products whose skills are up to date once the chunk is committed.
+    refreshed_products = list(up_to_date_products)
+    with transaction.atomic():
+        for product, skills, failures, extra_data, text_to_cache in extracted:
+            if skills is not None:
+                failures = _process_extracted_skills(
                     product,
                     skills,
                     should_commit_to_db,
                     product_type,
-                    **extra_data
+                    extra_data,
+                    snapshot=snapshot,
+                    text_to_cache=text_to_cache,
                 )
-                if failures:
-                    LOGGER.info('[TAXONOMY] Skills data received from EMSI. Skills: [%s]', skills)
-                    all_failures += failures
-                else:
-                    success_count += 1
-            except Exception as ex:  # pylint: disable=broad-except
-                LOGGER.info('[TAXONOMY] Skills data received from EMSI. Skills: [%s]', skills)
-                message = f'[TAXONOMY] Exception for key: {product[key_or_uuid]} Error: {ex}'
-                LOGGER.error(message)
-                all_failures.append((product[key_or_uuid], message))
+                if snapshot is not None:
+                    # A product repeated within the chunk is reloaded instead of reading stale product skills.
+                    snapshot.pop(str(product[key_or_uuid]), None)
+            if failures:
+                chunk_failures += failures
+            else:
+                refreshed_products.append(product)
+        if dequeue_retries and should_commit_to_db and refreshed_products:
+            dequeue_product_skills_retries(product_type, [product['uuid'] for product in refreshed_products])
+    return len(refreshed_products) - len(up_to_date_products), chunk_failures
+
+
+def _record_refresh_failures_and_retries(refresh_run, product_type, failures, retry_products, should_commit_to_db):
+    """
+    Record the failures of a chunk against the refresh run, if any, and queue the products to retry.
+    """
+    if refresh_run is not None:
+        record_product_skills_refresh_failures(refresh_run, failures)
+    if retry_products and should_commit_to_db:
+        queue_product_skills_retries(product_type, [product['uuid'] for product in retry_products])
+
+
+def _save_refresh_run_progress(refresh_run, cursor, counts, is_completed=False):
+    """
+    Checkpoint the cursor and the success, skipped and failure counts of the refresh run, if any.
+    """
+    if refresh_run is None:
+        return
+    refresh_run.cursor = cursor
+    refresh_run.success_count = counts['success_count']
+    refresh_run.skipped_count = counts['skipped_count']
+    refresh_run.failure_count = counts['failure_count']
+    refresh_run.is_completed = is_completed
+    refresh_run.save()
+
+
+def refresh_product_skills(
+        products, should_commit_to_db, product_type, force=False, refresh_run=None, shard_index=0, shard_count=1,
+        dequeue_retries=False,
+):
+    """
+    Refresh the skills associated with the provided products.
+
+    Products whose text has not changed since the last time their skills were extracted are skipped, unless `force`
+    is set.
+
+    Products are consumed in chunks, the skills of each chunk are written in a single transaction with the product
+    skills of the whole chunk loaded in one query. The transaction is only opened once all the extractions of the
+    chunk are done, and `Skill` rows are updated in primary key order, so concurrent refreshes hold their row locks
+    briefly and always take them in the same order. Only the first failures are kept in memory for the final log,
+    so memory use does not grow with the number of products.
+
+    If `refresh_run` is provided, the products before its cursor are skipped without being processed, the cursor
+    is checkpointed after every chunk and failures are recorded against the run, so an interrupted run can be
+    resumed later. The products must be provided in the same order every time for the cursor to be meaningful.
+    Once the run completes, the earlier runs of its shard are pruned, see `prune_product_skills_refresh_runs`.
+
+    If `shard_count` is more than one, only the products whose uuid hashes to `shard_index` are processed so that
+    several workers can split the products between them.
+
+    Once the circuit breaker of the EMSI skills extraction endpoint opens, the remaining products of the chunk are
+    queued for retry, see `get_product_skills_retries`, and the run ends after the chunk without being completed.
+    If `dequeue_retries` is set, the products refreshed or skipped are removed from the retry queue in the
+    transaction of their chunk, while the products that failed stay queued.
+
+    Skills extraction calls are sent to EMSI from a bounded pool of workers, throttled by a token bucket shared by
+    all the workers, while translation and database writes happen on the calling thread. Extraction results are
+    processed in the same order as the products. Texts found in the skills extraction cache are not sent to EMSI.
+    Texts are translated ahead of the extraction by `translate_products`, with their own pool of workers.
+    """
+    reported_failures = []
+    counts = Counter()
+    initial_counts = Counter()
+    retry_count = 0
+    max_failures = get_refresh_product_skills_max_failures()
+
+    client = EMSISkillsApiClient()
+    extraction_circuit_breaker = client.get_circuit_breaker('get_product_skills')
+    rate_limiter = TokenBucketRateLimiter(get_emsi_api_rate_limit())
+    start_position = 0
+    if refresh_run is not None:
+        start_position = refresh_run.cursor
+        products = islice(products, start_position, None)
+        initial_counts.update(
+            success_count=refresh_run.success_count,
+            skipped_count=refresh_run.skipped_count,
+            failure_count=refresh_run.failure_count,
+        )
+
+    cursor = start_position
+    ended_early = False
+    with ThreadPoolExecutor(max_workers=get_emsi_api_max_workers()) as executor:
+        for chunk in _chunked(enumerate(products, start=start_position), get_refresh_product_skills_chunk_size()):
+            candidates, up_to_date_products, skipped_count = _get_refresh_candidates(
+                chunk, product_type, force, shard_index, shard_count
+            )
+            extractions, retry_products = _submit_extractions(
+                executor, client, rate_limiter, candidates, product_type, force
+            )
+            # Every extraction of the chunk is waited for before the chunk transaction is opened, so the transaction
+            # only spans the database writes and does not hold row locks while EMSI responds.
+            extracted, refused_products = _await_extractions(extractions, product_type)
+            retry_products += refused_products
+            success_count, chunk_failures = _commit_extracted_skills(
+                extracted, up_to_date_products, should_commit_to_db, product_type, dequeue_retries
+            )
+
+            counts.update(success_count=success_count, skipped_count=skipped_count, failure_count=len(chunk_failures))
+            reported_failures += chunk_failures[:max_failures - len(reported_failures)]
+            _record_refresh_failures_and_retries(
+                refresh_run, product_type, chunk_failures, retry_products, should_commit_to_db
+            )
+            retry_count += len(retry_products)
+            cursor = chunk[-1][0] + 1
+            _save_refresh_run_progress(refresh_run, cursor, initial_counts + counts)
+            if extraction_circuit_breaker.is_open:
+                ended_early = True
+                break
         else:
-            skipped_count += 1
+            _save_refresh_run_progress(refresh_run, cursor, initial_counts + counts, is_completed=True)
+            if refresh_run is not None:
+                prune_product_skills_refresh_runs(refresh_run)
+
+    if ended_early:
+        LOGGER.warning(
+            '[TAXONOMY] Refresh %s skills process ended early because EMSI is failing. Queued for retry: %s',
+            product_type,
+            retry_count,
+        )
 
     LOGGER.info(
         '[TAXONOMY] Refresh %s skills process completed. \n'
@@ -336,12 +1194,12 @@ def refresh_product_skills(products, should_commit_to_db, product_type):
         'Total %s Skipped: %s \n'
         'Total Failures: %s \n',
         product_type,
-        all_failures,
+        reported_failures,
         product_type,
-        success_count,
+        counts['success_count'],
         product_type,
-        skipped_count,
-        len(all_failures),
+        counts['skipped_count'],
+        counts['failure_count'],
     )
 
 
@@ -373,7 +1231,33 @@ def remove_course_skill_from_blacklist(course_key, skill_id):
     ).update(is_blacklisted=False)
 
 
-def is_skill_blacklisted(key_or_uuid, skill_id, product_type):
+def get_product_skills_snapshot(keys_or_uuids, product_type, prefetch_skills=True):
+    """
+    Load all the product skills, whitelisted as well as blacklisted, of the given products with a single query.
+
+    The returned snapshot can be passed to `is_skill_blacklisted` and `get_whitelisted_product_skills` so that
+    both views of a product are served from memory. It reflects the state of the database at the time of the read.
+
+    Arguments:
+        keys_or_uuids (list): Keys or uuids of the products whose skills need to be loaded.
+        product_type (str): String indicating about the product type.
+        prefetch_skills (bool): If True, Prefetch related skills in a single query using Django's select_related.
+
+    Returns:
+        (dict): A dictionary mapping the key or uuid (as string) of every product to a dictionary of its
+            product skills keyed by skill id.
+    """
+    skill_model, identifier = get_product_skill_model_and_identifier(product_type)
+    snapshot = {str(key_or_uuid): {} for key_or_uuid in keys_or_uuids}
+    qs = skill_model.objects.filter(**{f'{identifier}__in': list(keys_or_uuids)})
+    if prefetch_skills:
+        qs = qs.select_related('skill')
+    for product_skill in qs:
+        snapshot[str(getattr(product_skill, identifier))][product_skill.skill_id] = product_skill
+    return snapshot
+
+
+def is_skill_blacklisted(key_or_uuid, skill_id, product_type, snapshot=None):
     """
     Return the black listed status of a course or program skill.
 
@@ -381,10 +1265,16 @@ def is_skill_blacklisted(key_or_uuid, skill_id, product_type):
         key_or_uuid: CourseKey, UsageKey or ProgramUUID object whose skill need to be checked.
         skill_id (int): Primary key identifier of the skill that need to be checked.
         is_programs(bool): Boolean indicating which Skill Model would be selected.
+        snapshot (dict): Optional snapshot returned by `get_product_skills_snapshot`, if provided
+            the status is checked in memory without querying the database.
 
     Returns:
         (bool): True if skill (identified by the arguments) is black-listed, False otherwise.
     """
+    if snapshot is not None:
+        product_skill = snapshot.get(str(key_or_uuid), {}).get(skill_id)
+        return product_skill is not None and product_skill.is_blacklisted
+
     skill_model, identifier = get_product_skill_model_and_identifier(product_type)
     kwargs = {
         identifier: key_or_uuid,
@@ -394,7 +1284,7 @@ def is_skill_blacklisted(key_or_uuid, skill_id, product_type):
     return skill_model.objects.filter(**kwargs).exists()
 
 
-def get_whitelisted_product_skills(key_or_uuid, product_type=ProductTypes.Course, prefetch_skills=True):
+def get_whitelisted_product_skills(key_or_uuid, product_type=ProductTypes.Course, prefetch_skills=True, snapshot=None):
     """
     Get all the product skills that are not blacklisted.
 
@@ -402,10 +1292,18 @@ def get_whitelisted_product_skills(key_or_uuid, product_type=ProductTypes.Course
         key_or_uuid (str): Key or uuid of the product whose skills need to be returned.
         product_type (str): String indicating about the product type.
         prefetch_skills (bool): If True, Prefetch related skills in a single query using Django's select_related.
+        snapshot (dict): Optional snapshot returned by `get_product_skills_snapshot`, if provided
+            the product skills are read from it instead of the database.
 
     Returns:
         (list<CourseSkills/ProgramSkills>): A list of all the product skills that are not blacklisted.
     """
+    if snapshot is not None:
+        return [
+            product_skill for product_skill in snapshot.get(str(key_or_uuid), {}).values()
+            if not product_skill.is_blacklisted
+        ]
+
     skill_model, identifier = get_product_skill_model_and_identifier(product_type)
     kwargs = {
         identifier: key_or_uuid,
@@ -466,70 +1364,347 @@ def get_course_jobs(course_key, product_type=ProductTypes.Course):
     return data
 
 
-def get_translated_skill_attribute_val(key_or_uuid, skill_attr_val, product_type):
+def get_translated_skill_attribute_val(key_or_uuid, skill_attr_val, product_type, get_translation_result=None):
     """
     Return translated skill attribute value either for a course or a program.
 
     Create translation for provided skill attribute if translation object doesn't already exist.
      OR update translation if skill attribute changed from previous description in translation and
-      return the translated skill attribute.
+      return the translated skill attribute. Identical texts are translated once and shared through the
+      translation cache.
 
     Arguments:
         key_or_uuid (str): Key or uuid of the course or program needs to be translated.
         skill_attr_val (str): Value of the skill attribute that needs to be translated.
         product_type (str):
+        get_translation_result (callable): Called to get the result of `translate_source_text` for the value if it
+            is neither translated nor cached yet, defaults to translating the value on the calling thread.
 
     Returns:
         str: Translated skill attribute value.
     """
     source_model_name, source_model_field = product_type, get_translation_attr(product_type)
 
+    # The source text is compared by its hash, so it is never loaded.
     translation = Translation.objects.filter(
         source_model_name=source_model_name,
         source_model_field=source_model_field,
         source_record_identifier=key_or_uuid
-    ).first()
-    if translation:
-        if translation.source_text != skill_attr_val:
-            if (len(skill_attr_val.encode('utf-8'))) < AMAZON_TRANSLATION_ALLOWED_SIZE:
-                result = translate_text(key_or_uuid, skill_attr_val, AUTO, ENGLISH)
-            else:
-                result = apply_batching_to_translate_large_text(key_or_uuid, skill_attr_val)
-            if not result['TranslatedText']:
-                return skill_attr_val
-            if result['SourceLanguageCode'] == ENGLISH:
-                translation.translated_text = skill_attr_val
-            else:
-                translation.translated_text = result['TranslatedText']
-            LOGGER.info(f'[TAXONOMY] Translate {product_type} updated for key: {key_or_uuid}')
-            translation.source_text = skill_attr_val
-            translation.source_language = result['SourceLanguageCode']
-            translation.save()
+    ).only('id', 'source_text_hash', 'translated_text').first()
+    if translation and translation.source_text_hash == Translation.get_source_text_hash(skill_attr_val):
         return translation.translated_text
-    if (len(skill_attr_val.encode('utf-8'))) < AMAZON_TRANSLATION_ALLOWED_SIZE:
-        result = translate_text(key_or_uuid, skill_attr_val, AUTO, ENGLISH)
-    else:
-        result = apply_batching_to_translate_large_text(key_or_uuid, skill_attr_val)
-    if not result['TranslatedText']:
+
+    translation_cache = get_translation_cache_entry(key_or_uuid, skill_attr_val, get_translation_result)
+    if translation_cache is None:
         return skill_attr_val
-    if result['SourceLanguageCode'] == ENGLISH:
-        translated_text = skill_attr_val
-    else:
-        translated_text = result['TranslatedText']
+
+    if translation:
+        translation.source_text = skill_attr_val
+        translation.source_language = translation_cache.source_language
+        translation.translated_text = translation_cache.translated_text
+        translation.translation_cache = translation_cache
+        translation.save(
+            update_fields=['source_text', 'source_language', 'translated_text', 'translation_cache']
+        )
+        LOGGER.info('[TAXONOMY] Translate %s updated for key: %s', product_type, key_or_uuid)
+        return translation.translated_text
 
     translation = Translation.objects.create(
         source_model_name=source_model_name,
         source_model_field=source_model_field,
         source_record_identifier=key_or_uuid,
         source_text=skill_attr_val,
-        translated_text=translated_text,
+        translated_text=translation_cache.translated_text,
         translated_text_language=ENGLISH,
-        source_language=result['SourceLanguageCode'],
+        source_language=translation_cache.source_language,
+        translation_cache=translation_cache,
     )
-    LOGGER.info(f'[TAXONOMY] Translate {product_type} created for key: {key_or_uuid}')
+    LOGGER.info('[TAXONOMY] Translate %s created for key: %s', product_type, key_or_uuid)
     return translation.translated_text
 
 
+def get_unchanged_translations(products_texts, product_type):
+    """
+    Return the stored translations of the products whose text has not changed since it was translated.
+
+    The translations of all the products are looked up in a single query on the hash of their source text.
+
+    Arguments:
+        products_texts (list): Pairs of the key or uuid of a product and the value of its skill attribute.
+        product_type (str): Type of the products.
+
+    Returns:
+        (dict): Translated skill attribute values keyed by the pairs whose stored translation is up to date.
+    """
+    source_text_hashes = {
+        (key_or_uuid, skill_attr_val): Translation.get_source_text_hash(skill_attr_val)
+        for key_or_uuid, skill_attr_val in products_texts
+    }
+    if not source_text_hashes:
+        return {}
+    translated_texts = {
+        (key_or_uuid, source_text_hash): translated_text
+        for key_or_uuid, source_text_hash, translated_text in Translation.objects.filter(
+            source_model_name=product_type,
+            source_model_field=get_translation_attr(product_type),
+            source_record_identifier__in={key_or_uuid for key_or_uuid, __ in source_text_hashes},
+            source_text_hash__in=set(source_text_hashes.values()),
+        ).values_list('source_record_identifier', 'source_text_hash', 'translated_text')
+    }
+    return {
+        (key_or_uuid, skill_attr_val): translated_texts[key_or_uuid, source_text_hash]
+        for (key_or_uuid, skill_attr_val), source_text_hash in source_text_hashes.items()
+        if (key_or_uuid, source_text_hash) in translated_texts
+    }
+
+
+def get_translation_cache_entry(key_or_uuid, source_text, get_translation_result=None):
+    """
+    Return the English translation of the text from the translation cache, translating it on a cache miss.
+
+    Texts confidently detected as English on a cache miss are stored as their own translation without calling
+    AWS Translate.
+
+    Arguments:
+        key_or_uuid (str): Key or uuid of the product the text belongs to, used for logging.
+        source_text (str): Text which needs to be translated.
+        get_translation_result (callable): Called to get the result of `translate_source_text` for the text on a
+            cache miss, defaults to translating the text on the calling thread.
+
+    Returns:
+        (TranslationCache): Cache entry holding the translation, None if the text could not be translated.
+    """
+    source_text_hash = Translation.get_source_text_hash(source_text)
+    translation_cache = TranslationCache.objects.filter(
+        source_text_hash=source_text_hash, translated_text_language=ENGLISH
+    ).first()
+    if translation_cache:
+        return translation_cache
+
+    if get_translation_result is None:
+        result = translate_source_text(key_or_uuid, source_text)
+    else:
+        result = get_translation_result()
+    if not result['TranslatedText']:
+        return None
+
+    translation_cache, _ = TranslationCache.objects.get_or_create(
+        source_text_hash=source_text_hash,
+        translated_text_language=ENGLISH,
+        defaults={
+            'source_language': result['SourceLanguageCode'],
+            'translated_text': source_text if result['SourceLanguageCode'] == ENGLISH else result['TranslatedText'],
+        },
+    )
+    return translation_cache
+
+
+def translate_source_text(key_or_uuid, source_text):
+    """
+    Translate the text into English, unless it is detected as English, without using the database.
+
+    Arguments:
+        key_or_uuid (str): Key or uuid of the product the text belongs to, used for logging.
+        source_text (str): Text which needs to be translated.
+
+    Returns:
+        dict: Translated object which contains TranslatedText and SourceLanguageCode.
+    """
+    english_detected = is_english(source_text, get_english_detection_threshold())
+    metrics.increment(metrics.LANGUAGE_DETECTIONS, result='english' if english_detected else 'undetermined')
+    if english_detected:
+        return {'SourceLanguageCode': ENGLISH, 'TranslatedText': source_text}
+    if (len(source_text.encode('utf-8'))) < AMAZON_TRANSLATION_ALLOWED_SIZE:
+        return translate_text(key_or_uuid, source_text, AUTO, ENGLISH)
+    return apply_batching_to_translate_large_text(key_or_uuid, source_text)
+
+
+def translate_products(products_texts, product_type, max_workers=None, queue_size=None):
+    """
+    Yield the translation of the text of every product, translating the texts of the next products ahead.
+
+    Texts are sent to AWS Translate by a bounded pool of workers while the caller consumes the translations, with
+    at most `queue_size` products in flight. Database lookups and writes happen on the calling thread: the stored
+    translations and cached texts of the products in flight are looked up in bulk, only the other texts are queued
+    for the workers, once per distinct text. The queued texts are sent once `get_translated_skill_attribute_val`
+    needs the remote translation of a product, so nothing is sent for products whose translation is stored or
+    whose translation the caller does not request. Texts not sent yet when the caller stops are never sent.
+
+    Example usage:
+        >>> for key, text, translated_text in translate_products([(course_key, text)], ProductTypes.Course):
+        ...     extract_skills(translated_text)
+
+    Arguments:
+        products_texts (iterable): Pairs of the key or uuid of a product and the value of its skill attribute.
+        product_type (str): Type of the products.
+        max_workers (int): Maximum number of texts translated concurrently, defaults to the configured value.
+        queue_size (int): Maximum number of products in flight, defaults to the configured value.
+
+    Yields:
+        (tuple): Key or uuid of the product, value of its skill attribute and its translation, in the same order
+            as the products.
+    """
+    max_workers = max_workers or get_translate_products_max_workers()
+    queue_size = queue_size or get_translate_products_queue_size()
+    products_texts = iter(products_texts)
+    in_flight = deque()
+    # Key or uuid of a product of every text queued for AWS Translate, and the futures of the texts sent.
+    queued_texts = {}
+    translations = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def get_translation_result(key_or_uuid, skill_attr_val):
+        # Every queued text is sent with the first one needed, so the next products are translated meanwhile.
+        for text, text_key_or_uuid in queued_texts.items():
+            translations[text] = executor.submit(translate_source_text, text_key_or_uuid, text)
+        queued_texts.clear()
+        translation = translations.pop(skill_attr_val, None)
+        return translation.result() if translation else translate_source_text(key_or_uuid, skill_attr_val)
+
+    try:
+        while True:
+            # Refill the queue in batches once it is half empty, so the lookups of a batch share their queries.
+            if len(in_flight) <= queue_size // 2:
+                in_flight.extend(_queue_translations(
+                    list(islice(products_texts, queue_size - len(in_flight))), product_type, queued_texts, translations
+                ))
+            if not in_flight:
+                return
+            key_or_uuid, skill_attr_val, translated_text = in_flight.popleft()
+            if translated_text is None:
+                translated_text = get_translated_skill_attribute_val(
+                    key_or_uuid, skill_attr_val, product_type,
+                    partial(get_translation_result, key_or_uuid, skill_attr_val),
+                )
+            yield key_or_uuid, skill_attr_val, translated_text
+    finally:
+        # Texts sent for products that were not consumed are not translated if they have not started yet.
+        for translation in translations.values():
+            translation.cancel()
+        executor.shutdown()
+
+
+def _queue_translations(products_texts, product_type, queued_texts, translations):
+    """
+    Queue the texts of the products that need to be sent to AWS Translate.
+
+    Arguments:
+        products_texts (list): Pairs of the key or uuid of a product and the value of its skill attribute.
+        product_type (str): Type of the products.
+        queued_texts (dict): Key or uuid of a product of every text queued, updated with the texts of the products.
+        translations (dict): Futures of the texts already sent to AWS Translate.
+
+    Returns:
+        (list): Key or uuid and skill attribute value of every product, along with its stored translation if it is
+            up to date, None otherwise.
+    """
+    unchanged_translations = get_unchanged_translations(products_texts, product_type)
+    source_text_hashes = {
+        skill_attr_val: Translation.get_source_text_hash(skill_attr_val)
+        for key_or_uuid, skill_attr_val in products_texts
+        if (key_or_uuid, skill_attr_val) not in unchanged_translations
+    }
+    cached_hashes = set(TranslationCache.objects.filter(
+        source_text_hash__in=set(source_text_hashes.values()), translated_text_language=ENGLISH
+    ).values_list('source_text_hash', flat=True)) if source_text_hashes else set()
+
+    queued = []
+    for key_or_uuid, skill_attr_val in products_texts:
+        translated_text = unchanged_translations.get((key_or_uuid, skill_attr_val))
+        if translated_text is None and source_text_hashes[skill_attr_val] not in cached_hashes and \
+                skill_attr_val not in translations:
+            queued_texts.setdefault(skill_attr_val, key_or_uuid)
+        queued.append((key_or_uuid, skill_attr_val, translated_text))
+    return queued
+
+
+def precompute_product_translations(products, product_type, max_workers=None):
+    """
+    Translate and store the texts of the products, so a later skills refresh finds their translations up to date.
+
+    Arguments:
+        products (iterable): Metadata of the courses or programs, as returned by the metadata providers.
+        product_type (str): Type of the products.
+        max_workers (int): Maximum number of texts translated concurrently, defaults to the configured value.
+
+    Returns:
+        (int): Number of products whose text is translated.
+    """
+    key_or_uuid = get_product_identifier(product_type)
+
+    def iter_products_texts():
+        for product in products:
+            product = _convert_product_to_dict(product)
+            skill_attr_val = get_product_skill_attr_val(product, product_type) if product is not None else None
+            if skill_attr_val:
+                yield product[key_or_uuid], skill_attr_val
+
+    return sum(1 for __ in translate_products(iter_products_texts(), product_type, max_workers=max_workers))
+
+
+def prune_translation_cache():
+    """
+    Delete the entries of the translation cache that are no longer referenced by the translation of any product.
+
+    Returns:
+        (int): Number of deleted entries.
+    """
+    deleted_count, _ = TranslationCache.objects.filter(translations__isnull=True).delete()
+    return deleted_count
+
+
+def get_translate_products_max_workers():
+    """
+    Return the maximum number of product texts translated concurrently ahead of the skills extraction.
+    """
+    return getattr(settings, 'TAXONOMY_TRANSLATE_PRODUCTS_MAX_WORKERS', TRANSLATE_PRODUCTS_MAX_WORKERS)
+
+
+def get_translate_products_queue_size():
+    """
+    Return the maximum number of products whose texts are translated ahead of the skills extraction.
+    """
+    return getattr(settings, 'TAXONOMY_TRANSLATE_PRODUCTS_QUEUE_SIZE', TRANSLATE_PRODUCTS_QUEUE_SIZE)
+
+
+def get_english_detection_threshold():
+    """
+    Return the minimum confidence for a text to be detected as English without AWS Translate, None to disable it.
+    """
+    return getattr(settings, 'TAXONOMY_ENGLISH_DETECTION_THRESHOLD', ENGLISH_DETECTION_THRESHOLD)
+
+
+def get_translate_max_workers():
+    """
+    Return the maximum number of chunks of a single text translated concurrently by AWS Translate.
+    """
+    return getattr(settings, 'TAXONOMY_TRANSLATE_MAX_WORKERS', TRANSLATE_MAX_WORKERS)
+
+
+_aws_translate_client_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_aws_translate_client():
+    """
+    Return the AWS Translate client shared by all the threads of the process.
+
+    Sharing the client reuses its connection pool, sized for the chunks translated concurrently for every product
+    translated concurrently, instead of paying for the client construction and new connections on every
+    translation. boto3 clients are thread safe but their construction is not, hence the lock. The client sends its
+    requests to `TAXONOMY_TRANSLATE_ENDPOINT_URL` when it is set, e.g. to a local stand-in of AWS Translate.
+    """
+    with _aws_translate_client_lock:
+        return boto3.client(
+            service_name=TRANSLATE_SERVICE,
+            region_name=REGION,
+            endpoint_url=getattr(settings, 'TAXONOMY_TRANSLATE_ENDPOINT_URL', None),
+            config=BotoConfig(
+                max_pool_connections=max(get_translate_max_workers() * get_translate_products_max_workers(), 10)
+            ),
+        )
+
+
 def translate_text(key, text, source_language, target_language):
     """
     Translate text into the target language.
@@ -543,18 +1718,27 @@ def translate_text(key, text, source_language, target_language):
     Returns:
         dict: Translated object which contains TranslatedText, SourceLanguageCode and TargetLanguageCode.
     """
-    translate = boto3.client(service_name=TRANSLATE_SERVICE, region_name=REGION)
+    translate = replay.get_translate_client(get_aws_translate_client)
 
     result = {'SourceLanguageCode': '', 'TranslatedText': ''}
-    try:
-        result = translate.translate_text(
-            Text=text,
-            SourceLanguageCode=source_language,
-            TargetLanguageCode=target_language,
-        )
-    except Exception as ex:  # pylint: disable=broad-except
-        message = f'[TAXONOMY] Translate (course description or program overview) exception for key: {key} Error: {ex}'
-        LOGGER.exception(message)
+    with metrics.measure(TRANSLATE_SERVICE, 'translate_text') as call:
+        call.request_bytes = len(text.encode('utf-8'))
+        try:
+            result = translate.translate_text(
+                Text=text,
+                SourceLanguageCode=source_language,
+                TargetLanguageCode=target_language,
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            call.status = 'error'
+            LOGGER.exception(
+                '[TAXONOMY] Translate (course description or program overview) exception for key: %s Error: %s', key, ex
+            )
+        else:
+            response_metadata = result.get('ResponseMetadata', {})
+            call.status = response_metadata.get('HTTPStatusCode')
+            call.retries = response_metadata.get('RetryAttempts', 0)
+            call.response_bytes = len(result['TranslatedText'].encode('utf-8'))
 
     return result
 
@@ -570,34 +1754,141 @@ def apply_batching_to_translate_large_text(key, source_text):
     Returns:
         dict: Translated object which contains TranslatedText and SourceLanguageCode.
     """
-    soup = BeautifulSoup(source_text, 'html.parser')
-    # Split input text into a list of sentences on the basis of html tags
-    sentences = soup.findAll()
-    translated_text = ''
-    source_text_chunk = ''
-    result = {}
-    source_language_code = ''
-    LOGGER.info(f'[TAXONOMY] Translate (course description or program overview) applying batching for key: {key}')
-
-    for sentence in sentences:
-        # Translate expects utf-8 encoded input to be no more than
-        # 5000 bytes, so we’ll split on the 5000th byte.
-
-        if len(sentence.encode('utf-8')) + len(source_text_chunk.encode('utf-8')) < AMAZON_TRANSLATION_ALLOWED_SIZE:
-            source_text_chunk = '%s%s' % (source_text_chunk, sentence)
-        else:
-            translation_chunk = translate_text(key, source_text_chunk, AUTO, ENGLISH)
-            translated_text = translated_text + translation_chunk['TranslatedText']
-            source_text_chunk = sentence
-            source_language_code = translation_chunk['SourceLanguageCode']
-
-    # Translate the final chunk of input text
-    if source_text_chunk:
-        translation_chunk = translate_text(key, source_text_chunk, AUTO, ENGLISH)
-        translated_text = translated_text + translation_chunk['TranslatedText']
-        source_language_code = translation_chunk['SourceLanguageCode']
+    LOGGER.info('[TAXONOMY] Translate (course description or program overview) applying batching for key: %s', key)
+    # Workers are only started for the chunks that need them.
+    with ThreadPoolExecutor(max_workers=get_translate_max_workers()) as executor:
+        translation_chunks = list(executor.map(
+            lambda source_text_chunk: translate_text(key, source_text_chunk, AUTO, ENGLISH),
+            _iter_translation_chunks(source_text),
+        ))
+
+    translated_text = ''.join(translation_chunk['TranslatedText'] for translation_chunk in translation_chunks)
     # bs4 adds /r/n which needs to be removed for consistency.
     translated_text = translated_text.replace('\r', '').replace('\n', '')
-    result['TranslatedText'] = translated_text
-    result['SourceLanguageCode'] = source_language_code
-    return result
+    return {
+        'TranslatedText': translated_text,
+        'SourceLanguageCode': translation_chunks[-1]['SourceLanguageCode'] if translation_chunks else '',
+    }
+
+
+def _iter_translation_chunks(source_text):
+    """
+    Yield the text in chunks small enough to be translated by AWS Translate, in order.
+
+    Translate expects utf-8 encoded input of fewer than `AMAZON_TRANSLATION_ALLOWED_SIZE` bytes. Html elements that
+    fit are kept whole, larger ones are split into their children and the largest texts on sentence boundaries, so
+    every part of the text ends up in exactly one chunk. Parts are packed into chunks with a running byte count.
+
+    Arguments:
+        source_text (str): Text which needs to be translated.
+    """
+    max_size = AMAZON_TRANSLATION_ALLOWED_SIZE
+    parts = []
+    chunk_size = 0
+    soup = BeautifulSoup(source_text, 'html.parser')
+    html = _serialize_translation_html(soup)
+    for part, part_size in _iter_translation_parts(soup, html, max_size):
+        if parts and chunk_size + part_size >= max_size:
+            yield from _get_non_blank_chunk(parts)
+            parts = []
+            chunk_size = 0
+        parts.append(part)
+        chunk_size += part_size
+    yield from _get_non_blank_chunk(parts)
+
+
+def _get_non_blank_chunk(parts):
+    """
+    Return a list holding the chunk made of the given parts, an empty list if there is nothing to translate.
+    """
+    chunk = ''.join(parts)
+    return [chunk] if chunk.strip() else []
+
+
+def _serialize_translation_html(root):
+    """
+    Serialize the html in a single walk of its tree, into the markup of its tags and the escaped text of its leaves.
+
+    The utf-8 size of every piece is counted once, so the size of any node is the difference of two running totals.
+
+    Returns:
+        (tuple): The pieces in document order, the running totals of their sizes, where the i-th total is the size
+            of the pieces before the i-th piece, and a dictionary mapping the id of every node to the indexes of its
+            first piece and of the piece after its last one.
+    """
+    pieces, offsets, spans = [], [0], {}
+
+    def add_piece(piece):
+        pieces.append(piece)
+        offsets.append(offsets[-1] + len(piece.encode('utf-8')))
+
+    def add_node(node):
+        start = len(pieces)
+        if isinstance(node, Tag):
+            opening_tag, closing_tag = _get_tag_markup(node)
+            if opening_tag:
+                add_piece(opening_tag)
+            for child in node.children:
+                add_node(child)
+            if closing_tag:
+                add_piece(closing_tag)
+        else:
+            add_piece(node.output_ready())
+        spans[id(node)] = (start, len(pieces))
+
+    add_node(root)
+    return pieces, offsets, spans
+
+
+def _get_tag_markup(tag):
+    """
+    Return the opening and the closing markup of the tag, as rendered by `str(tag)`, without its contents.
+    """
+    if tag.hidden:
+        # The root of the document has no markup of its own.
+        return '', ''
+    closing_tag = '' if tag.is_empty_element else f'</{tag.prefix + ":" if tag.prefix else ""}{tag.name}>'
+    html = Tag(name=tag.name, prefix=tag.prefix, attrs=tag.attrs, can_be_empty_element=tag.is_empty_element).decode()
+    return html[:len(html) - len(closing_tag)], closing_tag
+
+
+def _iter_translation_parts(node, html, max_size):
+    """
+    Yield the html of the node in parts of fewer than `max_size` utf-8 bytes, along with their size in bytes.
+
+    Arguments:
+        node (PageElement): Node of the parsed html.
+        html (tuple): The html serialized by `_serialize_translation_html`, a node is only joined into a string
+            when it is yielded whole.
+        max_size (int): Size in bytes that every part must stay under.
+    """
+    pieces, offsets, spans = html
+    start, end = spans[id(node)]
+    size = offsets[end] - offsets[start]
+    if size < max_size:
+        yield ''.join(pieces[start:end]), size
+    elif isinstance(node, Tag):
+        for child in node.children:
+            yield from _iter_translation_parts(child, html, max_size)
+    else:
+        for sentence in SENTENCE_PATTERN.findall(pieces[start]):
+            yield from _split_text_bytes(sentence, max_size)
+
+
+def _split_text_bytes(text, max_size):
+    """
+    Yield the text in parts of fewer than `max_size` utf-8 bytes, along with their size, without splitting characters.
+    """
+    encoded_text = text.encode('utf-8')
+    start = 0
+    while start < len(encoded_text):
+        end = min(start + max_size - 1, len(encoded_text))
+        # Move back to the first byte of the character, unless the character does not fit on its own.
+        while start < end < len(encoded_text) and encoded_text[end] & 0xC0 == 0x80:
+            end -= 1
+        if end == start:
+            end += 1
+            while end < len(encoded_text) and encoded_text[end] & 0xC0 == 0x80:
+                end += 1
+        yield encoded_text[start:end].decode('utf-8'), end - start
+        start = end
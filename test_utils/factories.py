@@ -12,9 +12,12 @@ from faker import Faker
 from taxonomy.models import (
     CourseSkills, Job, JobPostings, JobSkills, Skill, Translation, SkillCategory, SkillSubCategory, ProgramSkill,
     SkillsQuiz, RefreshCourseSkillsConfig, RefreshProgramSkillsConfig, Industry, IndustryJobSkill,
-    XBlockSkillData, XBlockSkills
+    XBlockSkillData, XBlockSkills, ProductContentHash, SkillsExtractionCache,
+    ProductSkillsRefreshRun, ProductSkillsRefreshFailure, SkillTaxonomySnapshot,
+    ProductSkillsRetry, TranslationCache
 )
-from taxonomy.choices import UserGoal
+from taxonomy.choices import ProductTypes, UserGoal
+from taxonomy.emsi.client import EMSISkillsApiClient
 
 FAKER = FakerFactory.create()
 FAKER_OBJECT = Faker()
@@ -289,6 +292,24 @@ class TranslationFactory(factory.django.DjangoModelFactory):
     translated_text_language = factory.LazyAttribute(lambda x: FAKER.language_code())
 
 
+class TranslationCacheFactory(factory.django.DjangoModelFactory):
+    """
+    Factory class for TranslationCache model.
+    """
+
+    class Meta:
+        """
+        Meta for ``TranslationCache``.
+        """
+
+        model = TranslationCache
+
+    source_text_hash = factory.LazyAttribute(lambda x: FAKER.sha256())
+    translated_text_language = 'en'
+    source_language = factory.LazyAttribute(lambda x: FAKER.language_code())
+    translated_text = factory.LazyAttribute(lambda x: FAKER.text(max_nb_chars=200))
+
+
 class SkillsQuizFactory(factory.django.DjangoModelFactory):
     """
     Factory class for SkillsQuiz model.
@@ -331,3 +352,113 @@ class SkillsQuizFactory(factory.django.DjangoModelFactory):
                 self.future_jobs.add(future_job)
         else:
             self.future_jobs.add(JobFactory.create())
+
+
+# pylint: disable=no-member, invalid-name
+class ProductContentHashFactory(factory.django.DjangoModelFactory):
+    """
+    Factory class for ProductContentHash model.
+    """
+
+    class Meta:
+        """
+        Meta for ``ProductContentHash``.
+        """
+
+        model = ProductContentHash
+
+    product_type = ProductTypes.Course
+    product_identifier = factory.Sequence('course-v1:edX+DemoX+{}'.format)
+    hash_content = factory.LazyAttribute(lambda x: FAKER.md5())
+
+
+# pylint: disable=no-member, invalid-name
+class SkillsExtractionCacheFactory(factory.django.DjangoModelFactory):
+    """
+    Factory class for SkillsExtractionCache model.
+    """
+
+    class Meta:
+        """
+        Meta for ``SkillsExtractionCache``.
+        """
+
+        model = SkillsExtractionCache
+
+    text_hash = factory.LazyAttribute(lambda x: FAKER.sha256())
+    api_version = '8.9'
+    skills_data = factory.LazyFunction(lambda: {'data': []})
+
+
+# pylint: disable=no-member, invalid-name
+class ProductSkillsRefreshRunFactory(factory.django.DjangoModelFactory):
+    """
+    Factory class for ProductSkillsRefreshRun model.
+    """
+
+    class Meta:
+        """
+        Meta for ``ProductSkillsRefreshRun``.
+        """
+
+        model = ProductSkillsRefreshRun
+
+    product_type = ProductTypes.Course
+
+
+# pylint: disable=no-member, invalid-name
+class ProductSkillsRefreshFailureFactory(factory.django.DjangoModelFactory):
+    """
+    Factory class for ProductSkillsRefreshFailure model.
+    """
+
+    class Meta:
+        """
+        Meta for ``ProductSkillsRefreshFailure``.
+        """
+
+        model = ProductSkillsRefreshFailure
+
+    refresh_run = factory.SubFactory(ProductSkillsRefreshRunFactory)
+    product_identifier = factory.LazyAttribute(lambda x: FAKER.slug())
+    message = factory.LazyAttribute(lambda x: FAKER.sentence())
+
+
+# pylint: disable=no-member, invalid-name
+class ProductSkillsRetryFactory(factory.django.DjangoModelFactory):
+    """
+    Factory class for ProductSkillsRetry model.
+    """
+
+    class Meta:
+        """
+        Meta for ``ProductSkillsRetry``.
+        """
+
+        model = ProductSkillsRetry
+
+    product_type = ProductTypes.Course
+    product_uuid = factory.LazyFunction(lambda: str(uuid4()))
+
+
+# pylint: disable=no-member, invalid-name
+class SkillTaxonomySnapshotFactory(factory.django.DjangoModelFactory):
+    """
+    Factory class for SkillTaxonomySnapshot model.
+    """
+
+    class Meta:
+        """
+        Meta for ``SkillTaxonomySnapshot``.
+        """
+
+        model = SkillTaxonomySnapshot
+
+    api_version = EMSISkillsApiClient.API_VERSION
+    external_id = factory.LazyAttribute(lambda x: FAKER.slug())
+    name = factory.LazyAttribute(lambda x: FAKER.word())
+    description = factory.LazyAttribute(lambda x: FAKER.sentence())
+    category_id = factory.Sequence(lambda n: n)
+    category_name = factory.LazyAttribute(lambda x: FAKER.word())
+    subcategory_id = factory.Sequence(lambda n: n)
+    subcategory_name = factory.LazyAttribute(lambda x: FAKER.word())
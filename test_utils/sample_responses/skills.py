@@ -342,3 +342,40 @@ SKILL_DETAILS_EMSI_RESPONSE = {
         'type': {'id': 'ST1', 'name': 'Specialized Skill'}
     }
 }
+
+# Response of the batch skills retrieval endpoint, `POST /skills/versions/{version}/skills` with `{"ids": [...]}`.
+# Built from the response shape documented for the Lightcast skills API, ids unknown to the API are left out.
+SKILLS_DETAILS_EMSI_RESPONSE = {
+    'attributions': [
+        {
+            'name': 'Wikipedia',
+            'text': 'Wikipedia extracts are distributed under the CC BY-SA license)'
+        }
+    ],
+    'data': [
+        SKILL_DETAILS_EMSI_RESPONSE['data'],
+        {
+            'category': {'id': 1, 'name': 'Information Technology'},
+            'description': 'Test description',
+            'descriptionSource': 'https://en.wikipedia.org/wiki/Python_(programming_language)',
+            'id': 'KS125LS6N7WP4S6SFTCK',
+            'infoUrl': 'https://skills.emsidata.com/skills/KS125LS6N7WP4S6SFTCK',
+            'isLanguage': False,
+            'isSoftware': True,
+            'name': 'Python (Programming Language)',
+            'removedDescription': None,
+            'subcategory': {'id': 12, 'name': 'Scripting and Programming Languages'},
+            'tags': [
+                {
+                    'key': 'wikipediaExtract',
+                    'value': 'Test description.'
+                },
+                {
+                    'key': 'wikipediaUrl',
+                    'value': 'https://en.wikipedia.org/wiki/Python_(programming_language)'
+                }
+            ],
+            'type': {'id': 'ST1', 'name': 'Specialized Skill'}
+        },
+    ]
+}
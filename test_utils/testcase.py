@@ -8,6 +8,9 @@ import unittest
 
 import responses
 
+from django.core.cache import cache
+
+from taxonomy import utils
 from taxonomy.emsi.client import JwtEMSIApiClient
 
 
@@ -18,6 +21,14 @@ class TaxonomyTestCase(unittest.TestCase):
     If there is functionality common to all tests then either add a mixin or add it here.
     """
 
+    def setUp(self):
+        """
+        Clear the cache so access tokens and other cached values do not leak between tests.
+        """
+        super().setUp()
+        cache.clear()
+        utils.get_aws_translate_client.cache_clear()
+
     @staticmethod
     def mock_access_token(access_token='test-token', expires_in=60):
         """
@@ -5,6 +5,7 @@ import mock
 
 from django.conf import settings
 
+from taxonomy import metrics
 from taxonomy.algolia.client import AlgoliaClient
 from taxonomy.algolia.constants import ALGOLIA_JOBS_INDEX_SETTINGS
 from test_utils.testcase import TaxonomyTestCase
@@ -39,3 +40,26 @@ class TestAlgoliaClient(TaxonomyTestCase):
 
         client.algolia_index.set_settings.assert_called_once_with(ALGOLIA_JOBS_INDEX_SETTINGS)
         client.algolia_index.replace_all_objects.assert_called_once_with(jobs_data, mock.ANY)
+
+    @mock.patch('taxonomy.algolia.client.algoliasearch.Client')
+    def test_client_calls_measured(self, _):
+        """
+        Test that the calls to algolia are reported to the metrics sinks.
+        """
+        sink = metrics.InMemoryMetricsSink()
+        metrics.add_sink(sink)
+        self.addCleanup(metrics.remove_sink, sink)
+        client = AlgoliaClient(
+            application_id=settings.ALGOLIA.get('APPLICATION_ID'),
+            api_key=settings.ALGOLIA.get('API_KEY'),
+            index_name=settings.ALGOLIA.get('TAXONOMY_INDEX_NAME'),
+        )
+        client.algolia_index = mock.MagicMock()
+        client.algolia_index.replace_all_objects.side_effect = Exception('Algolia is down')
+
+        client.set_index_settings(ALGOLIA_JOBS_INDEX_SETTINGS)
+        with self.assertRaises(Exception):
+            client.replace_all_objects([])
+
+        assert sink.get_count(metrics.REQUESTS, service='algolia', endpoint='set_index_settings', status='ok') == 1
+        assert sink.get_count(metrics.REQUESTS, service='algolia', endpoint='replace_all_objects', status='error') == 1
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the `taxonomy-connector` emsi jobs data parsers.
+"""
+from pytest import raises
+
+from taxonomy.emsi.parsers.job_parsers import (
+    JobBucket,
+    JobPostingsBucket,
+    JobSkillBucket,
+    iter_job_buckets,
+    iter_job_postings_buckets,
+)
+from test_utils.sample_responses.job_postings import JOB_POSTINGS, MISSING_MEDIAN_SALARY_JOB_POSTING
+from test_utils.sample_responses.jobs import JOBS, MISSING_SIGNIFICANCE_KEY_JOBS
+from test_utils.testcase import TaxonomyTestCase
+
+
+class TestJobParsers(TaxonomyTestCase):
+    """
+    Validate the behavior of the jobs ranking parsers.
+    """
+
+    def test_iter_job_buckets(self):
+        """
+        Validate that every job is yielded with only the persisted fields of its ranked skills.
+        """
+        job_buckets = list(iter_job_buckets(JOBS))
+
+        assert len(job_buckets) == len(JOBS['data']['ranking']['buckets'])
+        assert job_buckets[0] == JobBucket(
+            external_id='15.0120',
+            skills=(
+                JobSkillBucket('KS1208078SN0KY08W3QT', significance=31.394078320130294, unique_postings=25953),
+                JobSkillBucket('KS1274Y5Z0PFK7XN155K', significance=21.08851543427918, unique_postings=34705),
+            ),
+        )
+
+    def test_iter_job_buckets_missing_key(self):
+        """
+        Validate that a bucket missing a persisted field raises a KeyError.
+        """
+        with raises(KeyError, match='significance'):
+            list(iter_job_buckets(MISSING_SIGNIFICANCE_KEY_JOBS))
+
+    def test_iter_job_postings_buckets(self):
+        """
+        Validate that the job postings statistics of every job are yielded, with the median salary as a string.
+        """
+        buckets = list(iter_job_postings_buckets(JOB_POSTINGS))
+        raw_bucket = JOB_POSTINGS['data']['ranking']['buckets'][0]
+
+        assert len(buckets) == len(JOB_POSTINGS['data']['ranking']['buckets'])
+        assert isinstance(buckets[0], JobPostingsBucket)
+        assert buckets[0].external_id == raw_bucket['name']
+        assert buckets[0].get_job_postings_data() == {
+            'median_salary': '87424.78',
+            'median_posting_duration': raw_bucket['median_posting_duration'],
+            'unique_postings': raw_bucket['unique_postings'],
+            'unique_companies': raw_bucket['unique_companies'],
+        }
+
+        assert [bucket.median_salary for bucket in buckets[1:]] == ['34000.00', '45000.34', None]
+
+        with raises(KeyError, match='median_salary'):
+            list(iter_job_postings_buckets(MISSING_MEDIAN_SALARY_JOB_POSTING))
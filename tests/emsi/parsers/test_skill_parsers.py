@@ -2,9 +2,12 @@
 """
 Tests for the `taxonomy-connector` emsi data parsers.
 """
+import copy
+
 import ddt
 
-from taxonomy.emsi.parsers.skill_parsers import SkillDataParser
+from taxonomy.emsi.parsers.skill_parsers import ExtractedSkill, SkillDataParser, parse_extracted_skills
+from test_utils.sample_responses.skills import MISSING_NAME_SKILLS, SKILLS_EMSI_RESPONSE, TYPE_ERROR_SKILLS
 from test_utils.testcase import TaxonomyTestCase
 
 
@@ -74,3 +77,79 @@ class TestSkillDataParser(TaxonomyTestCase):
         parser = SkillDataParser(sample_data)
 
         assert parser.get_skill_category_data() == expected_data
+
+    def test_from_batch_response(self):
+        """
+        Validate that a parser is returned for every skill of a batch response.
+        """
+        parsers = SkillDataParser.from_batch_response({
+            'data': [
+                {'id': 'SKILL1', 'category': {'id': 1, 'name': 'test'}, 'subcategory': {'id': 2, 'name': 'test'}},
+                {'id': 'SKILL2', 'category': None, 'subcategory': None},
+            ]
+        })
+
+        assert set(parsers) == {'SKILL1', 'SKILL2'}
+        assert parsers['SKILL1'].get_skill_category_data() == {
+            'category': {'id': 1, 'name': 'test'}, 'subcategory': {'id': 2, 'name': 'test'},
+        }
+        assert parsers['SKILL2'].get_skill_category_data() == {'category': None, 'subcategory': None}
+
+
+class TestParseExtractedSkills(TaxonomyTestCase):
+    """
+    Validate the parsing of skills extraction responses into compact records.
+    """
+
+    def test_parse_extracted_skills(self):
+        """
+        Validate that only the fields persisted by taxonomy are kept, with the description read from the tags.
+        """
+        extracted_skills = parse_extracted_skills(SKILLS_EMSI_RESPONSE)
+
+        assert extracted_skills.errors == ()
+        assert len(extracted_skills.skills) == len(SKILLS_EMSI_RESPONSE['data'])
+        record = SKILLS_EMSI_RESPONSE['data'][0]
+        description = next(tag['value'] for tag in record['skill']['tags'] if tag['key'] == 'wikipediaExtract')
+        assert extracted_skills.skills[0] == ExtractedSkill(
+            external_id=record['skill']['id'],
+            name=record['skill']['name'],
+            info_url=record['skill']['infoUrl'],
+            type_id=record['skill']['type']['id'],
+            type_name=record['skill']['type']['name'],
+            description=description,
+            confidence=float(record['confidence']),
+        )
+        assert parse_extracted_skills(extracted_skills) is extracted_skills
+
+    def test_missing_description(self):
+        """
+        Validate that a skill without a `wikipediaExtract` tag gets an empty description.
+        """
+        response = copy.deepcopy({'data': SKILLS_EMSI_RESPONSE['data'][:1]})
+        response['data'][0]['skill']['tags'] = []
+
+        assert parse_extracted_skills(response).skills[0].description == ''
+
+    def test_live_record_description_read_from_tags(self):
+        """
+        Validate that the description of a record sent by EMSI is read from its tags even if it has a description key.
+        """
+        response = copy.deepcopy({'data': SKILLS_EMSI_RESPONSE['data'][:1]})
+        response['data'][0]['skill']['description'] = None
+        description = next(
+            tag['value'] for tag in response['data'][0]['skill']['tags'] if tag['key'] == 'wikipediaExtract'
+        )
+
+        assert parse_extracted_skills(response).skills[0].description == description
+
+    def test_invalid_records(self):
+        """
+        Validate that the errors of invalid records are collected and the valid records are still parsed.
+        """
+        response = {'data': SKILLS_EMSI_RESPONSE['data'][:1] + MISSING_NAME_SKILLS['data'] + TYPE_ERROR_SKILLS['data']}
+
+        extracted_skills = parse_extracted_skills(response)
+
+        assert len(extracted_skills.skills) == 1
+        assert [type(error) for error in extracted_skills.errors] == [KeyError, ValueError]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the asyncio EMSI clients.
+"""
+
+import asyncio
+
+import responses
+
+from taxonomy.emsi.async_client import AsyncEMSIJobsApiClient, AsyncEMSISkillsApiClient
+from taxonomy.emsi.client import EMSIJobsApiClient, EMSISkillsApiClient
+from taxonomy.emsi.parsers.skill_parsers import parse_extracted_skills
+from taxonomy.enums import RankingFacet
+from test_utils.decorators import mock_api_response
+from test_utils.sample_responses.jobs import JOBS, JOBS_FILTER
+from test_utils.sample_responses.skills import (
+    SKILL_DETAILS_EMSI_RESPONSE,
+    SKILL_ID,
+    SKILL_TEXT_DATA,
+    SKILLS_EMSI_CLIENT_RESPONSE,
+    SKILLS_EMSI_RESPONSE,
+)
+from test_utils.testcase import TaxonomyTestCase
+
+
+class TestAsyncEMSISkillsApiClient(TaxonomyTestCase):
+    """
+    Validate that the asyncio skills client returns the same data as the synchronous client.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.mock_access_token()
+
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/extract',
+        json=SKILLS_EMSI_RESPONSE,
+    )
+    def test_get_product_skills(self):
+        """
+        Validate that concurrent skills extractions share a single access token.
+        """
+        async def extract_skills():
+            async with AsyncEMSISkillsApiClient(max_concurrency=4) as client:
+                return await asyncio.gather(*(client.get_product_skills(SKILL_TEXT_DATA) for _ in range(8)))
+
+        results = asyncio.run(extract_skills())
+
+        assert results == [parse_extracted_skills(SKILLS_EMSI_CLIENT_RESPONSE)] * 8
+        token_calls = [call for call in responses.calls if call.request.url == EMSISkillsApiClient.ACCESS_TOKEN_URL]
+        assert len(token_calls) == 1
+
+    @mock_api_response(
+        method=responses.GET,
+        url=EMSISkillsApiClient.API_BASE_URL + f'/skills/{SKILL_ID}',
+        json=SKILL_DETAILS_EMSI_RESPONSE,
+    )
+    def test_get_skill_details(self):
+        """
+        Validate that skill details are fetched through the synchronous client.
+        """
+        async def get_skill_details():
+            async with AsyncEMSISkillsApiClient() as client:
+                return await client.get_skill_details(SKILL_ID)
+
+        assert asyncio.run(get_skill_details()) == SKILL_DETAILS_EMSI_RESPONSE
+
+
+class TestAsyncEMSIJobsApiClient(TaxonomyTestCase):
+    """
+    Validate that the asyncio jobs client returns the same data as the synchronous client.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.mock_access_token()
+
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSIJobsApiClient.API_BASE_URL + '/rankings/{}/rankings/{}'.format(
+            RankingFacet.TITLE_NAME.value, RankingFacet.SKILLS_NAME.value
+        ),
+        json=JOBS,
+    )
+    def test_get_jobs(self):
+        """
+        Validate that jobs are fetched through the synchronous client.
+        """
+        async def get_jobs():
+            async with AsyncEMSIJobsApiClient() as client:
+                return await client.get_jobs(RankingFacet.TITLE_NAME, RankingFacet.SKILLS_NAME, JOBS_FILTER)
+
+        assert asyncio.run(get_jobs()) == JOBS
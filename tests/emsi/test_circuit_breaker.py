@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the EMSI circuit breaker.
+"""
+
+import mock
+import responses
+from pytest import raises
+from requests import HTTPError, Response
+
+from django.test import override_settings
+
+from taxonomy.emsi import transport
+from taxonomy.emsi.circuit_breaker import CircuitBreaker, is_service_failure
+from taxonomy.emsi.client import EMSISkillsApiClient
+from taxonomy.exceptions import CircuitOpenError, TaxonomyAPIError
+from test_utils.decorators import mock_api_response
+from test_utils.sample_responses.skills import SKILL_TEXT_DATA
+from test_utils.testcase import TaxonomyTestCase
+
+
+def _api_error(status_code):
+    """
+    Return a `TaxonomyAPIError` caused by an HTTP error response with the given status code.
+    """
+    response = Response()
+    response.status_code = status_code
+    try:
+        raise HTTPError(response=response)
+    except HTTPError as http_error:
+        try:
+            raise TaxonomyAPIError('Error') from http_error
+        except TaxonomyAPIError as error:
+            return error
+
+
+class TestCircuitBreaker(TaxonomyTestCase):
+    """
+    Validate that the circuit breaker opens, refuses calls and closes appropriately.
+    """
+
+    @mock.patch('taxonomy.emsi.circuit_breaker.monotonic')
+    def test_circuit_breaker(self, monotonic_mock):
+        """
+        Validate the transitions of the circuit breaker.
+        """
+        monotonic_mock.return_value = 100
+        circuit_breaker = CircuitBreaker('get_jobs', failure_threshold=3, reset_timeout=30)
+
+        circuit_breaker.record_failure()
+        circuit_breaker.record_failure()
+        circuit_breaker.record_success()
+        circuit_breaker.record_failure()
+        circuit_breaker.record_failure()
+        assert not circuit_breaker.is_open
+        circuit_breaker.before_call()
+
+        circuit_breaker.record_failure()
+        assert circuit_breaker.is_open
+        with raises(CircuitOpenError, match='Circuit of EMSI endpoint get_jobs is open.'):
+            circuit_breaker.before_call()
+
+        # A single trial call is let through after the reset timeout, a failed trial opens the circuit again.
+        monotonic_mock.return_value = 130
+        circuit_breaker.before_call()
+        with raises(CircuitOpenError):
+            circuit_breaker.before_call()
+        circuit_breaker.record_failure()
+        assert circuit_breaker.is_open
+
+        # A successful trial closes the circuit.
+        monotonic_mock.return_value = 160
+        circuit_breaker.before_call()
+        circuit_breaker.record_success()
+        assert not circuit_breaker.is_open
+        circuit_breaker.before_call()
+
+    def test_is_service_failure(self):
+        """
+        Validate that only server errors, throttling and network errors count as failures of the service.
+        """
+        assert is_service_failure(TaxonomyAPIError('Error'))
+        assert is_service_failure(_api_error(500))
+        assert is_service_failure(_api_error(429))
+        assert not is_service_failure(_api_error(400))
+        assert not is_service_failure(_api_error(404))
+
+
+class TestClientCircuitBreaker(TaxonomyTestCase):
+    """
+    Validate that the EMSI client methods stop calling EMSI once their circuit opens.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.mock_access_token()
+        transport.get_http_adapter.cache_clear()
+        self.addCleanup(transport.get_http_adapter.cache_clear)
+
+    @override_settings(EMSI_API_CIRCUIT_BREAKER_FAILURE_THRESHOLD=2, EMSI_API_MAX_RETRIES=0)
+    @mock_api_response(method=responses.POST, url=EMSISkillsApiClient.API_BASE_URL + '/extract', status=503)
+    def test_circuit_opens_on_server_errors(self):
+        """
+        Validate that calls are refused without reaching EMSI after consecutive server errors.
+        """
+        client = EMSISkillsApiClient()
+        for _ in range(2):
+            with raises(TaxonomyAPIError):
+                client.get_product_skills(SKILL_TEXT_DATA)
+        with raises(CircuitOpenError):
+            client.get_product_skills(SKILL_TEXT_DATA)
+
+        extract_calls = [call for call in responses.calls if call.request.url.endswith('/extract')]
+        assert len(extract_calls) == 2
+        assert client.get_circuit_breaker('get_product_skills').is_open
+        assert not client.get_circuit_breaker('get_skills_details').is_open
+
+    @override_settings(EMSI_API_CIRCUIT_BREAKER_FAILURE_THRESHOLD=2, EMSI_API_MAX_RETRIES=0)
+    @mock_api_response(method=responses.POST, url=EMSISkillsApiClient.API_BASE_URL + '/extract', status=400)
+    def test_circuit_stays_closed_on_client_errors(self):
+        """
+        Validate that errors caused by the request do not open the circuit.
+        """
+        client = EMSISkillsApiClient()
+        for _ in range(3):
+            with raises(TaxonomyAPIError) as error:
+                client.get_product_skills(SKILL_TEXT_DATA)
+            assert not isinstance(error.value, CircuitOpenError)
+        assert not client.get_circuit_breaker('get_product_skills').is_open
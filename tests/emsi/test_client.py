@@ -3,14 +3,22 @@
 Tests for the `taxonomy-connector` emsi client.
 """
 
+import json
 import logging
-from time import time
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep, time
 
+import mock
 import responses
 from pytest import raises
 from testfixtures import LogCapture
 
+from django.core.cache import cache
+from django.test import override_settings
+
+from taxonomy import metrics
 from taxonomy.emsi.client import EMSIJobsApiClient, EMSISkillsApiClient, JwtEMSIApiClient
+from taxonomy.emsi.parsers.skill_parsers import SkillDataParser, parse_extracted_skills
 from taxonomy.enums import RankingFacet
 from taxonomy.exceptions import TaxonomyAPIError
 from test_utils.decorators import mock_api_response
@@ -18,7 +26,8 @@ from test_utils.sample_responses.job_lookup import JOB_LOOKUP, JOB_LOOKUP_FILTER
 from test_utils.sample_responses.job_postings import JOB_POSTINGS, JOB_POSTINGS_FILTER
 from test_utils.sample_responses.jobs import JOBS, JOBS_FILTER
 from test_utils.sample_responses.skills import (
-    SKILL_TEXT_DATA, SKILLS_EMSI_CLIENT_RESPONSE, SKILLS_EMSI_RESPONSE, SKILL_ID, SKILL_DETAILS_EMSI_RESPONSE
+    SKILL_TEXT_DATA, SKILLS_EMSI_CLIENT_RESPONSE, SKILLS_EMSI_RESPONSE, SKILL_ID, SKILL_DETAILS_EMSI_RESPONSE,
+    SKILLS_DETAILS_EMSI_RESPONSE,
 )
 from test_utils.testcase import TaxonomyTestCase
 
@@ -111,6 +120,82 @@ class TestJwtEMSIApiClient(TaxonomyTestCase):
         assert len(responses.calls) == 1
         assert responses.calls[0].request.url == JwtEMSIApiClient.ACCESS_TOKEN_URL
 
+    @override_settings(EMSI_API_ACCESS_TOKEN_REFRESH_MARGIN=100)
+    @mock_api_response(
+        method=responses.POST,
+        url=JwtEMSIApiClient.ACCESS_TOKEN_URL,
+        json={'access_token': 'test-token', 'expires_in': 3600},
+    )
+    def test_access_token_refreshed_before_expiry(self):
+        """
+        Validate that the access token is refreshed a safety margin before it expires.
+        """
+        self.client.oauth_access_token()
+        assert int(time()) + 3400 <= self.client.expires_at <= int(time()) + 3500
+
+    @mock_api_response(
+        method=responses.POST,
+        url=JwtEMSIApiClient.ACCESS_TOKEN_URL,
+        json={'access_token': 'test-token', 'expires_in': 3600},
+    )
+    def test_access_token_shared_between_clients(self):
+        """
+        Validate that the access token is cached per scope and shared by the clients of that scope.
+        """
+        self.client.connect()
+        JwtEMSIApiClient(scope='EMSI').connect()
+        assert len(responses.calls) == 1
+        assert JwtEMSIApiClient(scope='EMSI').get_access_token() == 'test-token'
+
+        JwtEMSIApiClient(scope='postings:us').connect()
+        assert len(responses.calls) == 2
+
+        # Expired tokens are not served from the cache.
+        cache_key = self.client._get_access_token_cache_key()  # pylint: disable=protected-access
+        cache.set(cache_key, {'access_token': 'expired-token', 'expires_at': int(time()) - 1})
+        assert self.client.get_access_token() == 'test-token'
+        assert len(responses.calls) == 3
+
+    @mock_api_response(
+        method=responses.POST,
+        url=JwtEMSIApiClient.ACCESS_TOKEN_URL,
+        json={'access_token': 'test-token', 'expires_in': 3600},
+    )
+    def test_access_token_lock(self):
+        """
+        Validate that clients wait for the token fetched by the lock holder and only fetch one when it never comes.
+        """
+        cache_key = self.client._get_access_token_cache_key()  # pylint: disable=protected-access
+        cache.add(f'{cache_key}.lock', True)
+
+        def fetch_token_elsewhere(seconds):  # pylint: disable=unused-argument
+            cache.set(cache_key, {'access_token': 'shared-token', 'expires_at': int(time()) + 3000})
+
+        with mock.patch('taxonomy.emsi.client.sleep', side_effect=fetch_token_elsewhere):
+            assert self.client.get_access_token() == 'shared-token'
+        assert len(responses.calls) == 0
+
+        cache.delete(cache_key)
+        with override_settings(EMSI_API_ACCESS_TOKEN_LOCK_TIMEOUT=0.3):
+            assert self.client.get_access_token() == 'test-token'
+        assert len(responses.calls) == 1
+
+    def test_refresh_token_thread_safe(self):
+        """
+        Validate that threads sharing a client with an expired token re-connect only once.
+        """
+        def connect():
+            sleep(0.05)
+            self.client.expires_at = int(time()) + 60
+
+        func = self.client.refresh_token(lambda client: client.expires_at)
+        with mock.patch.object(self.client, 'connect', side_effect=connect) as connect_mock:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(lambda _: func(self.client), range(8)))
+
+        assert connect_mock.call_count == 1
+        assert all(result > 0 for result in results)
+
 
 class TestEMSISkillsApiClient(TaxonomyTestCase):
     """
@@ -136,12 +221,12 @@ class TestEMSISkillsApiClient(TaxonomyTestCase):
         # Initialize once and call the API
         client = EMSISkillsApiClient()
         skills = client.get_product_skills(SKILL_TEXT_DATA)
-        assert skills == SKILLS_EMSI_CLIENT_RESPONSE
+        assert skills == parse_extracted_skills(SKILLS_EMSI_CLIENT_RESPONSE)
 
         # Initialize the client again to simulate error condition.
         client = EMSISkillsApiClient()
         skills = client.get_product_skills(SKILL_TEXT_DATA)
-        assert skills == SKILLS_EMSI_CLIENT_RESPONSE
+        assert skills == parse_extracted_skills(SKILLS_EMSI_CLIENT_RESPONSE)
 
     @mock_api_response(
         method=responses.POST,
@@ -154,7 +239,7 @@ class TestEMSISkillsApiClient(TaxonomyTestCase):
         """
         skills = self.client.get_product_skills(SKILL_TEXT_DATA)
 
-        assert skills == SKILLS_EMSI_CLIENT_RESPONSE
+        assert skills == parse_extracted_skills(SKILLS_EMSI_CLIENT_RESPONSE)
 
     @mock_api_response(
         method=responses.POST,
@@ -169,6 +254,29 @@ class TestEMSISkillsApiClient(TaxonomyTestCase):
         with raises(TaxonomyAPIError, match='Error while fetching product skills.'):
             self.client.get_product_skills(SKILL_TEXT_DATA)
 
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/extract',
+        json=SKILLS_EMSI_RESPONSE,
+    )
+    def test_get_product_skills_measured(self):
+        """
+        Validate that the calls to EMSI and the access token refreshes are reported to the metrics sinks.
+        """
+        sink = metrics.InMemoryMetricsSink()
+        metrics.add_sink(sink)
+        self.addCleanup(metrics.remove_sink, sink)
+
+        self.client.get_product_skills(SKILL_TEXT_DATA)
+        self.client.get_product_skills(SKILL_TEXT_DATA)
+
+        tags = {'service': 'emsi', 'endpoint': 'get_product_skills'}
+        assert sink.get_count(metrics.REQUESTS, status='200', **tags) == 2
+        assert sink.get_values(metrics.REQUEST_BYTES, **tags) == [len(json.dumps({'text': SKILL_TEXT_DATA}))] * 2
+        assert sink.get_values(metrics.RESPONSE_BYTES, **tags) == [len(json.dumps(SKILLS_EMSI_RESPONSE))] * 2
+        assert sink.get_count(metrics.REQUESTS, service='emsi', endpoint='oauth_access_token', status='200') == 1
+        assert sink.get_count(metrics.TOKEN_REFRESHES, service='emsi', scope='emsi_open') == 1
+
     @mock_api_response(
         method=responses.GET,
         url=EMSISkillsApiClient.API_BASE_URL + f'/skills/{SKILL_ID}',
@@ -195,6 +303,49 @@ class TestEMSISkillsApiClient(TaxonomyTestCase):
         with raises(TaxonomyAPIError, match='Error while fetching skill details.'):
             self.client.get_skill_details(SKILL_ID)
 
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/skills',
+        json=SKILLS_DETAILS_EMSI_RESPONSE,
+    )
+    def test_get_skills_details(self):
+        """
+        Validate that the details of many skills are fetched in a single request.
+        """
+        skill_ids = [skill['id'] for skill in SKILLS_DETAILS_EMSI_RESPONSE['data']]
+        skills = self.client.get_skills_details(skill_ids + ['UNKNOWN'])
+
+        assert skills == SKILLS_DETAILS_EMSI_RESPONSE
+        assert json.loads(responses.calls[-1].request.body) == {'ids': skill_ids + ['UNKNOWN']}
+        assert set(SkillDataParser.from_batch_response(skills)) == set(skill_ids)
+
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSISkillsApiClient.API_BASE_URL + '/skills',
+        json={},
+        status=400,
+    )
+    def test_get_skills_details_error(self):
+        """
+        Validate that the behavior of client when error occurs while fetching the details of many skills.
+        """
+        with raises(TaxonomyAPIError, match='Error while fetching skills details.'):
+            self.client.get_skills_details([SKILL_ID])
+
+    @mock_api_response(
+        method=responses.GET,
+        url=EMSISkillsApiClient.API_BASE_URL + '/skills',
+        json={'data': [SKILL_DETAILS_EMSI_RESPONSE['data']]},
+    )
+    def test_get_all_skills(self):
+        """
+        Validate that all the skills are fetched with the requested fields.
+        """
+        skills = self.client.get_all_skills(fields=('id', 'category'))
+
+        assert skills == {'data': [SKILL_DETAILS_EMSI_RESPONSE['data']]}
+        assert responses.calls[-1].request.url.endswith('/skills?fields=id%2Ccategory')
+
 
 class TestEMSIJobsApiClient(TaxonomyTestCase):
     """
@@ -223,6 +374,20 @@ class TestEMSIJobsApiClient(TaxonomyTestCase):
 
         assert jobs == JOBS
 
+    @mock_api_response(
+        method=responses.POST,
+        url=EMSIJobsApiClient.API_BASE_URL + '/rankings/{}/rankings/{}'.format(
+            RankingFacet.TITLE_NAME.value, RankingFacet.SKILLS_NAME.value
+        ),
+        body='{"data": ',
+    )
+    def test_get_jobs_invalid_json(self):
+        """
+        Validate that a response that is not valid JSON is reported as an API error.
+        """
+        with raises(TaxonomyAPIError, match='Error while fetching job rankings'):
+            self.client.get_jobs(RankingFacet.TITLE_NAME, RankingFacet.SKILLS_NAME, JOBS_FILTER)
+
     @mock_api_response(
         method=responses.POST,
         url=EMSIJobsApiClient.API_BASE_URL + '/rankings/{}/rankings/{}'.format(
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the EMSI rate limiter.
+"""
+
+import mock
+from pytest import raises
+
+from taxonomy.emsi.rate_limiter import TokenBucketRateLimiter
+from test_utils.testcase import TaxonomyTestCase
+
+
+class TestTokenBucketRateLimiter(TaxonomyTestCase):
+    """
+    Validate that the token bucket rate limiter throttles calls appropriately.
+    """
+
+    @mock.patch('taxonomy.emsi.rate_limiter.sleep')
+    @mock.patch('taxonomy.emsi.rate_limiter.monotonic')
+    def test_acquire(self, monotonic_mock, sleep_mock):
+        """
+        Validate that `acquire` allows a burst of `capacity` calls and throttles the rest to `rate` calls per second.
+        """
+        monotonic_mock.return_value = 100
+        rate_limiter = TokenBucketRateLimiter(rate=5, capacity=5)
+
+        for _ in range(5):
+            rate_limiter.acquire()
+        assert sleep_mock.call_count == 0
+
+        rate_limiter.acquire()
+        rate_limiter.acquire()
+        assert [round(call.args[0], 2) for call in sleep_mock.call_args_list] == [0.2, 0.4]
+
+        # bucket is refilled once enough time has passed.
+        sleep_mock.reset_mock()
+        monotonic_mock.return_value = 110
+        for _ in range(5):
+            rate_limiter.acquire()
+        assert sleep_mock.call_count == 0
+
+    @mock.patch('taxonomy.emsi.rate_limiter.sleep')
+    @mock.patch('taxonomy.emsi.rate_limiter.monotonic', mock.Mock(return_value=100))
+    def test_first_second_calls(self, sleep_mock):
+        """
+        Validate that the default capacity releases at most `rate` calls in the first second.
+        """
+        rate_limiter = TokenBucketRateLimiter(rate=5)
+
+        released_at = []
+        for _ in range(20):
+            sleep_mock.reset_mock()
+            rate_limiter.acquire()
+            released_at.append(sleep_mock.call_args.args[0] if sleep_mock.called else 0)
+
+        assert len([release for release in released_at if release < 1]) == 5
+        assert len([release for release in released_at if release < 2]) == 10
+
+    def test_invalid_rate(self):
+        """
+        Validate that a rate limiter can not be created with a non positive rate.
+        """
+        with raises(ValueError):
+            TokenBucketRateLimiter(rate=0)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the HTTP transport of the EMSI clients.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import mock
+from pytest import raises
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import InvalidJSONError
+
+from django.test import override_settings
+
+from taxonomy import metrics, replay
+from taxonomy.emsi import transport
+from test_utils.testcase import TaxonomyTestCase
+
+
+class FlakyRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler answering 429 with a `Retry-After` header to the first request and 200 to the others.
+    """
+
+    request_count = 0
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """
+        Do not log the requests.
+        """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Answer a GET request.
+        """
+        FlakyRequestHandler.request_count += 1
+        if FlakyRequestHandler.request_count == 1:
+            self.send_response(429)
+            self.send_header('Retry-After', '3')
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class TestTransport(TaxonomyTestCase):
+    """
+    Validate the pooled and retrying HTTP transport shared by the EMSI clients.
+    """
+
+    def setUp(self):
+        super().setUp()
+        transport.get_http_adapter.cache_clear()
+        self.addCleanup(transport.get_http_adapter.cache_clear)
+
+    @override_settings(EMSI_API_BACKOFF_FACTOR=2)
+    @mock.patch('taxonomy.emsi.transport.random.uniform')
+    def test_backoff_is_jittered(self, uniform_mock):
+        """
+        Validate that the backoff time is drawn between zero and the exponential backoff time.
+        """
+        uniform_mock.side_effect = lambda low, high: high / 2
+        retry = transport.get_retry_policy()
+        assert retry.get_backoff_time() == 0
+
+        retry = retry.increment(method='GET', url='/').increment(method='GET', url='/')
+        assert retry.get_backoff_time() == 2
+        uniform_mock.assert_called_with(0, 4)
+
+    @override_settings(
+        EMSI_API_POOL_SIZE=3, EMSI_API_CONNECT_TIMEOUT=2, EMSI_API_READ_TIMEOUT=7, EMSI_API_MAX_RETRIES=4,
+    )
+    def test_adapter_is_configured_and_shared(self):
+        """
+        Validate that all the sessions share a single adapter configured from the settings.
+        """
+        adapter = transport.get_http_adapter()
+        assert adapter.timeout == (2, 7)
+        assert adapter.max_retries.total == 4
+        assert adapter._pool_maxsize == 3  # pylint: disable=protected-access
+
+        for session in (transport.create_session(), transport.create_session(), replay.get_http_session()):
+            assert session.get_adapter('https://emsiservices.com') is adapter
+            assert session.get_adapter('http://localhost') is adapter
+
+    @mock.patch.object(HTTPAdapter, 'send')
+    def test_default_timeout(self, send_mock):
+        """
+        Validate that requests sent without a timeout use the default connect and read timeouts.
+        """
+        send_mock.return_value = Response()
+        send_mock.return_value.status_code = 200
+        session = transport.create_session()
+        session.get('https://emsiservices.com/skills')
+        assert send_mock.call_args[1]['timeout'] == (5, 60)
+
+        session.get('https://emsiservices.com/skills', timeout=1)
+        assert send_mock.call_args[1]['timeout'] == 1
+
+    def test_retry_after_is_honored(self):
+        """
+        Validate that a 429 response is retried after the time given in its `Retry-After` header.
+        """
+        FlakyRequestHandler.request_count = 0
+        server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyRequestHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        sink = metrics.InMemoryMetricsSink()
+        metrics.add_sink(sink)
+        self.addCleanup(metrics.remove_sink, sink)
+        try:
+            with mock.patch('urllib3.util.retry.time.sleep') as sleep_mock, metrics.measure('emsi', 'test'):
+                response = transport.create_session().get('http://127.0.0.1:{}/'.format(server.server_address[1]))
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        assert response.status_code == 200
+        assert FlakyRequestHandler.request_count == 2
+        sleep_mock.assert_called_once_with(3)
+        assert sink.get_count(metrics.RETRIES, service='emsi', endpoint='test') == 1
+        assert sink.get_count(metrics.REQUESTS, service='emsi', endpoint='test', status='200') == 1
+
+    def test_json_decoder(self):
+        """
+        Validate that responses are decoded with orjson unless another decoder is configured.
+        """
+        expected_data = {'data': {'ranking': {'buckets': [{'name': '15.0120'}]}}}
+        response = Response()
+        response._content = json.dumps(expected_data).encode('utf-8')  # pylint: disable=protected-access
+
+        with mock.patch('taxonomy.emsi.transport.orjson') as orjson_mock:
+            assert transport.get_json_decoder() is orjson_mock.loads
+        with mock.patch('taxonomy.emsi.transport.orjson', None):
+            assert transport.get_json_decoder() is json.loads
+        assert transport.decode_json(response) == expected_data
+
+        with override_settings(EMSI_API_JSON_DECODER='json.loads'):
+            assert transport.get_json_decoder() is json.loads
+            assert transport.decode_json(response) == expected_data
+
+        response._content = b'{"data": '  # pylint: disable=protected-access
+        with raises(InvalidJSONError):
+            transport.decode_json(response)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the django management command `download_skill_taxonomy_snapshot`.
+"""
+import responses
+from pytest import mark, raises
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from taxonomy.emsi.client import EMSISkillsApiClient
+from taxonomy.models import SkillTaxonomySnapshot
+from test_utils import factories
+from test_utils.testcase import TaxonomyTestCase
+
+ALL_SKILLS = {
+    'data': [
+        {
+            'id': 'SKILL1',
+            'name': 'Skill One',
+            'description': 'Description of skill one.',
+            'category': {'id': 1, 'name': 'Category'},
+            'subcategory': {'id': 10, 'name': 'Subcategory'},
+        },
+        {
+            'id': 'SKILL2',
+            'name': 'Skill Two',
+            'description': None,
+            'category': {'id': 0, 'name': 'NULL'},
+            'subcategory': {'id': 100, 'name': 'NULL'},
+        },
+    ]
+}
+
+
+@mark.django_db
+class DownloadSkillTaxonomySnapshotCommandTests(TaxonomyTestCase):
+    """
+    Test command `download_skill_taxonomy_snapshot`.
+    """
+    command = 'download_skill_taxonomy_snapshot'
+
+    def setUp(self):
+        super().setUp()
+        self.mock_access_token()
+
+    @responses.activate
+    def test_snapshot_stored(self):
+        """
+        Test that the command replaces the snapshot of the pinned skills API version with all the skills.
+        """
+        factories.SkillTaxonomySnapshotFactory(external_id='STALE')
+        other_version = factories.SkillTaxonomySnapshotFactory(external_id='STALE', api_version='7.0')
+        responses.add(method=responses.GET, url=EMSISkillsApiClient.API_BASE_URL + '/skills', json=ALL_SKILLS)
+
+        call_command(self.command)
+
+        snapshot = SkillTaxonomySnapshot.objects.filter(api_version=EMSISkillsApiClient.API_VERSION)
+        assert {entry.external_id for entry in snapshot} == {'SKILL1', 'SKILL2'}
+        skill_1, skill_2 = snapshot.get(external_id='SKILL1'), snapshot.get(external_id='SKILL2')
+        assert (skill_1.category_id, skill_1.category_name, skill_1.subcategory_id, skill_1.subcategory_name) == (
+            1, 'Category', 10, 'Subcategory',
+        )
+        assert skill_1.description == 'Description of skill one.'
+        assert (skill_2.category_id, skill_2.subcategory_id, skill_2.description) == (None, None, '')
+        assert SkillTaxonomySnapshot.objects.filter(id=other_version.id).exists()
+        assert 'fields=id%2Cname%2Cdescription%2Ccategory%2Csubcategory' in responses.calls[-1].request.url
+
+    @responses.activate
+    def test_snapshot_kept_upon_error(self):
+        """
+        Test that the command keeps the current snapshot when EMSI returns an error.
+        """
+        factories.SkillTaxonomySnapshotFactory()
+        responses.add(method=responses.GET, url=EMSISkillsApiClient.API_BASE_URL + '/skills', json={}, status=500)
+
+        with raises(CommandError, match='Taxonomy API Error for downloading the skill taxonomy snapshot.'):
+            call_command(self.command)
+        assert SkillTaxonomySnapshot.objects.count() == 1
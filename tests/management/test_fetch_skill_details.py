@@ -2,20 +2,21 @@
 """
 Tests for the django management command `fetch_skill_details`.
 """
+import json
+
 import responses
-from pytest import mark, raises
 from faker import Faker
+from pytest import mark, raises
 
 from django.core.management import call_command
 from django.core.management.base import CommandError
 
-from test_utils import factories
-from test_utils.testcase import TaxonomyTestCase
-
-from taxonomy.models import Skill, SkillCategory, SkillSubCategory
 from taxonomy.emsi.client import EMSISkillsApiClient
 from taxonomy.emsi.parsers.skill_parsers import INVALID_NAMES
-
+from taxonomy.exceptions import InvalidCommandOptionsError
+from taxonomy.models import Skill, SkillCategory, SkillSubCategory
+from test_utils import factories
+from test_utils.testcase import TaxonomyTestCase
 
 FAKER = Faker()
 
@@ -228,3 +229,85 @@ class RefreshCourseSkillsCommandTests(TaxonomyTestCase):
         # Validate the for missing category and subcategory both category and subcategory are not saved.
         assert SkillCategory.objects.count() == 0
         assert SkillSubCategory.objects.count() == 0
+
+    @responses.activate
+    def test_batch_mode_saves_skill_category_and_subcategory(self):
+        """
+        Test that the command fetches the details of many skills per request in batch mode.
+        """
+        skills = factories.SkillFactory.create_batch(5, category=None, subcategory=None)
+        skill_details = {
+            skill.external_id: {
+                'id': skill.external_id,
+                'category': {'id': index, 'name': f'category {index}'},
+                'subcategory': {'id': index, 'name': f'subcategory {index}'},
+            } for index, skill in enumerate(skills[:4])
+        }
+
+        def retrieve_callback(request):
+            skill_ids = json.loads(request.body)['ids']
+            data = [skill_details[skill_id] for skill_id in skill_ids if skill_id in skill_details]
+            return 200, {}, json.dumps({'data': data})
+
+        responses.add_callback(
+            method=responses.POST,
+            url=EMSISkillsApiClient.API_BASE_URL + '/skills',
+            callback=retrieve_callback,
+            content_type='application/json',
+        )
+
+        call_command(self.command, '--batch', '--batch-size', '2')
+
+        retrieve_calls = [call for call in responses.calls if call.request.url.endswith('/skills')]
+        assert len(retrieve_calls) == 3
+        assert set(Skill.objects.filter(category__isnull=False, subcategory__isnull=False)) == set(skills[:4])
+        assert Skill.objects.get(id=skills[4].id).category is None
+
+    def test_invalid_batch_size(self):
+        """
+        Test that the command validates the batch size.
+        """
+        with raises(InvalidCommandOptionsError, match='The batch size must be at least 1.'):
+            call_command(self.command, '--batch', '--batch-size', '0')
+
+    def test_skill_details_resolved_from_snapshot(self):
+        """
+        Test that the command resolves skill details from the local snapshot without any request to EMSI.
+        """
+        category = factories.SkillCategoryFactory()
+        subcategory = factories.SkillSubCategoryFactory(category=category)
+        resolved = factories.SkillFactory(category=None, subcategory=None, description='')
+        partially_resolved = factories.SkillFactory(category=category, subcategory=None)
+        invalid_category = factories.SkillFactory(category=None, subcategory=None)
+        unknown = factories.SkillFactory(category=None, subcategory=None)
+        factories.SkillTaxonomySnapshotFactory(
+            external_id=resolved.external_id, category_id=category.id, category_name=category.name,
+            subcategory_id=subcategory.id, subcategory_name=subcategory.name, description='Snapshot description.',
+        )
+        factories.SkillTaxonomySnapshotFactory(
+            external_id=partially_resolved.external_id, category_id=category.id, category_name=category.name,
+            subcategory_id=12345, subcategory_name='New subcategory',
+        )
+        factories.SkillTaxonomySnapshotFactory(
+            external_id=invalid_category.external_id, category_id=None, subcategory_id=None,
+        )
+
+        with responses.RequestsMock():
+            call_command(self.command, '--from-snapshot')
+
+        resolved.refresh_from_db()
+        assert (resolved.category, resolved.subcategory) == (category, subcategory)
+        assert resolved.description == 'Snapshot description.'
+        partially_resolved.refresh_from_db()
+        assert partially_resolved.subcategory == SkillSubCategory.objects.get(id=12345, category=category)
+        assert Skill.objects.get(id=invalid_category.id).category is None
+        assert Skill.objects.get(id=unknown.id).category is None
+
+    def test_missing_snapshot(self):
+        """
+        Test that the command asks for a snapshot to be downloaded when none is stored.
+        """
+        factories.SkillTaxonomySnapshotFactory(api_version='7.0')
+
+        with raises(CommandError, match='No skill taxonomy snapshot found for EMSI skills API version'):
+            call_command(self.command, '--from-snapshot')
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the django management command `prune_skills_extraction_cache`.
+"""
+
+from datetime import timedelta
+
+from pytest import mark
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from taxonomy.models import SkillsExtractionCache
+from test_utils.factories import SkillsExtractionCacheFactory
+from test_utils.testcase import TaxonomyTestCase
+
+
+@mark.django_db
+class PruneSkillsExtractionCacheCommandTests(TaxonomyTestCase):
+    """
+    Test command `prune_skills_extraction_cache`.
+    """
+    command = 'prune_skills_extraction_cache'
+
+    def _create_entry(self, age):
+        """
+        Create a cache entry that was last refreshed `age` seconds ago.
+        """
+        entry = SkillsExtractionCacheFactory()
+        SkillsExtractionCache.objects.filter(id=entry.id).update(modified=timezone.now() - timedelta(seconds=age))
+        return entry
+
+    def test_expired_entries_deleted(self):
+        """
+        Test that the command deletes entries older than the TTL.
+        """
+        fresh_entry = self._create_entry(age=10)
+        self._create_entry(age=1000)
+
+        call_command(self.command, '--ttl', '100')
+
+        self.assertEqual(list(SkillsExtractionCache.objects.values_list('id', flat=True)), [fresh_entry.id])
+
+    def test_oldest_entries_evicted(self):
+        """
+        Test that the command evicts the least recently refreshed entries over the maximum size.
+        """
+        newest_entry = self._create_entry(age=10)
+        newer_entry = self._create_entry(age=20)
+        self._create_entry(age=30)
+        self._create_entry(age=40)
+
+        call_command(self.command, '--max-entries', '2')
+
+        self.assertEqual(
+            set(SkillsExtractionCache.objects.values_list('id', flat=True)),
+            {newest_entry.id, newer_entry.id}
+        )
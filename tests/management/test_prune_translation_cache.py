@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the django management command `prune_translation_cache`.
+"""
+
+from pytest import mark
+
+from django.core.management import call_command
+
+from taxonomy.models import TranslationCache
+from test_utils.factories import TranslationCacheFactory, TranslationFactory
+from test_utils.testcase import TaxonomyTestCase
+
+
+@mark.django_db
+class PruneTranslationCacheCommandTests(TaxonomyTestCase):
+    """
+    Test command `prune_translation_cache`.
+    """
+    command = 'prune_translation_cache'
+
+    def test_unreferenced_entries_deleted(self):
+        """
+        Test that the command deletes the entries no translation references and keeps the others.
+        """
+        referenced_entry = TranslationCacheFactory()
+        TranslationFactory(translation_cache=referenced_entry)
+        TranslationFactory(translation_cache=referenced_entry)
+        TranslationCacheFactory()
+
+        call_command(self.command)
+
+        self.assertEqual(list(TranslationCache.objects.values_list('id', flat=True)), [referenced_entry.id])
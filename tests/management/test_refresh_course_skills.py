@@ -12,9 +12,20 @@ from pytest import mark
 from testfixtures import LogCapture
 
 from django.core.management import call_command
+from django.test import override_settings
 
+from taxonomy.choices import ProductTypes
 from taxonomy.exceptions import CourseMetadataNotFoundError, InvalidCommandOptionsError, TaxonomyAPIError
-from taxonomy.models import CourseSkills, RefreshCourseSkillsConfig, Skill
+from taxonomy.models import (
+    CourseSkills,
+    ProductContentHash,
+    ProductSkillsRefreshRun,
+    ProductSkillsRetry,
+    RefreshCourseSkillsConfig,
+    Skill,
+    SkillsExtractionCache,
+)
+from test_utils.factories import ProductSkillsRefreshRunFactory, ProductSkillsRetryFactory
 from test_utils.mocks import MockCourse, mock_as_dict
 from test_utils.providers import DiscoveryCourseMetadataProvider
 from test_utils.sample_responses.skills import MISSING_NAME_SKILLS, SKILLS_EMSI_CLIENT_RESPONSE, TYPE_ERROR_SKILLS
@@ -144,6 +155,220 @@ class RefreshCourseSkillsCommandTests(TaxonomyTestCase):
         self.assertEqual(skill.count(), 4)
         self.assertEqual(course_skill.count(), 12)
 
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    def test_unchanged_course_skipped(self, get_product_skills_mock, get_course_provider_mock):
+        """
+        Test that the command skips courses whose text has not changed unless --force is provided.
+        """
+        get_product_skills_mock.return_value = self.skills_emsi_client_response
+        get_course_provider_mock.return_value = DiscoveryCourseMetadataProvider([self.course_1, self.course_2])
+
+        call_command(self.command, '--all', '--commit')
+        self.assertEqual(get_product_skills_mock.call_count, 2)
+        self.assertEqual(
+            ProductContentHash.objects.filter(product_identifier__in=[self.course_1.key, self.course_2.key]).count(),
+            2
+        )
+
+        call_command(self.command, '--all', '--commit')
+        self.assertEqual(get_product_skills_mock.call_count, 2)
+
+        self.course_2.full_description = 'Updated full description'
+        call_command(self.command, '--all', '--commit')
+        self.assertEqual(get_product_skills_mock.call_count, 3)
+
+        call_command(self.command, '--all', '--commit', '--force')
+        self.assertEqual(get_product_skills_mock.call_count, 5)
+
+    def test_resume_without_all(self):
+        """
+        Test that --resume can only be used along with --all and --commit.
+        """
+        with self.assertRaisesRegex(
+                InvalidCommandOptionsError,
+                'The resume argument can only be used with all and commit arguments.'
+        ):
+            call_command(self.command, '--course', self.course_1.key, '--commit', '--resume')
+
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    def test_refresh_run_resumed(self, get_product_skills_mock, get_course_provider_mock):
+        """
+        Test that the command records the progress of --all runs and --resume skips the already processed courses.
+        """
+        get_product_skills_mock.return_value = self.skills_emsi_client_response
+        get_course_provider_mock.return_value = DiscoveryCourseMetadataProvider(
+            [self.course_1, self.course_2, self.course_3]
+        )
+        interrupted_run = ProductSkillsRefreshRunFactory(
+            product_type=ProductTypes.Course, cursor=2, success_count=2, skipped_count=0
+        )
+
+        call_command(self.command, '--all', '--commit', '--resume')
+
+        self.assertEqual(get_product_skills_mock.call_count, 1)
+        self.assertEqual(CourseSkills.objects.filter(course_key=self.course_3.key).count(), 4)
+        self.assertEqual(CourseSkills.objects.filter(course_key=self.course_1.key).count(), 0)
+        interrupted_run.refresh_from_db()
+        self.assertEqual(interrupted_run.cursor, 3)
+        self.assertEqual(interrupted_run.success_count, 3)
+        self.assertTrue(interrupted_run.is_completed)
+
+        # Without an incomplete run, --resume starts a new run from the first course.
+        call_command(self.command, '--all', '--commit', '--resume', '--force')
+        self.assertEqual(get_product_skills_mock.call_count, 4)
+        new_run = ProductSkillsRefreshRun.objects.exclude(id=interrupted_run.id).get()
+        self.assertEqual(new_run.cursor, 3)
+        self.assertTrue(new_run.is_completed)
+
+    def test_retry_queued_without_commit(self):
+        """
+        Test that --retry-queued can only be used along with --commit.
+        """
+        with self.assertRaisesRegex(
+                InvalidCommandOptionsError,
+                'The retry queued argument can only be used with commit argument.'
+        ):
+            call_command(self.command, '--retry-queued')
+
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    def test_queued_courses_retried(self, get_product_skills_mock, get_course_provider_mock):
+        """
+        Test that --retry-queued refreshes the courses queued for retry and empties the queue.
+        """
+        get_product_skills_mock.return_value = self.skills_emsi_client_response
+        get_course_provider_mock.return_value = DiscoveryCourseMetadataProvider([self.course_1])
+        ProductSkillsRetryFactory(product_type=ProductTypes.Course, product_uuid=self.course_1.uuid)
+        ProductSkillsRetryFactory(product_type=ProductTypes.Program)
+
+        call_command(self.command, '--retry-queued', '--commit')
+
+        self.assertEqual(get_product_skills_mock.call_count, 1)
+        self.assertEqual(CourseSkills.objects.filter(course_key=self.course_1.key).count(), 4)
+        self.assertFalse(ProductSkillsRetry.objects.filter(product_type=ProductTypes.Course).exists())
+        self.assertTrue(ProductSkillsRetry.objects.filter(product_type=ProductTypes.Program).exists())
+
+        with LogCapture(level=logging.INFO) as log_capture:
+            call_command(self.command, '--retry-queued', '--commit')
+        log_capture.check_present(
+            ('taxonomy.management.commands.refresh_course_skills', 'INFO', '[TAXONOMY] No courses queued for retry.')
+        )
+        self.assertEqual(get_product_skills_mock.call_count, 1)
+
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    def test_queued_courses_kept_until_refreshed(self, get_product_skills_mock, get_course_provider_mock):
+        """
+        Test that --retry-queued only removes the courses refreshed successfully from the queue.
+        """
+        get_product_skills_mock.side_effect = [self.skills_emsi_client_response, TaxonomyAPIError]
+        get_course_provider_mock.return_value = DiscoveryCourseMetadataProvider([self.course_1, self.course_2])
+        ProductSkillsRetryFactory(product_type=ProductTypes.Course, product_uuid=self.course_1.uuid)
+        ProductSkillsRetryFactory(product_type=ProductTypes.Course, product_uuid=self.course_2.uuid)
+
+        with override_settings(EMSI_API_MAX_WORKERS=1):
+            call_command(self.command, '--retry-queued', '--commit')
+
+        self.assertEqual(
+            list(ProductSkillsRetry.objects.values_list('product_uuid', flat=True)), [str(self.course_2.uuid)]
+        )
+
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    def test_queued_courses_kept_when_interrupted(self, get_product_skills_mock, get_course_provider_mock):
+        """
+        Test that the courses queued for retry are kept when --retry-queued is interrupted.
+        """
+        get_product_skills_mock.return_value = self.skills_emsi_client_response
+        get_course_provider_mock.return_value = DiscoveryCourseMetadataProvider([self.course_1])
+        ProductSkillsRetryFactory(product_type=ProductTypes.Course, product_uuid=self.course_1.uuid)
+
+        with mock.patch('taxonomy.utils.process_skills_data', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                call_command(self.command, '--retry-queued', '--commit')
+
+        self.assertEqual(
+            list(ProductSkillsRetry.objects.values_list('product_uuid', flat=True)), [str(self.course_1.uuid)]
+        )
+
+    def test_invalid_shard_index(self):
+        """
+        Test that the shard index must be within the shard count.
+        """
+        with self.assertRaisesRegex(
+                InvalidCommandOptionsError,
+                'The shard index must be at least 0 and less than the shard count.'
+        ):
+            call_command(self.command, '--all', '--shard-index', '2', '--shard-count', '2')
+
+    def test_record_and_replay(self):
+        """
+        Test that traffic can not be recorded and replayed at the same time.
+        """
+        with self.assertRaisesRegex(
+                InvalidCommandOptionsError,
+                'Only one of record and replay arguments can be provided.'
+        ):
+            call_command(self.command, '--all', '--record', 'traffic.jsonl.gz', '--replay', 'traffic.jsonl.gz')
+
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
+    @mock.patch('taxonomy.management.base.replay.replay_traffic')
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.refresh_product_skills')
+    def test_replay(self, refresh_product_skills_mock, replay_traffic_mock, get_course_provider_mock):
+        """
+        Test that the courses are refreshed while replaying the given archive.
+        """
+        get_course_provider_mock.return_value = DiscoveryCourseMetadataProvider([self.course_1])
+
+        call_command(self.command, '--all', '--replay', 'traffic.jsonl.gz', '--replay-latency', '0.2')
+
+        replay_traffic_mock.assert_called_once_with('traffic.jsonl.gz', latency=0.2)
+        replay_traffic_mock.return_value.__enter__.assert_called_once()
+        refresh_product_skills_mock.assert_called_once()
+
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    def test_sharded_refresh(self, get_product_skills_mock, get_course_provider_mock):
+        """
+        Test that the shards of a sharded refresh split the courses between them.
+        """
+        get_product_skills_mock.return_value = self.skills_emsi_client_response
+        courses = [mock_as_dict(MockCourse()) for _ in range(6)]
+        get_course_provider_mock.return_value = DiscoveryCourseMetadataProvider(courses)
+
+        call_command(self.command, '--all', '--commit', '--shard-index', '0', '--shard-count', '2')
+        first_shard_calls = get_product_skills_mock.call_count
+        call_command(self.command, '--all', '--commit', '--shard-index', '1', '--shard-count', '2')
+
+        self.assertEqual(get_product_skills_mock.call_count, 6)
+        for course in courses:
+            self.assertEqual(CourseSkills.objects.filter(course_key=course.key).count(), 4)
+        refresh_runs = ProductSkillsRefreshRun.objects.filter(shard_count=2).order_by('shard_index')
+        self.assertEqual([refresh_run.shard_index for refresh_run in refresh_runs], [0, 1])
+        self.assertEqual(refresh_runs[0].success_count, first_shard_calls)
+        self.assertEqual(sum(refresh_run.success_count for refresh_run in refresh_runs), 6)
+
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
+    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    def test_cached_course_text_not_sent_to_emsi(self, get_product_skills_mock, get_course_provider_mock):
+        """
+        Test that the command serves skills of a previously extracted text from the skills extraction cache.
+        """
+        get_product_skills_mock.return_value = self.skills_emsi_client_response
+        get_course_provider_mock.return_value = DiscoveryCourseMetadataProvider([self.course_1])
+
+        call_command(self.command, '--all', '--commit')
+        self.assertEqual(get_product_skills_mock.call_count, 1)
+        self.assertEqual(SkillsExtractionCache.objects.count(), 1)
+
+        ProductContentHash.objects.all().delete()
+        CourseSkills.objects.all().delete()
+        call_command(self.command, '--all', '--commit')
+        self.assertEqual(get_product_skills_mock.call_count, 1)
+        self.assertEqual(CourseSkills.objects.filter(course_key=self.course_1.key).count(), 4)
+
     @mock.patch('taxonomy.management.commands.refresh_course_skills.get_course_metadata_provider')
     @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
     def test_course_skill_saved_with_all_param(self, get_product_skills_mock, get_course_provider_mock):
@@ -94,6 +94,25 @@ class RefreshJobSkillsCommandTests(TaxonomyTestCase):
         self.assertEqual(jobs.count(), 0)
         self.assertEqual(job_skills.count(), 0)
 
+    @responses.activate
+    @mock.patch('taxonomy.management.commands.refresh_job_skills.EMSIJobsApiClient.get_jobs')
+    def test_failed_chunk_skipped(self, get_jobs_mock):
+        """
+        Test that the command keeps refreshing the jobs of the remaining chunks after a chunk fails.
+        """
+        for _index in range(50):
+            SkillFactory()
+        Industry.objects.all().delete()
+        get_jobs_mock.side_effect = [TaxonomyAPIError('Custom error'), self.jobs]
+
+        err_string = _('Taxonomy API Error for refreshing the jobs for Ranking Facet {} and Nested Ranking Facet {}, '
+                       'Error: Custom error').format(RankingFacet.TITLE, RankingFacet.SKILLS)
+        with self.assertRaisesRegex(CommandError, err_string):
+            call_command(self.command)
+
+        self.assertEqual(get_jobs_mock.call_count, 2)
+        self.assertEqual(Job.objects.count(), 2)
+
     @responses.activate
     @mock.patch('taxonomy.management.commands.refresh_job_skills.EMSIJobsApiClient.get_jobs')
     def test_job_skill_not_saved_on_key_error(self, get_jobs_mock):
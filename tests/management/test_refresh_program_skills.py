@@ -13,8 +13,10 @@ from testfixtures import LogCapture
 
 from django.core.management import call_command
 
-from taxonomy.exceptions import ProgramMetadataNotFoundError, InvalidCommandOptionsError, TaxonomyAPIError
-from taxonomy.models import ProgramSkill, RefreshProgramSkillsConfig, Skill
+from taxonomy.choices import ProductTypes
+from taxonomy.exceptions import InvalidCommandOptionsError, ProgramMetadataNotFoundError, TaxonomyAPIError
+from taxonomy.models import ProductContentHash, ProgramSkill, RefreshProgramSkillsConfig, Skill
+from test_utils.factories import ProductSkillsRefreshRunFactory
 from test_utils.mocks import MockProgram, mock_as_dict
 from test_utils.providers import DiscoveryProgramMetadataProvider
 from test_utils.sample_responses.skills import MISSING_NAME_SKILLS, SKILLS_EMSI_CLIENT_RESPONSE, TYPE_ERROR_SKILLS
@@ -110,7 +112,7 @@ class RefreshProgramSkillsCommandTests(TaxonomyTestCase):
         self.assertEqual(program_skill.count(), 0)
 
     @mock.patch('taxonomy.management.commands.refresh_program_skills.get_program_metadata_provider')
-    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    @mock.patch('taxonomy.management.commands.refresh_program_skills.utils.EMSISkillsApiClient.get_product_skills')
     def test_program_skill_saved(self, get_product_skills_mock, get_program_provider_mock):
         """
         Test that the command creates a Skill and many ProgramSkill records.
@@ -143,7 +145,7 @@ class RefreshProgramSkillsCommandTests(TaxonomyTestCase):
         self.assertEqual(program_skill.count(), 12)
 
     @mock.patch('taxonomy.management.commands.refresh_program_skills.get_program_metadata_provider')
-    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    @mock.patch('taxonomy.management.commands.refresh_program_skills.utils.EMSISkillsApiClient.get_product_skills')
     def test_course_skill_saved_with_all_param(self, get_product_skills_mock, get_program_provider_mock):
         """
         Test that the command creates a Skill and many ProgramSkill records using --all param.
@@ -162,9 +164,52 @@ class RefreshProgramSkillsCommandTests(TaxonomyTestCase):
         self.assertEqual(skill.count(), 4)
         self.assertEqual(program_skill.count(), 12)
 
+    @mock.patch('taxonomy.management.commands.refresh_program_skills.get_program_metadata_provider')
+    @mock.patch('taxonomy.management.commands.refresh_program_skills.utils.EMSISkillsApiClient.get_product_skills')
+    @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
+    def test_unchanged_program_skipped(self, mock_program_overview, get_product_skills_mock, get_program_provider_mock):
+        """
+        Test that the command skips programs whose overview has not changed unless --force is provided.
+        """
+        mock_program_overview.return_value = 'program overview translation'
+        get_product_skills_mock.return_value = self.skills_emsi_client_response
+        get_program_provider_mock.return_value = DiscoveryProgramMetadataProvider([self.program_1])
+
+        call_command(self.command, '--all', '--commit')
+        call_command(self.command, '--all', '--commit')
+        self.assertEqual(get_product_skills_mock.call_count, 1)
+        self.assertTrue(
+            ProductContentHash.objects.filter(
+                product_type=ProductTypes.Program, product_identifier=str(self.program_1.uuid)
+            ).exists()
+        )
+
+        call_command(self.command, '--all', '--commit', '--force')
+        self.assertEqual(get_product_skills_mock.call_count, 2)
+
+    @mock.patch('taxonomy.management.commands.refresh_program_skills.get_program_metadata_provider')
+    @mock.patch('taxonomy.management.commands.refresh_program_skills.utils.EMSISkillsApiClient.get_product_skills')
+    def test_refresh_run_resumed(self, get_product_skills_mock, get_program_provider_mock):
+        """
+        Test that --resume skips the programs already processed by the last incomplete run.
+        """
+        get_product_skills_mock.return_value = self.skills_emsi_client_response
+        get_program_provider_mock.return_value = DiscoveryProgramMetadataProvider(
+            [self.program_1, self.program_2, self.program_3]
+        )
+        interrupted_run = ProductSkillsRefreshRunFactory(product_type=ProductTypes.Program, cursor=1)
+
+        call_command(self.command, '--all', '--commit', '--resume')
+
+        self.assertEqual(get_product_skills_mock.call_count, 2)
+        self.assertFalse(ProgramSkill.objects.filter(program_uuid=self.program_1.uuid).exists())
+        interrupted_run.refresh_from_db()
+        self.assertEqual(interrupted_run.cursor, 3)
+        self.assertTrue(interrupted_run.is_completed)
+
     @responses.activate
     @mock.patch('taxonomy.management.commands.refresh_program_skills.get_program_metadata_provider')
-    @mock.patch('taxonomy.management.commands.refresh_course_skills.utils.EMSISkillsApiClient.get_product_skills')
+    @mock.patch('taxonomy.management.commands.refresh_program_skills.utils.EMSISkillsApiClient.get_product_skills')
     @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
     def test_program_skill_not_saved_upon_exception(self,
                                                     mock_program_description,
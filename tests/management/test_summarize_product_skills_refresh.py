@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the django management command `summarize_product_skills_refresh`.
+"""
+
+import logging
+
+from pytest import mark
+from testfixtures import LogCapture
+
+from django.core.management import call_command
+
+from taxonomy.choices import ProductTypes
+from taxonomy.exceptions import InvalidCommandOptionsError
+from test_utils.factories import ProductSkillsRefreshRunFactory
+from test_utils.testcase import TaxonomyTestCase
+
+
+@mark.django_db
+class SummarizeProductSkillsRefreshCommandTests(TaxonomyTestCase):
+    """
+    Test command `summarize_product_skills_refresh`.
+    """
+    command = 'summarize_product_skills_refresh'
+
+    def test_invalid_shard_count(self):
+        """
+        Test that the shard count must be positive.
+        """
+        with self.assertRaisesRegex(InvalidCommandOptionsError, 'The shard count must be at least 1.'):
+            call_command(self.command, '--shard-count', '0')
+
+    def test_summary_aggregates_latest_shard_runs(self):
+        """
+        Test that the command aggregates the counts of the latest run of every shard.
+        """
+        ProductSkillsRefreshRunFactory(
+            shard_index=0, shard_count=3, success_count=100, skipped_count=100, failure_count=100, is_completed=True
+        )
+        ProductSkillsRefreshRunFactory(
+            shard_index=0, shard_count=3, success_count=5, skipped_count=1, failure_count=2, is_completed=True
+        )
+        ProductSkillsRefreshRunFactory(
+            shard_index=1, shard_count=3, success_count=3, skipped_count=2, failure_count=0, is_completed=False
+        )
+        ProductSkillsRefreshRunFactory(
+            product_type=ProductTypes.Program, shard_index=2, shard_count=3, success_count=7, is_completed=True
+        )
+        ProductSkillsRefreshRunFactory(shard_index=0, shard_count=1, success_count=9, is_completed=True)
+
+        with LogCapture(level=logging.INFO) as log_capture:
+            call_command(self.command, '--product-type', ProductTypes.Course, '--shard-count', '3')
+
+        self.assertEqual(len(log_capture.records), 1)
+        self.assertEqual(
+            log_capture.records[0].getMessage(),
+            '[TAXONOMY] Refresh course skills summary of 3 shards. \n'
+            'Total course Updated Successfully: 8 \n'
+            'Total course Skipped: 3 \n'
+            'Total Failures: 2 \n'
+            'Pending Shards: [1, 2] \n'
+        )
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the django management command `translate_products`.
+"""
+
+import mock
+from pytest import mark
+
+from django.core.management import call_command
+
+from taxonomy.choices import ProductTypes
+from taxonomy.exceptions import InvalidCommandOptionsError
+from taxonomy.models import Translation
+from test_utils.mocks import MockCourse, MockProgram
+from test_utils.providers import DiscoveryCourseMetadataProvider, DiscoveryProgramMetadataProvider
+from test_utils.testcase import TaxonomyTestCase
+
+
+@mark.django_db
+class TranslateProductsCommandTests(TaxonomyTestCase):
+    """
+    Test command `translate_products`.
+    """
+    command = 'translate_products'
+
+    def test_missing_arguments(self):
+        """
+        Test that either products or all products must be translated.
+        """
+        with self.assertRaisesRegex(InvalidCommandOptionsError, 'Either product or all argument must be provided.'):
+            call_command(self.command)
+
+    @mock.patch('taxonomy.utils.translate_text')
+    @mock.patch('taxonomy.management.commands.translate_products.get_program_metadata_provider')
+    def test_program_translations_stored(self, get_program_provider_mock, translate_text_mock):
+        """
+        Test that the overviews of all the programs are translated and stored.
+        """
+        programs = [MockProgram(), MockProgram()]
+        get_program_provider_mock.return_value = DiscoveryProgramMetadataProvider(programs)
+        translate_text_mock.side_effect = lambda key, text, *args: {'SourceLanguageCode': 'es', 'TranslatedText': key}
+
+        call_command(self.command, '--product-type', ProductTypes.Program, '--all', '--max-workers', '2')
+
+        translations = Translation.objects.filter(source_model_name=ProductTypes.Program)
+        assert {(translation.source_record_identifier, translation.translated_text) for translation in translations} \
+            == {(str(program.uuid), str(program.uuid)) for program in programs}
+
+    @mock.patch('taxonomy.utils.translate_text')
+    @mock.patch('taxonomy.management.commands.translate_products.get_course_metadata_provider')
+    def test_up_to_date_translations_skipped(self, get_course_provider_mock, translate_text_mock):
+        """
+        Test that the texts of the courses are translated once across runs of the command.
+        """
+        course = MockCourse()
+        get_course_provider_mock.return_value = DiscoveryCourseMetadataProvider([course])
+        translate_text_mock.return_value = {'SourceLanguageCode': 'es', 'TranslatedText': 'translated description'}
+
+        call_command(self.command, '--product', str(course.uuid))
+        call_command(self.command, '--product', str(course.uuid))
+
+        assert translate_text_mock.call_count == 1
+        assert Translation.objects.get(source_record_identifier=course.key).translated_text == 'translated description'
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the offline detection of English text.
+"""
+
+import ddt
+
+from taxonomy.language_detection import get_english_confidence, is_english
+from test_utils.testcase import TaxonomyTestCase
+
+
+@ddt.ddt
+class TestLanguageDetection(TaxonomyTestCase):
+    """
+    Validate the confidence that texts are written in English.
+    """
+
+    @ddt.data(
+        '<p>Learn the basics of Python and how to use it in data science.</p>',
+        'This course is an introduction to machine learning, with hands-on projects using TensorFlow and Keras.',
+    )
+    def test_english_text_detected(self, text):
+        """
+        Validate that English texts are detected with full confidence.
+        """
+        assert get_english_confidence(text) == 1.0
+        assert is_english(text, 0.9)
+
+    @ddt.data(
+        '<p>Aprende los fundamentos de Python y cómo usarlo en la ciencia de datos.</p>',
+        'Ce cours vous permet de découvrir les bases de la programmation avec Python.',
+        'In diesem Kurs lernen Sie die Grundlagen der Programmierung mit Python.',
+        'Neste curso você aprenda os fundamentos da programação com Python e como usar.',
+        'Python data science',
+        '',
+    )
+    def test_other_text_not_detected(self, text):
+        """
+        Validate that texts in other languages, or without enough stopwords, are not detected as English.
+        """
+        assert get_english_confidence(text) == 0.0
+        assert not is_english(text, 0.9)
+
+    @ddt.data(
+        'Deze cursus is een introductie tot data science. Het is bedoeld voor studenten of professionals met '
+        'interesse in statistiek, en het was ontwikkeld door TU Delft.',
+        'Denna kurs är en introduktion till datavetenskap och maskininlärning för studenter och yrkesverksamma.',
+        'Kursus ini memperkenalkan dasar-dasar pemrograman Python untuk analisis data dan pembelajaran mesin.',
+    )
+    def test_unlisted_language_not_detected(self, text):
+        """
+        Validate that texts in languages without stopwords lists are not detected as English.
+        """
+        assert get_english_confidence(text) < 0.9
+        assert not is_english(text, 0.9)
+
+    def test_few_english_stopwords_penalized(self):
+        """
+        Validate that the confidence is weighted by the share of the words of the text that are English stopwords.
+        """
+        confidence = get_english_confidence(
+            'Python programming for beginners: variables, loops, functions, classes, modules, packages, decorators, '
+            'generators and testing with pytest.'
+        )
+        assert 0 < confidence < 0.9
+
+    def test_mixed_scripts_penalized(self):
+        """
+        Validate that the confidence is weighted by the share of ASCII letters of the text.
+        """
+        confidence = get_english_confidence('本课程介绍编程的基础知识 and the basics of it is for you')
+        assert 0 < confidence < 0.9
+
+    def test_detection_disabled(self):
+        """
+        Validate that no text is detected as English without a threshold.
+        """
+        assert not is_english('<p>Learn the basics of Python and how to use it in data science.</p>', None)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the metrics of the calls to the external services.
+"""
+
+import logging
+
+import mock
+from requests import PreparedRequest, Response
+from testfixtures import LogCapture
+
+from django.test import override_settings
+
+from taxonomy import metrics
+from test_utils.testcase import TaxonomyTestCase
+
+
+class TestMetrics(TaxonomyTestCase):
+    """
+    Validate the measurement of the calls and the metrics sinks.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.sink = metrics.InMemoryMetricsSink()
+        metrics.add_sink(self.sink)
+        self.addCleanup(metrics.remove_sink, self.sink)
+
+    @staticmethod
+    def _get_response(status_code, content, body):
+        """
+        Return a response with the given status and content to a request with the given body.
+        """
+        response = Response()
+        response.status_code = status_code
+        response._content = content  # pylint: disable=protected-access
+        response.request = PreparedRequest()
+        response.request.body = body
+        return response
+
+    def test_call_measured(self):
+        """
+        Validate that the status, sizes and latency of the responses received during a call are reported.
+        """
+        with metrics.measure('emsi', 'get_product_skills'):
+            metrics.record_response(self._get_response(200, b'{"data": []}', '{"text": "python"}'))
+
+        tags = {'service': 'emsi', 'endpoint': 'get_product_skills'}
+        assert self.sink.get_count(metrics.REQUESTS, status='200', **tags) == 1
+        assert self.sink.get_values(metrics.REQUEST_BYTES, **tags) == [18]
+        assert self.sink.get_values(metrics.RESPONSE_BYTES, **tags) == [12]
+        assert len(self.sink.get_values(metrics.LATENCY, **tags)) == 1
+        assert self.sink.get_count(metrics.RETRIES) == 0
+
+    def test_failed_call_measured(self):
+        """
+        Validate that a call raising an error is reported with the status of its response, `error` without one.
+        """
+        with self.assertRaises(ValueError):
+            with metrics.measure('emsi', 'get_jobs'):
+                metrics.record_response(self._get_response(503, b'', None))
+                raise ValueError
+        with self.assertRaises(ValueError):
+            with metrics.measure('emsi', 'get_jobs'):
+                raise ValueError
+
+        assert self.sink.get_count(metrics.REQUESTS, status='503') == 1
+        assert self.sink.get_count(metrics.REQUESTS, status='error') == 1
+        assert self.sink.get_tag_values(metrics.REQUESTS, 'status') == ['503', 'error']
+
+    def test_response_outside_of_call_ignored(self):
+        """
+        Validate that responses received outside of a measured call are not reported.
+        """
+        metrics.record_response(self._get_response(200, b'{}', None))
+        assert not self.sink.counters
+        assert not self.sink.histograms
+
+    @override_settings(TAXONOMY_METRICS_SINKS=['taxonomy.metrics.InMemoryMetricsSink'])
+    def test_configured_sinks(self):
+        """
+        Validate that the sinks configured in the settings are instantiated once and receive the metrics.
+        """
+        metrics._load_sinks.cache_clear()  # pylint: disable=protected-access
+        self.addCleanup(metrics._load_sinks.cache_clear)  # pylint: disable=protected-access
+        metrics.increment(metrics.TOKEN_REFRESHES, service='emsi')
+        metrics.increment(metrics.TOKEN_REFRESHES, service='emsi')
+
+        configured_sink, registered_sink = metrics.get_sinks()
+        assert isinstance(configured_sink, metrics.InMemoryMetricsSink)
+        assert registered_sink is self.sink
+        assert configured_sink.get_count(metrics.TOKEN_REFRESHES, service='emsi') == 2
+        assert self.sink.get_count(metrics.TOKEN_REFRESHES) == 2
+
+    def test_callback_sink(self):
+        """
+        Validate that the callback sink forwards the metrics to the callbacks.
+        """
+        increment_mock, observe_mock = mock.Mock(), mock.Mock()
+        sink = metrics.CallbackMetricsSink(on_increment=increment_mock, on_observe=observe_mock)
+        sink.increment(metrics.RETRIES, 2, {'service': 'emsi'})
+        sink.observe(metrics.LATENCY, 0.5, {'service': 'emsi'})
+
+        increment_mock.assert_called_once_with(metrics.RETRIES, 2, {'service': 'emsi'})
+        observe_mock.assert_called_once_with(metrics.LATENCY, 0.5, {'service': 'emsi'})
+
+    def test_failing_sink(self):
+        """
+        Validate that a failing sink is logged and does not fail the measured call.
+        """
+        failing_sink = metrics.CallbackMetricsSink(on_increment=mock.Mock(side_effect=ValueError))
+        metrics.add_sink(failing_sink)
+        self.addCleanup(metrics.remove_sink, failing_sink)
+
+        with LogCapture(level=logging.INFO) as log_capture:
+            with metrics.measure('algolia', 'replace_all_objects'):
+                pass
+
+        assert self.sink.get_count(metrics.REQUESTS, service='algolia', status='ok') == 1
+        assert log_capture.records[0].msg == '[TAXONOMY] Metrics sink %s failed to report metric %s.'
@@ -6,7 +6,7 @@ from pytest import mark
 
 from django.test import TestCase
 
-from taxonomy.models import Industry, Job, JobPostings
+from taxonomy.models import Industry, Job, JobPostings, Translation
 from test_utils import factories
 
 
@@ -194,6 +194,131 @@ class TestProgramSkill(TestCase):
         assert expected_repr == repr(program_skill)
 
 
+@mark.django_db
+class TestProductContentHash(TestCase):
+    """
+    Tests for the ``ProductContentHash`` model.
+    """
+
+    def test_string_representation(self):
+        """
+        Test the string representation of the ProductContentHash model.
+        """
+        product_content_hash = factories.ProductContentHashFactory()
+        expected_str = '<ProductContentHash product_type="{}" product_identifier="{}">'.format(
+            product_content_hash.product_type, product_content_hash.product_identifier
+        )
+        expected_repr = '<ProductContentHash id="{}" hash_content="{}">'.format(
+            product_content_hash.id, product_content_hash.hash_content
+        )
+
+        assert expected_str == str(product_content_hash)
+        assert expected_repr == repr(product_content_hash)
+
+
+@mark.django_db
+class TestSkillsExtractionCache(TestCase):
+    """
+    Tests for the ``SkillsExtractionCache`` model.
+    """
+
+    def test_string_representation(self):
+        """
+        Test the string representation of the SkillsExtractionCache model.
+        """
+        cache_entry = factories.SkillsExtractionCacheFactory()
+        expected_str = '<SkillsExtractionCache text_hash="{}" api_version="{}">'.format(
+            cache_entry.text_hash, cache_entry.api_version
+        )
+        expected_repr = '<SkillsExtractionCache id="{}" text_hash="{}">'.format(cache_entry.id, cache_entry.text_hash)
+
+        assert expected_str == str(cache_entry)
+        assert expected_repr == repr(cache_entry)
+
+
+@mark.django_db
+class TestProductSkillsRefreshRun(TestCase):
+    """
+    Tests for the ``ProductSkillsRefreshRun`` model.
+    """
+
+    def test_string_representation(self):
+        """
+        Test the string representation of the ProductSkillsRefreshRun model.
+        """
+        refresh_run = factories.ProductSkillsRefreshRunFactory(cursor=10)
+        expected_str = '<ProductSkillsRefreshRun product_type="{}" shard="0/1" cursor="10" is_completed="False">'
+        expected_str = expected_str.format(refresh_run.product_type)
+        expected_repr = '<ProductSkillsRefreshRun id="{}" product_type="{}">'.format(
+            refresh_run.id, refresh_run.product_type
+        )
+
+        assert expected_str == str(refresh_run)
+        assert expected_repr == repr(refresh_run)
+
+
+@mark.django_db
+class TestProductSkillsRefreshFailure(TestCase):
+    """
+    Tests for the ``ProductSkillsRefreshFailure`` model.
+    """
+
+    def test_string_representation(self):
+        """
+        Test the string representation of the ProductSkillsRefreshFailure model.
+        """
+        failure = factories.ProductSkillsRefreshFailureFactory()
+        expected_str = '<ProductSkillsRefreshFailure refresh_run="{}" product_identifier="{}">'.format(
+            failure.refresh_run_id, failure.product_identifier
+        )
+        expected_repr = '<ProductSkillsRefreshFailure id="{}" product_identifier="{}">'.format(
+            failure.id, failure.product_identifier
+        )
+
+        assert expected_str == str(failure)
+        assert expected_repr == repr(failure)
+
+
+@mark.django_db
+class TestProductSkillsRetry(TestCase):
+    """
+    Tests for the ``ProductSkillsRetry`` model.
+    """
+
+    def test_string_representation(self):
+        """
+        Test the string representation of the ProductSkillsRetry model.
+        """
+        retry = factories.ProductSkillsRetryFactory()
+        expected_str = '<ProductSkillsRetry product_type="{}" product_uuid="{}">'.format(
+            retry.product_type, retry.product_uuid
+        )
+        expected_repr = '<ProductSkillsRetry id="{}" product_uuid="{}">'.format(retry.id, retry.product_uuid)
+
+        assert expected_str == str(retry)
+        assert expected_repr == repr(retry)
+
+
+@mark.django_db
+class TestSkillTaxonomySnapshot(TestCase):
+    """
+    Tests for the ``SkillTaxonomySnapshot`` model.
+    """
+
+    def test_string_representation(self):
+        """
+        Test the string representation of the SkillTaxonomySnapshot model.
+        """
+        snapshot = factories.SkillTaxonomySnapshotFactory()
+        expected_str = '<SkillTaxonomySnapshot api_version="{}" external_id="{}">'.format(
+            snapshot.api_version, snapshot.external_id
+        )
+        expected_repr = '<SkillTaxonomySnapshot id="{}" external_id="{}">'.format(snapshot.id, snapshot.external_id)
+
+        assert expected_str == str(snapshot)
+        assert expected_repr == repr(snapshot)
+
+
 @mark.django_db
 class TestTranslation(TestCase):
     """
@@ -220,6 +345,42 @@ class TestTranslation(TestCase):
         assert expected_str == translation.__str__()
         assert expected_repr == translation.__repr__()
 
+    def test_source_text_hash_saved(self):
+        """
+        Test that the hash of the source text is stored on save, including saves of the source text only.
+        """
+        translation = factories.TranslationFactory(source_text='Aprende python')
+        assert translation.source_text_hash == Translation.get_source_text_hash('Aprende python')
+
+        translation = Translation.objects.only('id').get(id=translation.id)
+        translation.source_text = 'Aprende java'
+        translation.save(update_fields=['source_text'])
+
+        translation.refresh_from_db()
+        assert translation.source_text_hash == Translation.get_source_text_hash('Aprende java')
+
+
+@mark.django_db
+class TestTranslationCache(TestCase):
+    """
+    Tests for the ``TranslationCache`` model.
+    """
+
+    def test_string_representation(self):
+        """
+        Test the string representation of the TranslationCache model.
+        """
+        cache_entry = factories.TranslationCacheFactory()
+        expected_str = '<TranslationCache source_text_hash="{}" translated_text_language="{}">'.format(
+            cache_entry.source_text_hash, cache_entry.translated_text_language
+        )
+        expected_repr = '<TranslationCache id="{}" source_text_hash="{}">'.format(
+            cache_entry.id, cache_entry.source_text_hash
+        )
+
+        assert expected_str == str(cache_entry)
+        assert expected_repr == repr(cache_entry)
+
 
 @mark.django_db
 class TestSkillCategory(TestCase):
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for recording and replaying the traffic to the EMSI service and AWS Translate.
+"""
+
+import os
+import tempfile
+
+import mock
+import responses
+from pytest import raises
+
+from taxonomy import replay, utils
+from taxonomy.constants import AUTO, ENGLISH
+from taxonomy.emsi.client import EMSISkillsApiClient
+from taxonomy.emsi.parsers.skill_parsers import parse_extracted_skills
+from taxonomy.exceptions import TaxonomyAPIError
+from test_utils.sample_responses.skills import SKILL_TEXT_DATA, SKILLS_EMSI_CLIENT_RESPONSE, SKILLS_EMSI_RESPONSE
+from test_utils.testcase import TaxonomyTestCase
+
+
+class TestTrafficReplay(TaxonomyTestCase):
+    """
+    Validate that the traffic recorded to an archive is served back while replaying.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary path for the traffic archive.
+        """
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        self.archive_path = os.path.join(temp_dir.name, 'traffic.jsonl.gz')
+
+    @responses.activate
+    def test_emsi_traffic_replayed(self):
+        """
+        Validate that EMSI responses are recorded and replayed without sending any request.
+        """
+        self.mock_access_token()
+        responses.add(
+            method=responses.POST, url=EMSISkillsApiClient.API_BASE_URL + '/extract', json=SKILLS_EMSI_RESPONSE
+        )
+        expected_skills = parse_extracted_skills(SKILLS_EMSI_CLIENT_RESPONSE)
+        with replay.record_traffic(self.archive_path):
+            assert EMSISkillsApiClient().get_product_skills(SKILL_TEXT_DATA) == expected_skills
+        assert len(responses.calls) == 2
+
+        responses.reset()
+        with replay.replay_traffic(self.archive_path):
+            client = EMSISkillsApiClient()
+            assert client.get_product_skills(SKILL_TEXT_DATA) == expected_skills
+            with raises(TaxonomyAPIError):
+                client.get_product_skills('text that was not recorded')
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_emsi_query_parameters_replayed(self):
+        """
+        Validate that EMSI requests differing only by their query parameters are replayed with their own responses.
+        """
+        self.mock_access_token()
+        responses.add(
+            method=responses.GET, url=EMSISkillsApiClient.API_BASE_URL + '/skills',
+            match=[responses.matchers.query_param_matcher({'fields': 'id'})], json={'data': [{'id': 'SKILL1'}]},
+        )
+        responses.add(
+            method=responses.GET, url=EMSISkillsApiClient.API_BASE_URL + '/skills',
+            match=[responses.matchers.query_param_matcher({'fields': 'id,name'})],
+            json={'data': [{'id': 'SKILL1', 'name': 'Skill'}]},
+        )
+        with replay.record_traffic(self.archive_path):
+            client = EMSISkillsApiClient()
+            client.get_all_skills(fields=('id',))
+            client.get_all_skills(fields=('id', 'name'))
+
+        responses.reset()
+        with replay.replay_traffic(self.archive_path):
+            client = EMSISkillsApiClient()
+            assert client.get_all_skills(fields=('id', 'name')) == {'data': [{'id': 'SKILL1', 'name': 'Skill'}]}
+            assert client.get_all_skills(fields=('id',)) == {'data': [{'id': 'SKILL1'}]}
+            with raises(TaxonomyAPIError):
+                client.get_all_skills(fields=('name',))
+        assert len(responses.calls) == 0
+
+    def test_query_parameters_normalized(self):
+        """
+        Validate that query parameters match whether they are passed in the URL or as `params`, in any order.
+        """
+        # pylint: disable=protected-access
+        assert replay._get_http_request('get', 'https://emsiservices.com/skills?b=2&a=1') == \
+            replay._get_http_request('GET', 'https://example.com/skills', params={'a': 1, 'b': '2', 'c': None})
+        assert replay._get_http_request('get', 'https://emsiservices.com/skills', params=[('a', [1, 2])])['params'] \
+            == [('a', '1'), ('a', '2')]
+
+    @mock.patch('taxonomy.utils.boto3.client')
+    def test_translate_traffic_replayed(self, boto3_client_mock):
+        """
+        Validate that AWS Translate responses are recorded and replayed without creating a client.
+        """
+        translation = {'TranslatedText': 'Translated text', 'SourceLanguageCode': 'fr', 'TargetLanguageCode': ENGLISH}
+        boto3_client_mock.return_value.translate_text.return_value = dict(translation, ResponseMetadata={})
+        with replay.record_traffic(self.archive_path):
+            utils.translate_text('course-key', 'Texte', AUTO, ENGLISH)
+
+        boto3_client_mock.reset_mock()
+        with replay.replay_traffic(self.archive_path, latency=0.5):
+            with mock.patch('taxonomy.replay.sleep') as sleep_mock:
+                assert utils.translate_text('course-key', 'Texte', AUTO, ENGLISH) == translation
+                assert utils.translate_text('course-key', 'Autre texte', AUTO, ENGLISH) == {
+                    'SourceLanguageCode': '', 'TranslatedText': ''
+                }
+        assert boto3_client_mock.call_count == 0
+        sleep_mock.assert_has_calls([mock.call(0.5), mock.call(0.5)])
+
+    def test_traffic_context(self):
+        """
+        Validate that `traffic_context` picks the context manager for the given options.
+        """
+        with replay.traffic_context():
+            assert replay.get_traffic_archive() is None
+
+        with replay.traffic_context(record_path=self.archive_path) as archive:
+            assert not archive.replay
+            assert replay.get_traffic_archive() is archive
+        assert replay.get_traffic_archive() is None
+
+        with replay.traffic_context(replay_path=self.archive_path) as archive:
+            assert replay.is_replaying()
@@ -2,23 +2,37 @@
 Validate that utility functions are working properly.
 """
 import copy
+import json
 import logging
+import os
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
 
 import ddt
 import mock
+import responses
+from bs4 import Tag
 from edx_django_utils.cache import TieredCache
 from pytest import fixture, mark
 from testfixtures import LogCapture
 
-from taxonomy import models, utils
+from django.db import transaction
+from django.test import override_settings
+
+from taxonomy import metrics, models, utils
 from taxonomy.choices import ProductTypes
 from taxonomy.constants import ENGLISH
+from taxonomy.emsi import transport
+from taxonomy.emsi.client import EMSISkillsApiClient
+from taxonomy.emsi.parsers.skill_parsers import ExtractedSkill, parse_extracted_skills
 from taxonomy.exceptions import TaxonomyAPIError
-from taxonomy.models import CourseSkills, JobSkills, Skill, Translation, XBlockSkills
+from taxonomy.models import CourseSkills, JobSkills, Skill, Translation, TranslationCache, XBlockSkills
 from test_utils import factories
 from test_utils.constants import COURSE_KEY, PROGRAM_UUID, USAGE_KEY
 from test_utils.mocks import MockCourse, MockProgram, MockXBlock, mock_as_dict
-from test_utils.sample_responses.skills import SKILLS_EMSI_CLIENT_RESPONSE
+from test_utils.sample_responses.skills import SKILLS_EMSI_CLIENT_RESPONSE, SKILLS_EMSI_RESPONSE
 from test_utils.testcase import TaxonomyTestCase
 
 
@@ -85,6 +99,50 @@ class TestUtils(TaxonomyTestCase):
         skill = factories.SkillFactory()
         assert utils.is_skill_blacklisted(COURSE_KEY, skill.id, product_type) is not True
 
+    def test_product_skills_snapshot(self):
+        """
+        Validate that a product skills snapshot serves blacklist and whitelist checks from memory.
+        """
+        blacklisted = factories.CourseSkillsFactory(course_key=COURSE_KEY, skill=self.skill, is_blacklisted=True)
+        whitelisted = factories.CourseSkillsFactory.create_batch(3, course_key=COURSE_KEY, is_blacklisted=False)
+        other_course_skill = factories.CourseSkillsFactory(course_key='edx+OtherX', is_blacklisted=True)
+        product_type = ProductTypes.Course
+
+        # 1 query for loading the snapshot of both the courses.
+        with self.django_assert_num_queries(1):
+            snapshot = utils.get_product_skills_snapshot([COURSE_KEY, 'edx+OtherX', 'edx+EmptyX'], product_type)
+
+        with self.django_assert_num_queries(0):
+            assert utils.is_skill_blacklisted(COURSE_KEY, blacklisted.skill_id, product_type, snapshot=snapshot)
+            assert not utils.is_skill_blacklisted(COURSE_KEY, whitelisted[0].skill_id, product_type, snapshot=snapshot)
+            assert not utils.is_skill_blacklisted('edx+EmptyX', self.skill.id, product_type, snapshot=snapshot)
+            assert utils.is_skill_blacklisted(
+                'edx+OtherX', other_course_skill.skill_id, product_type, snapshot=snapshot
+            )
+            course_skills = utils.get_whitelisted_product_skills(COURSE_KEY, product_type, snapshot=snapshot)
+            assert {course_skill.id for course_skill in course_skills} == {
+                course_skill.id for course_skill in whitelisted
+            }
+            assert {course_skill.skill.name for course_skill in course_skills} == {
+                course_skill.skill.name for course_skill in whitelisted
+            }
+
+    def test_skills_extraction_cache(self):
+        """
+        Validate that extracted skills are cached by normalized text and served until they expire.
+        """
+        assert utils.get_cached_product_skills('Learn  Python\nand Django') is None
+
+        utils.cache_product_skills('Learn  Python\nand Django', SKILLS_EMSI_CLIENT_RESPONSE)
+        cached_skills = utils.get_cached_product_skills(' Learn Python and Django ')
+        assert cached_skills == parse_extracted_skills(SKILLS_EMSI_CLIENT_RESPONSE)
+        cached_record = models.SkillsExtractionCache.objects.get().skills_data[0]
+        assert cached_record == parse_extracted_skills(SKILLS_EMSI_CLIENT_RESPONSE).skills[0]._asdict()
+        assert utils.get_cached_product_skills('Learn Python') is None
+
+        with override_settings(TAXONOMY_SKILLS_EXTRACTION_CACHE_TTL=-1):
+            assert utils.get_cached_product_skills('Learn Python and Django') is None
+
     def test_update_course_skills_data(self):
         """
         Validate that update_product_skills_data works as expected.
@@ -297,6 +355,85 @@ class TestUtils(TaxonomyTestCase):
         assert self.skill.type_name == skill_data.get('type_name')
         assert self.skill.description == skill_data.get('description')
 
+    def test_bulk_update_skills_data(self):
+        """
+        Validate that bulk_update_skills_data persists skills and course skills in bulk.
+        """
+        black_listed_course_skill = factories.CourseSkillsFactory(course_key=COURSE_KEY, is_blacklisted=True)
+        existing_course_skill = factories.CourseSkillsFactory(course_key=COURSE_KEY, skill=self.skill, confidence=0.5)
+        product_type = ProductTypes.Course
+        extracted_skills = [
+            ExtractedSkill(
+                external_id=black_listed_course_skill.skill.external_id,
+                confidence=0.9,
+                **{field: getattr(black_listed_course_skill.skill, field) for field in utils.SKILL_DATA_FIELDS},
+            ),
+            ExtractedSkill(
+                external_id=self.skill.external_id,
+                confidence=0.9,
+                **{field: 'updated' for field in utils.SKILL_DATA_FIELDS},
+            ),
+        ] + [
+            ExtractedSkill(
+                external_id=f'new-external-id-{index}',
+                confidence=1.0,
+                **{field: f'new {field} {index}' for field in utils.SKILL_DATA_FIELDS},
+            ) for index in range(10)
+        ]
+
+        # 1 query to read skills, 1 to update changed skills, 1 to create and 1 to read back new skills,
+        # 1 to read course skills, 1 to create and 1 to update course skills along with 2 for the savepoint.
+        with self.django_assert_num_queries(9):
+            utils.bulk_update_skills_data(COURSE_KEY, extracted_skills, product_type)
+
+        assert Skill.objects.filter(external_id__startswith='new-external-id-').count() == 10
+        assert CourseSkills.objects.filter(course_key=COURSE_KEY, is_blacklisted=False).count() == 11
+
+        # Make sure blacklisted course skill is left untouched.
+        black_listed_course_skill.refresh_from_db()
+        assert black_listed_course_skill.is_blacklisted is True
+        assert black_listed_course_skill.confidence != 0.9
+
+        # Make sure existing skill and course skill are updated.
+        self.skill.refresh_from_db()
+        existing_course_skill.refresh_from_db()
+        assert self.skill.name == 'updated'
+        assert self.skill.description == 'updated'
+        assert existing_course_skill.confidence == 0.9
+
+    def test_bulk_update_skills_data_skills_updated_in_pk_order(self):
+        """
+        Validate that bulk_update_skills_data updates skills in primary key order, whatever the order of extraction.
+        """
+        # External ids sort in the reverse order of primary keys, as do skills read through the external id index.
+        skills = [factories.SkillFactory(external_id=f'external-id-{index}') for index in (3, 2, 1)]
+        extracted_skills = [
+            ExtractedSkill(external_id=skill.external_id, confidence=0.9, **{
+                field: 'updated' for field in utils.SKILL_DATA_FIELDS
+            }) for skill in skills
+        ]
+
+        with mock.patch.object(Skill.objects, 'bulk_update', wraps=Skill.objects.bulk_update) as bulk_update_mock:
+            utils.bulk_update_skills_data(COURSE_KEY, extracted_skills, ProductTypes.Course)
+
+        assert [skill.pk for skill in bulk_update_mock.call_args.args[0]] == sorted(skill.pk for skill in skills)
+
+    def test_bulk_update_xblock_skills_data(self):
+        """
+        Validate that bulk_update_skills_data persists xblock skills data along with the content hash.
+        """
+        extracted_skills = [
+            ExtractedSkill(
+                external_id=self.skill.external_id,
+                confidence=0.8,
+                **{field: getattr(self.skill, field) for field in utils.SKILL_DATA_FIELDS},
+            ),
+        ]
+        utils.bulk_update_skills_data(USAGE_KEY, extracted_skills, ProductTypes.XBlock, hash_content='abc')
+
+        xblock = XBlockSkills.objects.get(usage_key=USAGE_KEY, hash_content='abc', auto_processed=True)
+        assert models.XBlockSkillData.objects.filter(xblock=xblock, skill=self.skill, confidence=0.8).exists()
+
     def test_process_program_skills_data_missing_keys(self):
         """
         Validate that process_course_skills_data fails on missing fields in ProgramSkills.
@@ -593,6 +730,234 @@ class TestUtils(TaxonomyTestCase):
         assert trans.source_text == course_description
         assert translate_text_mocked.call_count == 0
 
+    @mock.patch('taxonomy.utils.boto3.client')
+    def test_translate_text_measured(self, boto3_client_mock):
+        """
+        Validate that the calls to AWS Translate are reported to the metrics sinks.
+        """
+        sink = metrics.InMemoryMetricsSink()
+        metrics.add_sink(sink)
+        self.addCleanup(metrics.remove_sink, sink)
+        boto3_client_mock.return_value.translate_text.side_effect = [
+            {
+                'TranslatedText': 'Bonjour',
+                'SourceLanguageCode': 'en',
+                'TargetLanguageCode': 'fr',
+                'ResponseMetadata': {'HTTPStatusCode': 200, 'RetryAttempts': 1},
+            },
+            Exception('Throttled'),
+        ]
+
+        utils.translate_text(COURSE_KEY, 'Hello', 'en', 'fr')
+        utils.translate_text(COURSE_KEY, 'Hello', 'en', 'fr')
+
+        tags = {'service': 'translate', 'endpoint': 'translate_text'}
+        assert sink.get_count(metrics.REQUESTS, status='200', **tags) == 1
+        assert sink.get_count(metrics.REQUESTS, status='error', **tags) == 1
+        assert sink.get_count(metrics.RETRIES, **tags) == 1
+        assert sink.get_values(metrics.REQUEST_BYTES, **tags) == [5, 5]
+        assert sink.get_values(metrics.RESPONSE_BYTES, **tags) == [7, 0]
+
+    @mock.patch('taxonomy.utils.boto3.client')
+    def test_aws_translate_client_reused(self, boto3_client_mock):
+        """
+        Validate that a single AWS Translate client is created and reused by all the translations.
+        """
+        boto3_client_mock.return_value.translate_text.return_value = {
+            'TranslatedText': 'Bonjour', 'SourceLanguageCode': 'en', 'ResponseMetadata': {},
+        }
+
+        utils.translate_text(COURSE_KEY, 'Hello', 'en', 'fr')
+        utils.translate_text(COURSE_KEY, 'Hello', 'en', 'fr')
+
+        assert boto3_client_mock.call_count == 1
+        assert boto3_client_mock.return_value.translate_text.call_count == 2
+
+    @override_settings(
+        TAXONOMY_TRANSLATE_ENDPOINT_URL='http://localhost:4566',
+        TAXONOMY_TRANSLATE_MAX_WORKERS=5,
+        TAXONOMY_TRANSLATE_PRODUCTS_MAX_WORKERS=4,
+    )
+    @mock.patch('taxonomy.utils.boto3.client')
+    def test_aws_translate_client_configuration(self, boto3_client_mock):
+        """
+        Validate that the AWS Translate client is sent to the configured endpoint with a pool for every worker of
+        every translated product.
+        """
+        utils.get_aws_translate_client()
+
+        _, kwargs = boto3_client_mock.call_args
+        assert kwargs['endpoint_url'] == 'http://localhost:4566'
+        assert kwargs['config'].max_pool_connections == 20
+
+    @mock.patch('taxonomy.utils.translate_text')
+    def test_products_translated_ahead(self, translate_text_mocked):
+        """
+        Validate that the texts of the next products are translated concurrently, once per distinct text, and the
+        translations are yielded in the order of the products.
+        """
+        barrier = threading.Barrier(3, timeout=5)
+
+        def translate(key, text, source_language, target_language):  # pylint: disable=unused-argument
+            barrier.wait()
+            return {'TranslatedText': text.upper(), 'SourceLanguageCode': 'es'}
+
+        translate_text_mocked.side_effect = translate
+        products_texts = [('course-a', 'uno'), ('course-b', 'dos'), ('course-c', 'tres'), ('course-d', 'uno')]
+
+        translations = list(utils.translate_products(products_texts, ProductTypes.Course, max_workers=3))
+
+        assert translations == [
+            ('course-a', 'uno', 'UNO'),
+            ('course-b', 'dos', 'DOS'),
+            ('course-c', 'tres', 'TRES'),
+            ('course-d', 'uno', 'UNO'),
+        ]
+        assert translate_text_mocked.call_count == 3
+        assert Translation.objects.filter(source_model_name=ProductTypes.Course).count() == 4
+
+    @mock.patch('taxonomy.utils.translate_text')
+    def test_products_translation_queue_bounded(self, translate_text_mocked):
+        """
+        Validate that no more than the queue size of products are translated ahead, and that stored translations
+        are not sent to AWS Translate.
+        """
+        translate_text_mocked.side_effect = lambda key, text, *args: {'TranslatedText': key, 'SourceLanguageCode': 'es'}
+        factories.TranslationFactory(
+            source_record_identifier='course-0',
+            source_model_name=ProductTypes.Course,
+            source_model_field=utils.COURSE_METADATA_FIELDS_COMBINED,
+            source_text='texto 0',
+            translated_text='stored translation',
+        )
+        products_texts = [(f'course-{index}', f'texto {index}') for index in range(10)]
+
+        translations = utils.translate_products(products_texts, ProductTypes.Course, max_workers=2, queue_size=4)
+        assert next(translations) == ('course-0', 'texto 0', 'stored translation')
+        assert translate_text_mocked.call_count <= 3
+
+        assert [translated_text for __, __, translated_text in translations] == [
+            f'course-{index}' for index in range(1, 10)
+        ]
+        assert translate_text_mocked.call_count == 9
+
+    @mock.patch('taxonomy.utils.AMAZON_TRANSLATION_ALLOWED_SIZE', 40)
+    def test_translation_chunks_keep_text_once(self):
+        """
+        Validate that nested elements and text outside of elements end up in exactly one chunk, in order.
+        """
+        source_text = 'Intro text. <div><p>First <b>bold</b> point.</p><p>Second point.</p></div> Outro.'
+
+        chunks = list(utils._iter_translation_chunks(source_text))  # pylint: disable=protected-access
+
+        assert chunks == ['Intro text. ', '<p>First <b>bold</b> point.</p>', '<p>Second point.</p> Outro.']
+
+    @mock.patch('taxonomy.utils.AMAZON_TRANSLATION_ALLOWED_SIZE', 30)
+    def test_translation_chunks_split_on_sentences(self):
+        """
+        Validate that texts too large for a chunk are split on sentence boundaries, then on characters.
+        """
+        source_text = '<p>Learn python today. Build apps! Ship them? ' + 'é' * 20 + '</p>'
+
+        chunks = list(utils._iter_translation_chunks(source_text))  # pylint: disable=protected-access
+
+        assert chunks == ['Learn python today. ', 'Build apps! Ship them? ', 'é' * 14, 'é' * 6]
+        assert all(len(chunk.encode('utf-8')) < 30 for chunk in chunks)
+
+    @mock.patch('taxonomy.utils.AMAZON_TRANSLATION_ALLOWED_SIZE', 30)
+    def test_translation_chunks_sized_escaped(self):
+        """
+        Validate that texts are sized and sent with their entities escaped, like the html of elements.
+        """
+        source_text = 'Tom &amp; Jerry. Spike &amp; Tyke.'
+
+        chunks = list(utils._iter_translation_chunks(source_text))  # pylint: disable=protected-access
+
+        assert chunks == ['Tom &amp; Jerry. ', 'Spike &amp; Tyke.']
+
+    @mock.patch('taxonomy.utils.AMAZON_TRANSLATION_ALLOWED_SIZE', 100)
+    def test_translation_chunks_serialized_once(self):
+        """
+        Validate that the html of a deeply nested text is serialized once, not once per level of nesting.
+        """
+        depth = 50
+        source_text = '<div>' * depth + 'Learn python. ' * 10 + '</div>' * depth
+
+        with mock.patch.object(Tag, 'decode', autospec=True, side_effect=Tag.decode) as decode_mock:
+            chunks = list(utils._iter_translation_chunks(source_text))  # pylint: disable=protected-access
+
+        assert ''.join(chunks) == 'Learn python. ' * 10
+        assert decode_mock.call_count == depth
+
+    @mock.patch('taxonomy.utils.AMAZON_TRANSLATION_ALLOWED_SIZE', 20)
+    @mock.patch.dict(os.environ, {'AWS_ACCESS_KEY_ID': 'testing', 'AWS_SECRET_ACCESS_KEY': 'testing'})
+    @mock.patch('boto3.DEFAULT_SESSION', None)
+    def test_large_text_translated_by_local_endpoint(self):
+        """
+        Validate that the chunks of a large text are translated by the endpoint set in the settings.
+        """
+        class TranslateHandler(BaseHTTPRequestHandler):
+            """
+            Stand-in of AWS Translate, translating text by upper casing it.
+            """
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                """
+                Translate the text of the request.
+                """
+                request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                body = json.dumps({
+                    'TranslatedText': request['Text'].upper(),
+                    'SourceLanguageCode': 'fr',
+                    'TargetLanguageCode': request['TargetLanguageCode'],
+                }).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/x-amz-json-1.1')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), TranslateHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        with override_settings(TAXONOMY_TRANSLATE_ENDPOINT_URL=f'http://127.0.0.1:{server.server_port}'):
+            result = utils.apply_batching_to_translate_large_text(
+                COURSE_KEY, '<p>un deux</p><p>trois quatre</p><p>cinq six</p>'
+            )
+
+        assert result == {
+            'TranslatedText': '<P>UN DEUX</P><P>TROIS QUATRE</P><P>CINQ SIX</P>',
+            'SourceLanguageCode': 'fr',
+        }
+
+    @mock.patch('taxonomy.utils.AMAZON_TRANSLATION_ALLOWED_SIZE', 20)
+    @mock.patch('taxonomy.utils.translate_text')
+    def test_large_text_chunks_translated_concurrently(self, translate_text_mocked):
+        """
+        Validate that the chunks of a large text are translated concurrently and reassembled in order.
+        """
+        barrier = threading.Barrier(3, timeout=5)
+
+        def translate(key, text, source_language, target_language):  # pylint: disable=unused-argument
+            barrier.wait()
+            return {'TranslatedText': text.upper(), 'SourceLanguageCode': 'fr'}
+
+        translate_text_mocked.side_effect = translate
+        source_text = '<p>un deux</p>\n<p>trois quatre</p><p>cinq six</p>'
+
+        result = utils.apply_batching_to_translate_large_text(COURSE_KEY, source_text)
+
+        assert result == {
+            'TranslatedText': '<P>UN DEUX</P><P>TROIS QUATRE</P><P>CINQ SIX</P>',
+            'SourceLanguageCode': 'fr',
+        }
+        assert translate_text_mocked.call_count == 3
+
     @mock.patch('taxonomy.utils.translate_text')
     def test_get_translated_course_description_error_for_new_record(self, translate_text_mocked):
         """
@@ -701,6 +1066,131 @@ class TestUtils(TaxonomyTestCase):
         assert translation_record.source_text == course_description
         assert translate_text_mocked.call_count == 1
 
+    @mock.patch('taxonomy.utils.translate_text')
+    def test_identical_texts_translated_once(self, translate_text_mocked):
+        """
+        Validate that identical texts of different products are translated once and share the translation cache.
+        """
+        translate_text_mocked.return_value = {'SourceLanguageCode': 'es', 'TranslatedText': 'Learn python'}
+
+        first_translation = utils.get_translated_skill_attribute_val('course-a', 'Aprende python', ProductTypes.Course)
+        second_translation = utils.get_translated_skill_attribute_val('course-b', 'Aprende python', ProductTypes.Course)
+
+        assert first_translation == second_translation == 'Learn python'
+        assert translate_text_mocked.call_count == 1
+        translations = Translation.objects.filter(source_record_identifier__in=['course-a', 'course-b'])
+        assert {translation.translation_cache_id for translation in translations} == {
+            TranslationCache.objects.get().id
+        }
+
+    @mock.patch('taxonomy.utils.translate_text')
+    def test_unchanged_translation_loaded_without_source_text(self, translate_text_mocked):
+        """
+        Validate that an unchanged text is detected by its hash in a single query without loading the source text.
+        """
+        factories.TranslationFactory(
+            source_record_identifier=COURSE_KEY,
+            source_model_name=ProductTypes.Course,
+            source_model_field=utils.COURSE_METADATA_FIELDS_COMBINED,
+            source_text='Aprende python',
+            translated_text='Learn python',
+        )
+
+        with self.django_assert_num_queries(1) as queries:
+            translated_text = utils.get_translated_skill_attribute_val(
+                COURSE_KEY, 'Aprende python', ProductTypes.Course
+            )
+
+        assert translated_text == 'Learn python'
+        assert '"source_text",' not in queries.captured_queries[0]['sql']
+        assert translate_text_mocked.call_count == 0
+
+    def test_get_unchanged_translations(self):
+        """
+        Validate that the translations of the products whose text has not changed are loaded in a single query.
+        """
+        for key_or_uuid, source_text in (('course-a', 'Aprende python'), ('course-b', 'Aprende java')):
+            factories.TranslationFactory(
+                source_record_identifier=key_or_uuid,
+                source_model_name=ProductTypes.Course,
+                source_model_field=utils.COURSE_METADATA_FIELDS_COMBINED,
+                source_text=source_text,
+                translated_text=f'{source_text} translated',
+            )
+
+        with self.django_assert_num_queries(1):
+            unchanged_translations = utils.get_unchanged_translations(
+                [('course-a', 'Aprende python'), ('course-b', 'Aprende scala'), ('course-c', 'Aprende java')],
+                ProductTypes.Course,
+            )
+
+        assert unchanged_translations == {('course-a', 'Aprende python'): 'Aprende python translated'}
+
+    @mock.patch('taxonomy.utils.translate_text')
+    def test_english_text_not_translated(self, translate_text_mocked):
+        """
+        Validate that texts detected as English are stored as their own translation without calling AWS Translate.
+        """
+        sink = metrics.InMemoryMetricsSink()
+        metrics.add_sink(sink)
+        self.addCleanup(metrics.remove_sink, sink)
+        translate_text_mocked.return_value = {'SourceLanguageCode': 'es', 'TranslatedText': 'Learn python'}
+        english_text = 'Learn the basics of Python and how to use it in data science.'
+
+        assert utils.get_translated_skill_attribute_val('course-a', english_text, ProductTypes.Course) == english_text
+        utils.get_translated_skill_attribute_val('course-b', 'Aprende python', ProductTypes.Course)
+
+        assert translate_text_mocked.call_count == 1
+        assert TranslationCache.objects.get(translated_text=english_text).source_language == ENGLISH
+        assert sink.get_count(metrics.LANGUAGE_DETECTIONS, result='english') == 1
+        assert sink.get_count(metrics.LANGUAGE_DETECTIONS, result='undetermined') == 1
+
+    @mock.patch('taxonomy.utils.translate_text')
+    def test_unlisted_language_translated(self, translate_text_mocked):
+        """
+        Validate that texts in languages without stopwords lists are sent to AWS Translate.
+        """
+        dutch_text = (
+            'Deze cursus is een introductie tot data science. Het is bedoeld voor studenten of professionals met '
+            'interesse in statistiek, en het was ontwikkeld door TU Delft.'
+        )
+        translated_text = 'This course is an introduction to data science.'
+        translate_text_mocked.return_value = {'SourceLanguageCode': 'nl', 'TranslatedText': translated_text}
+
+        assert utils.get_translated_skill_attribute_val(COURSE_KEY, dutch_text, ProductTypes.Course) == translated_text
+        assert translate_text_mocked.call_count == 1
+        assert TranslationCache.objects.get(translated_text=translated_text).source_language == 'nl'
+
+    @override_settings(TAXONOMY_ENGLISH_DETECTION_THRESHOLD=None)
+    @mock.patch('taxonomy.utils.translate_text')
+    def test_english_detection_disabled(self, translate_text_mocked):
+        """
+        Validate that every text is sent to AWS Translate when English detection is disabled.
+        """
+        english_text = 'Learn the basics of Python and how to use it in data science.'
+        translate_text_mocked.return_value = {'SourceLanguageCode': ENGLISH, 'TranslatedText': english_text}
+
+        assert utils.get_translated_skill_attribute_val(COURSE_KEY, english_text, ProductTypes.Course) == english_text
+        assert translate_text_mocked.call_count == 1
+
+    @mock.patch('taxonomy.utils.translate_text')
+    def test_changed_text_points_to_new_cache_entry(self, translate_text_mocked):
+        """
+        Validate that a changed text is translated into a new cache entry, leaving the previous one unreferenced.
+        """
+        translate_text_mocked.side_effect = [
+            {'SourceLanguageCode': 'es', 'TranslatedText': 'Learn python'},
+            {'SourceLanguageCode': 'es', 'TranslatedText': 'Learn java'},
+        ]
+
+        utils.get_translated_skill_attribute_val(COURSE_KEY, 'Aprende python', ProductTypes.Course)
+        translated_text = utils.get_translated_skill_attribute_val(COURSE_KEY, 'Aprende java', ProductTypes.Course)
+
+        assert translated_text == 'Learn java'
+        assert TranslationCache.objects.count() == 2
+        assert utils.prune_translation_cache() == 1
+        assert TranslationCache.objects.get().translated_text == 'Learn java'
+
     @mock.patch("taxonomy.utils.AMAZON_TRANSLATION_ALLOWED_SIZE", 5)
     @mock.patch('taxonomy.utils.translate_text')
     def test_get_translated_course_description_success_for_new_record_with_large_text(self, translate_text_mocked):
@@ -726,7 +1216,7 @@ class TestUtils(TaxonomyTestCase):
 
         assert translation_record.translated_text == expected_translated_description
         assert translation_record.source_text == course_description
-        assert translate_text_mocked.call_count == 5
+        assert translate_text_mocked.call_count == 3
 
     @mock.patch("taxonomy.utils.AMAZON_TRANSLATION_ALLOWED_SIZE", 5)
     @mock.patch('taxonomy.utils.translate_text')
@@ -767,7 +1257,7 @@ class TestUtils(TaxonomyTestCase):
 
         assert new_course_description == expected_translated_description
         assert translation_record.translated_text == new_course_description
-        assert translate_mocked.call_count == 3
+        assert translate_mocked.call_count == 2
 
     def test_process_skill_attr_text(self):
         """
@@ -775,7 +1265,7 @@ class TestUtils(TaxonomyTestCase):
         """
         text = 'some text'
         xblock = factories.XBlockSkillsFactory(usage_key=USAGE_KEY)
-        extra_data = utils.process_skill_attr_text(text, ProductTypes.XBlock)
+        extra_data = utils.process_skill_attr_text(text)
         skip = utils.skip_product_processing(extra_data, USAGE_KEY, ProductTypes.XBlock)
         # XBlock with new text should not skip.
         assert not skip
@@ -785,7 +1275,7 @@ class TestUtils(TaxonomyTestCase):
         xblock.save()
 
         # xblock with same content should skip processing.
-        extra_data = utils.process_skill_attr_text(text, ProductTypes.XBlock)
+        extra_data = utils.process_skill_attr_text(text)
         skip = utils.skip_product_processing(extra_data, USAGE_KEY, ProductTypes.XBlock)
         assert skip
 
@@ -831,7 +1321,8 @@ class TestUtils(TaxonomyTestCase):
 
     @mock.patch('taxonomy.utils.EMSISkillsApiClient.get_product_skills')
     @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
-    @mock.patch('time.sleep')
+    @mock.patch('taxonomy.emsi.rate_limiter.monotonic', mock.Mock(return_value=0))
+    @mock.patch('taxonomy.emsi.rate_limiter.sleep')
     def test_refresh_course_skills_rate_limit_emsi_api_calls(
             self,
             time_sleep_mock,
@@ -859,8 +1350,11 @@ class TestUtils(TaxonomyTestCase):
 
         utils.refresh_product_skills(courses, False, product_type)
 
-        # it should be called after every 5 requests made to EMSI
-        assert time_sleep_mock.call_count == 2
+        # first request is sent right away, each of the remaining requests waits for its own token.
+        assert get_course_skills_mock.call_count == 11
+        assert sorted(round(call.args[0], 1) for call in time_sleep_mock.call_args_list) == [
+            0.2, 0.4, 0.6, 0.8, 1.0, 1.2, 1.4, 1.6, 1.8, 2.0
+        ]
 
     def test_refresh_program_skills_skipped(self):
         """
@@ -916,7 +1410,8 @@ class TestUtils(TaxonomyTestCase):
 
     @mock.patch('taxonomy.utils.translate_text')
     @mock.patch('taxonomy.utils.EMSISkillsApiClient.get_product_skills')
-    @mock.patch('time.sleep', return_value=None)
+    @mock.patch('taxonomy.emsi.rate_limiter.monotonic', mock.Mock(return_value=0))
+    @mock.patch('taxonomy.emsi.rate_limiter.sleep', return_value=None)
     def test_refresh_program_skills_rate_limit_emsi_api_calls(
             self,
             time_sleep_mock,
@@ -936,8 +1431,219 @@ class TestUtils(TaxonomyTestCase):
 
         utils.refresh_product_skills(programs, False, ProductTypes.Program)
 
-        # it should be called after every 5 requests made to EMSI
-        assert time_sleep_mock.call_count == 2
+        # first request is sent right away, each of the remaining requests waits for its own token.
+        assert time_sleep_mock.call_count == 10
+
+    @mock.patch('taxonomy.utils.EMSISkillsApiClient.get_product_skills')
+    @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
+    def test_refresh_course_skills_processed_in_order(self, get_translated_description_mock, get_course_skills_mock):
+        """
+        Validate that `refresh_product_skills` processes extraction results in the order of the products.
+        """
+        get_translated_description_mock.return_value = 'translated description'
+        get_course_skills_mock.side_effect = TaxonomyAPIError
+        courses = [mock_as_dict(MockCourse()) for _ in range(12)]
+
+        with override_settings(EMSI_API_RATE_LIMIT_PER_SEC=1000, EMSI_API_MAX_WORKERS=3):
+            with LogCapture(level=logging.ERROR) as log_capture:
+                utils.refresh_product_skills(courses, False, ProductTypes.Course)
+
+        assert [record.msg for record in log_capture.records] == [
+            f'[TAXONOMY] API Error for key: {course.key}' for course in courses
+        ]
+
+    @mock.patch('taxonomy.utils.EMSISkillsApiClient.get_product_skills')
+    @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
+    def test_refresh_course_skills_extractions_awaited_outside_transaction(
+            self, get_translated_description_mock, get_course_skills_mock
+    ):
+        """
+        Validate that `refresh_product_skills` waits for the extractions of a chunk before opening its transaction.
+        """
+        get_translated_description_mock.side_effect = lambda key, *args: f'translated description of {key}'
+        courses = [mock_as_dict(MockCourse()) for _ in range(4)]
+        # The test itself runs in a transaction, only the blocks opened by the refresh are counted.
+        open_transactions = []
+        open_transactions_on_extraction = []
+        atomic = transaction.atomic
+
+        @contextmanager
+        def counted_atomic(*args, **kwargs):
+            with atomic(*args, **kwargs):
+                open_transactions.append(None)
+                try:
+                    yield
+                finally:
+                    open_transactions.pop()
+
+        def get_product_skills(*args, **kwargs):
+            # Leave time for the calling thread to open its transaction if it does not wait for the extractions.
+            sleep(0.05)
+            open_transactions_on_extraction.append(len(open_transactions))
+            return parse_extracted_skills(SKILLS_EMSI_CLIENT_RESPONSE)
+
+        get_course_skills_mock.side_effect = get_product_skills
+        with mock.patch('taxonomy.utils.transaction.atomic', side_effect=counted_atomic):
+            with override_settings(TAXONOMY_REFRESH_PRODUCT_SKILLS_CHUNK_SIZE=2):
+                utils.refresh_product_skills(courses, True, ProductTypes.Course)
+
+        assert open_transactions_on_extraction == [0, 0, 0, 0]
+        assert CourseSkills.objects.filter(course_key__in=[course.key for course in courses]).exists()
+
+    @responses.activate
+    @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
+    def test_refresh_course_skills_shared_client_connects_once(self, get_translated_description_mock):
+        """
+        Validate that the workers of `refresh_product_skills` sharing the EMSI client connect it only once.
+        """
+        get_translated_description_mock.side_effect = lambda key, *args: f'translated description of {key}'
+        self.mock_access_token()
+        responses.add(
+            method=responses.POST, url=EMSISkillsApiClient.API_BASE_URL + '/extract', json=SKILLS_EMSI_RESPONSE
+        )
+        courses = [mock_as_dict(MockCourse()) for _ in range(8)]
+        connect = EMSISkillsApiClient.connect
+
+        def slow_connect(client):
+            # Leave time for the other workers to find the token expired too.
+            sleep(0.05)
+            connect(client)
+
+        with mock.patch.object(EMSISkillsApiClient, 'connect', autospec=True, side_effect=slow_connect) as connect_mock:
+            with override_settings(EMSI_API_RATE_LIMIT_PER_SEC=1000, EMSI_API_MAX_WORKERS=4):
+                utils.refresh_product_skills(courses, False, ProductTypes.Course, force=True)
+
+        assert connect_mock.call_count == 1
+        assert len([call for call in responses.calls if call.request.url.endswith('/extract')]) == 8
+
+    @mock.patch('taxonomy.utils.process_skills_data')
+    @mock.patch('taxonomy.utils.EMSISkillsApiClient.get_product_skills')
+    @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
+    def test_refresh_course_skills_run_checkpointed(
+            self, get_translated_description_mock, get_course_skills_mock, process_skills_data_mock
+    ):
+        """
+        Validate that `refresh_product_skills` checkpoints the cursor of the run as products are processed.
+        """
+        get_translated_description_mock.side_effect = lambda key, *args: f'translated description of {key}'
+        get_course_skills_mock.return_value = SKILLS_EMSI_CLIENT_RESPONSE
+        process_skills_data_mock.side_effect = [[], [], KeyboardInterrupt]
+        courses = [mock_as_dict(MockCourse()) for _ in range(4)]
+        refresh_run = utils.get_product_skills_refresh_run(ProductTypes.Course)
+
+        with override_settings(EMSI_API_MAX_WORKERS=1, TAXONOMY_REFRESH_PRODUCT_SKILLS_CHUNK_SIZE=2):
+            with self.assertRaises(KeyboardInterrupt):
+                utils.refresh_product_skills(courses, True, ProductTypes.Course, refresh_run=refresh_run)
+
+        refresh_run.refresh_from_db()
+        assert refresh_run.cursor == 2
+        assert refresh_run.success_count == 2
+        # Writes of the interrupted chunk are rolled back.
+        assert models.ProductContentHash.objects.count() == 2
+        assert not refresh_run.is_completed
+        assert utils.get_product_skills_refresh_run(ProductTypes.Course, resume=True) == refresh_run
+        assert utils.get_product_skills_refresh_run(ProductTypes.Course) != refresh_run
+
+    @mock.patch('taxonomy.utils.EMSISkillsApiClient.get_product_skills')
+    @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
+    def test_refresh_course_skills_failures_bounded(self, get_translated_description_mock, get_course_skills_mock):
+        """
+        Validate that `refresh_product_skills` keeps and records a bounded number of failures.
+        """
+        get_translated_description_mock.side_effect = lambda key, *args: f'translated description of {key}'
+        get_course_skills_mock.side_effect = TaxonomyAPIError
+        courses = [mock_as_dict(MockCourse()) for _ in range(5)]
+        refresh_run = utils.get_product_skills_refresh_run(ProductTypes.Course)
+
+        with override_settings(
+                TAXONOMY_REFRESH_PRODUCT_SKILLS_CHUNK_SIZE=2, TAXONOMY_REFRESH_PRODUCT_SKILLS_MAX_FAILURES=3
+        ):
+            with LogCapture(level=logging.INFO) as log_capture:
+                utils.refresh_product_skills(courses, True, ProductTypes.Course, refresh_run=refresh_run)
+
+        summary_record = log_capture.records[-1]
+        assert len(summary_record.args[1]) == 3
+        assert summary_record.args[-1] == 5
+        refresh_run.refresh_from_db()
+        assert refresh_run.failure_count == 5
+        assert refresh_run.is_completed
+        assert list(refresh_run.failures.values_list('product_identifier', flat=True)) == [
+            str(course.uuid) for course in courses[:3]
+        ]
+
+    def test_refresh_course_skills_earlier_runs_pruned(self):
+        """
+        Validate that `refresh_product_skills` deletes the earlier runs of the shard once its run completes.
+        """
+        completed_run = factories.ProductSkillsRefreshRunFactory(is_completed=True)
+        factories.ProductSkillsRefreshFailureFactory(refresh_run=completed_run)
+        incomplete_run = factories.ProductSkillsRefreshRunFactory()
+        other_shard_run = factories.ProductSkillsRefreshRunFactory(shard_index=1, shard_count=2)
+        program_run = factories.ProductSkillsRefreshRunFactory(product_type=ProductTypes.Program)
+        refresh_run = utils.get_product_skills_refresh_run(ProductTypes.Course, resume=True)
+        assert refresh_run == incomplete_run
+
+        utils.refresh_product_skills([], True, ProductTypes.Course, refresh_run=refresh_run)
+
+        assert set(models.ProductSkillsRefreshRun.objects.all()) == {refresh_run, other_shard_run, program_run}
+        assert not models.ProductSkillsRefreshFailure.objects.exists()
+
+    @responses.activate
+    @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
+    def test_refresh_course_skills_ends_when_circuit_opens(self, get_translated_description_mock):
+        """
+        Validate that `refresh_product_skills` queues the remaining products of the chunk and ends the run early
+        once the circuit of the EMSI skills extraction endpoint opens.
+        """
+        get_translated_description_mock.side_effect = lambda key, *args: f'translated description of {key}'
+        self.mock_access_token()
+        responses.add(method=responses.POST, url=EMSISkillsApiClient.API_BASE_URL + '/extract', status=503)
+        courses = [mock_as_dict(MockCourse()) for _ in range(6)]
+        refresh_run = utils.get_product_skills_refresh_run(ProductTypes.Course)
+        transport.get_http_adapter.cache_clear()
+        self.addCleanup(transport.get_http_adapter.cache_clear)
+
+        with override_settings(
+                EMSI_API_CIRCUIT_BREAKER_FAILURE_THRESHOLD=2, TAXONOMY_REFRESH_PRODUCT_SKILLS_CHUNK_SIZE=3,
+                EMSI_API_MAX_WORKERS=1, EMSI_API_MAX_RETRIES=0,
+        ):
+            with LogCapture(level=logging.WARNING) as log_capture:
+                utils.refresh_product_skills(courses, True, ProductTypes.Course, refresh_run=refresh_run)
+
+        extract_calls = [call for call in responses.calls if call.request.url.endswith('/extract')]
+        assert len(extract_calls) == 2
+        assert utils.get_product_skills_retries(ProductTypes.Course) == [str(courses[2].uuid)]
+        refresh_run.refresh_from_db()
+        assert (refresh_run.cursor, refresh_run.failure_count, refresh_run.is_completed) == (3, 2, False)
+        assert log_capture.records[-1].msg == (
+            '[TAXONOMY] Refresh %s skills process ended early because EMSI is failing. Queued for retry: %s'
+        )
+
+    @mock.patch('taxonomy.utils.translate_text')
+    @mock.patch('taxonomy.utils.EMSISkillsApiClient.get_product_skills')
+    @mock.patch('taxonomy.utils.get_translated_skill_attribute_val')
+    def test_refresh_course_skills_queued_products_not_translated(
+            self, get_translated_description_mock, get_course_skills_mock, translate_text_mock
+    ):
+        """
+        Validate that `refresh_product_skills` does not translate the products queued for retry once the circuit of
+        the EMSI skills extraction endpoint opens.
+        """
+        get_translated_description_mock.side_effect = lambda key, *args: f'translated description of {key}'
+        get_course_skills_mock.return_value = parse_extracted_skills(SKILLS_EMSI_CLIENT_RESPONSE)
+        courses = [mock_as_dict(MockCourse()) for _ in range(4)]
+
+        with mock.patch(
+                'taxonomy.emsi.circuit_breaker.CircuitBreaker.is_open', new_callable=mock.PropertyMock
+        ) as is_open_mock:
+            # The circuit opens once the first course is submitted.
+            is_open_mock.side_effect = [False] + [True] * 10
+            utils.refresh_product_skills(courses, True, ProductTypes.Course)
+
+        assert [call.args[0] for call in get_translated_description_mock.call_args_list] == [courses[0].key]
+        assert get_course_skills_mock.call_count == 1
+        assert utils.get_product_skills_retries(ProductTypes.Course) == [str(course.uuid) for course in courses[1:]]
+        translate_text_mock.assert_not_called()
 
     def test_get_whitelisted_serialized_skills_with_category_details(self):
         """